@@ -0,0 +1,116 @@
+# BackEnd/src/api/execucao.py
+"""
+Execução de jobs pesados fora do event loop + controle de admissão.
+
+- I/O bloqueante (leitura de CSV) vai para o threadpool do Starlette.
+- Detecção (CPU) vai para um pool de processos com MAX_JOBS_PESADOS workers.
+- No máximo MAX_JOBS_PESADOS jobs rodam ao mesmo tempo e MAX_FILA_JOBS esperam;
+  acima disso a API responde 429 com Retry-After na hora, sem enfileirar.
+"""
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Callable, Dict, Optional, Tuple
+
+from fastapi import HTTPException
+from starlette.concurrency import run_in_threadpool
+
+from ..core.config import MAX_FILA_JOBS, MAX_JOBS_PESADOS, RETRY_AFTER_S
+from ..utils.rastreio import executar_perfilado, iniciar_rastreio, profilador, rastreio_atual
+
+
+class ControleAdmissao:
+    def __init__(self, max_concorrentes: int, max_fila: int, retry_after: int):
+        self.max_concorrentes = max_concorrentes
+        self.max_fila = max_fila
+        self.retry_after = retry_after
+        self._semaforo = asyncio.Semaphore(max_concorrentes)
+        self._aguardando = 0
+
+    @property
+    def aguardando(self) -> int:
+        return self._aguardando
+
+    @asynccontextmanager
+    async def vaga(self) -> AsyncIterator[None]:
+        if self._semaforo.locked() and self._aguardando >= self.max_fila:
+            raise HTTPException(
+                status_code=429,
+                detail="Servidor ocupado com outros lotes; tente novamente mais tarde",
+                headers={"Retry-After": str(self.retry_after)},
+            )
+
+        self._aguardando += 1
+        try:
+            await self._semaforo.acquire()
+        finally:
+            self._aguardando -= 1
+
+        try:
+            yield
+        finally:
+            self._semaforo.release()
+
+
+admissao = ControleAdmissao(MAX_JOBS_PESADOS, MAX_FILA_JOBS, RETRY_AFTER_S)
+
+_pool_deteccao: Optional[ProcessPoolExecutor] = None
+
+
+def _pool() -> ProcessPoolExecutor:
+    global _pool_deteccao
+    if _pool_deteccao is None:
+        # spawn: fork dentro do uvicorn (multithread) copiaria locks presos por
+        # outras threads e o filho poderia travar
+        _pool_deteccao = ProcessPoolExecutor(
+            max_workers=MAX_JOBS_PESADOS, mp_context=multiprocessing.get_context("spawn")
+        )
+    return _pool_deteccao
+
+
+def encerrar_executores() -> None:
+    global _pool_deteccao
+    if _pool_deteccao is not None:
+        # wait=True: com wait=False o pool ainda fecha os pipes dos workers depois
+        # que o interpretador começou a finalizar ("Bad file descriptor" na saída)
+        _pool_deteccao.shutdown(wait=True, cancel_futures=True)
+        _pool_deteccao = None
+
+
+def _executar_rastreado(fn: Callable[..., Any], args: Tuple[Any, ...], perfilar: bool) -> Tuple[Any, Dict[str, float], Any]:
+    """Roda no processo filho: devolve o resultado, as etapas e (opcional) o perfil."""
+    rastreio = iniciar_rastreio()
+    stats = None
+    if perfilar:
+        resultado, stats = executar_perfilado(fn, *args)
+    else:
+        resultado = fn(*args)
+    return resultado, rastreio.etapas, stats
+
+
+async def em_thread(fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """I/O bloqueante (ex.: pd.read_csv) no threadpool (o rastreio segue via contexto)."""
+    rastreio = rastreio_atual()
+    if rastreio is not None and rastreio.perfilar:
+        resultado, stats = await run_in_threadpool(executar_perfilado, fn, *args, **kwargs)
+        profilador.adicionar(stats)
+        return resultado
+    return await run_in_threadpool(fn, *args, **kwargs)
+
+
+async def em_processo(fn: Callable[..., Any], *args: Any) -> Any:
+    """Trabalho de CPU no pool de processos (fn e args precisam ser picklable)."""
+    rastreio = rastreio_atual()
+    perfilar = rastreio is not None and rastreio.perfilar
+
+    loop = asyncio.get_running_loop()
+    resultado, etapas, stats = await loop.run_in_executor(_pool(), _executar_rastreado, fn, args, perfilar)
+
+    if rastreio is not None:
+        rastreio.mesclar(etapas)
+    if stats is not None:
+        profilador.adicionar(stats)
+    return resultado
@@ -0,0 +1,88 @@
+# BackEnd/src/api/observabilidade.py
+"""
+Rastreio por requisição (header Server-Timing + log de requisições lentas)
+e rotas de administração do profiler.
+"""
+from __future__ import annotations
+
+import logging
+import pstats
+import secrets
+import time
+from enum import Enum
+from typing import AsyncIterator, Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request
+
+from ..core.config import ADMIN_TOKEN, LIMIAR_REQUISICAO_LENTA_MS
+from ..utils.rastreio import Rastreio, iniciar_rastreio, profilador
+
+logger = logging.getLogger(__name__)
+
+# rotas que não entram na amostragem do profiler
+ROTAS_SEM_PERFIL = ("/health", "/admin")
+
+
+# valores aceitos por pstats.Stats.sort_stats (outro valor vira 422, não KeyError)
+OrdenacaoPerfil = Enum("OrdenacaoPerfil", {k.name.lower(): k.value for k in pstats.SortKey}, type=str)
+
+
+def _registrar_se_lenta(request: Request, total: float, rastreio: Rastreio) -> None:
+    if total * 1000 >= LIMIAR_REQUISICAO_LENTA_MS:
+        logger.warning(
+            "Requisição lenta %s %s: %.1f ms; etapas (ms)=%s",
+            request.method, request.url.path, total * 1000, rastreio.em_ms(),
+        )
+
+
+async def _medir_fluxo(
+    corpo: AsyncIterator[bytes], request: Request, inicio: float, rastreio: Rastreio
+) -> AsyncIterator[bytes]:
+    try:
+        async for parte in corpo:
+            yield parte
+    finally:
+        _registrar_se_lenta(request, time.perf_counter() - inicio, rastreio)
+
+
+async def middleware_rastreio(request: Request, call_next):
+    perfilar = not request.url.path.startswith(ROTAS_SEM_PERFIL) and profilador.reservar()
+    rastreio = iniciar_rastreio(perfilar=perfilar)
+
+    inicio = time.perf_counter()
+    response = await call_next(request)
+
+    # corpo em fluxo (sem Content-Length, ex.: /export/csv): os headers saem antes
+    # do trabalho, então não há Server-Timing; o log de lentas mede até o fim do corpo
+    if "content-length" not in response.headers:
+        response.body_iterator = _medir_fluxo(response.body_iterator, request, inicio, rastreio)
+        return response
+
+    total = time.perf_counter() - inicio
+    response.headers["Server-Timing"] = rastreio.server_timing(total)
+    _registrar_se_lenta(request, total, rastreio)
+    return response
+
+
+def _exigir_admin(x_admin_token: Optional[str] = Header(None)) -> None:
+    if not ADMIN_TOKEN:
+        raise HTTPException(status_code=404, detail="Not Found")
+    if not x_admin_token or not secrets.compare_digest(x_admin_token, ADMIN_TOKEN):
+        raise HTTPException(status_code=403, detail="Token de administração inválido")
+
+
+admin_router = APIRouter(prefix="/admin", dependencies=[Depends(_exigir_admin)])
+
+
+@admin_router.post("/profiler")
+def ativar_profiler(requisicoes: int = Query(10, ge=1, le=1_000)):
+    profilador.ativar(requisicoes)
+    return {"status": "ativo", "requisicoes": requisicoes}
+
+
+@admin_router.get("/profiler")
+def relatorio_profiler(
+    ordenar_por: OrdenacaoPerfil = Query(OrdenacaoPerfil.cumulative),
+    limite: int = Query(50, ge=1, le=500),
+):
+    return profilador.relatorio(ordenar_por=ordenar_por.value, limite=limite)
@@ -1,30 +1,203 @@
 
+import json
+import os
+import shutil
+import tempfile
+import zlib
+from contextlib import AsyncExitStack
+from typing import IO, Any, Callable, Iterator, List, Optional, Tuple
+
 import pandas as pd
-from fastapi import APIRouter, UploadFile, File
-from ..core.detector import analisar_texto
-from ..core.config import TEXT_COLUMN_CANDIDATES
+from fastapi import APIRouter, File, HTTPException, UploadFile
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import Response, StreamingResponse
+from ..core.detector import analisar_texto, analisar_lote, anonimizar_lote, resumir_lote
+from ..core.documento_longo import analisar_documento_longo
+from ..core.config import (
+    TEXT_COLUMN_CANDIDATES,
+    MAX_TEXT_LENGTH,
+    LINHAS_POR_BLOCO_EXPORTACAO,
+    LINHAS_POR_BLOCO_RESUMO,
+)
+from ..core.resumo import ResumoLote
+from .execucao import admissao, em_processo, em_thread
+from ..utils.rastreio import etapa
 from .schemas import TextoRequest
 
 
 router = APIRouter()
 
+COLUNAS_EXPORTACAO = ("status", "score")  # acrescentadas ao CSV exportado
+
+
+def _json(conteudo: Any) -> bytes:
+    """Mesmo corpo do JSONResponse; roda no threadpool ou no processo do job, nunca no event loop."""
+    # etapa explícita para aparecer no Server-Timing
+    with etapa("resposta"):
+        return json.dumps(
+            jsonable_encoder(conteudo), ensure_ascii=False, allow_nan=False, separators=(",", ":")
+        ).encode("utf-8")
+
+
+def _em_json(fn: Callable[..., Any], *args: Any) -> bytes:
+    """Executa `fn` e devolve o resultado já serializado (o processo filho não devolve dicts grandes)."""
+    return _json(fn(*args))
+
+
+def _validar_lote_json(textos: List[str]) -> bytes:
+    resultados, resumo = analisar_lote(textos)
+    return _json({**resumo, "resultados": resultados})
+
+
+def _corpo_json(corpo: bytes) -> Response:
+    return Response(corpo, media_type="application/json")
+
+
+async def _responder(conteudo: Any) -> Response:
+    return _corpo_json(await em_thread(_json, conteudo))
+
 
 @router.post("/validate/text")
-def validar_texto(payload: TextoRequest): 
-    return analisar_texto(payload.texto)
+async def validar_texto(payload: TextoRequest): 
+    if len(payload.texto) > MAX_TEXT_LENGTH:
+        async with admissao.vaga():
+            return _corpo_json(await em_processo(_em_json, analisar_documento_longo, payload.texto))
+    return _corpo_json(await em_thread(_em_json, analisar_texto, payload.texto))
 
 
 @router.post("/validate/csv")
 async def validar_csv(file: UploadFile = File(...)):
-    df = pd.read_csv(file.file)
+    async with admissao.vaga():
+        return await _validar_csv(file)
 
-    coluna = next(
-        (c for c in df.columns if c.lower() in TEXT_COLUMN_CANDIDATES),
+
+def _coluna_texto(colunas) -> Optional[str]:
+    return next(
+        (c for c in colunas if c.lower() in TEXT_COLUMN_CANDIDATES),
         None
     )
 
+
+async def _validar_csv(file: UploadFile):
+    df = await em_thread(pd.read_csv, file.file)
+
+    coluna = _coluna_texto(df.columns)
+
     if not coluna:
-        return {"erro": "Nenhuma coluna de texto encontrada"}
+        return await _responder({"erro": "Nenhuma coluna de texto encontrada"})
+
+    return _corpo_json(await em_processo(_validar_lote_json, [str(x) for x in df[coluna]]))
+
+
+@router.post("/validate/csv/resumo")
+async def validar_csv_resumo(file: UploadFile = File(...), top_motivos: int = 10):
+    """Só os agregados do lote (ver core/resumo.py), sem resultados por linha."""
+    async with admissao.vaga():
+        return await _responder(await _resumir_csv(file, top_motivos))
+
+
+async def _resumir_csv(file: UploadFile, top_motivos: int):
+    # o CSV é lido e analisado em blocos; cada bloco devolve um resumo parcial
+    blocos = await em_thread(pd.read_csv, file.file, chunksize=LINHAS_POR_BLOCO_RESUMO)
+    resumo = ResumoLote()
+    coluna = None
+
+    while (bloco := await em_thread(next, blocos, None)) is not None:
+        if coluna is None:
+            coluna = _coluna_texto(bloco.columns)
+            if not coluna:
+                return {"erro": "Nenhuma coluna de texto encontrada"}
+        resumo.mesclar(await em_processo(resumir_lote, [str(x) for x in bloco[coluna]]))
+
+    return resumo.para_dict(top_motivos)
+
+
+@router.post("/export/csv")
+async def exportar_csv(file: UploadFile = File(...), gzip: bool = False):
+    """
+    Devolve o próprio CSV com a coluna de texto trocada por `texto_anonimizado`
+    e as colunas `status` e `score` no final, em streaming (gzip opcional).
+    400 se o CSV estiver vazio, não tiver coluna de texto ou já tiver `status`/`score`.
+    """
+    # a vaga é reservada aqui (429 antes de começar a resposta) e liberada pelo
+    # gerador, junto com a cópia do upload
+    vaga = AsyncExitStack()
+    await vaga.enter_async_context(admissao.vaga())
+    try:
+        # o upload é fechado quando o handler retorna, antes de o corpo ser enviado
+        entrada = vaga.enter_context(await em_thread(_copiar_upload, file.file))
+        blocos = await em_thread(
+            pd.read_csv, entrada, chunksize=LINHAS_POR_BLOCO_EXPORTACAO, dtype=str, keep_default_na=False
+        )
+        bloco = await em_thread(next, blocos, None)
+        _validar_colunas_exportacao(bloco)
+    except pd.errors.EmptyDataError:
+        await vaga.aclose()
+        raise HTTPException(status_code=400, detail="CSV vazio")
+    except BaseException:
+        await vaga.aclose()
+        raise
+
+    coluna = _coluna_texto(bloco.columns)
+
+    nome = os.path.splitext(os.path.basename(file.filename or "dados"))[0] + "_anonimizado.csv"
+    if gzip:
+        nome += ".gz"
+    return StreamingResponse(
+        _gerar_csv_anonimizado(vaga, blocos, bloco, coluna, gzip),
+        media_type="application/gzip" if gzip else "text/csv",
+        headers={"Content-Disposition": f'attachment; filename="{nome}"'},
+    )
+
+
+def _validar_colunas_exportacao(bloco: Optional[pd.DataFrame]) -> None:
+    if bloco is None or not _coluna_texto(bloco.columns):
+        raise HTTPException(status_code=400, detail="Nenhuma coluna de texto encontrada")
+    repetidas = [c for c in COLUNAS_EXPORTACAO if c in bloco.columns]
+    if repetidas:
+        raise HTTPException(
+            status_code=400,
+            detail=f"O CSV já tem as colunas {', '.join(repetidas)}; renomeie-as antes de exportar",
+        )
+
+
+def _copiar_upload(origem: IO[bytes]) -> IO[bytes]:
+    destino = tempfile.TemporaryFile()
+    shutil.copyfileobj(origem, destino)
+    destino.seek(0)
+    return destino
+
+
+def _serializar_bloco(
+    bloco: pd.DataFrame,
+    coluna: str,
+    anonimizados: List[Tuple[str, str, int]],
+    cabecalho: bool,
+    compressor,
+) -> bytes:
+    bloco[coluna] = [texto for texto, _, _ in anonimizados]
+    bloco["status"] = [status for _, status, _ in anonimizados]
+    bloco["score"] = [score for _, _, score in anonimizados]
+    dados = bloco.to_csv(index=False, header=cabecalho).encode("utf-8")
+    return compressor.compress(dados) if compressor is not None else dados
+
 
-    resultados = df[coluna].apply(lambda x: analisar_texto(str(x))).tolist()
-    return {"total": len(resultados), "resultados": resultados}
+async def _gerar_csv_anonimizado(
+    vaga: AsyncExitStack,
+    blocos: Iterator[pd.DataFrame],
+    bloco: Optional[pd.DataFrame],
+    coluna: str,
+    comprimir: bool,
+):
+    compressor = zlib.compressobj(wbits=31) if comprimir else None  # wbits=31: formato gzip
+    cabecalho = True
+    try:
+        while bloco is not None:
+            anonimizados = await em_processo(anonimizar_lote, bloco[coluna].tolist())
+            yield await em_thread(_serializar_bloco, bloco, coluna, anonimizados, cabecalho, compressor)
+            cabecalho = False
+            bloco = await em_thread(next, blocos, None)
+        if compressor is not None:
+            yield compressor.flush()
+    finally:
+        await vaga.aclose()
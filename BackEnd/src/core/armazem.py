@@ -0,0 +1,288 @@
+# BackEnd/src/core/armazem.py
+"""
+Armazém persistente (SQLite) de análises para reprocessamento incremental.
+
+A chave de cada texto é o hash de `normalizar_raw`. Para cada (texto, regra)
+guardamos os matches aceitos, o número de candidatos do regex e duas
+impressões digitais da regra:
+- `fp`: regra completa (regex, pesos, validador, palavras-chave, código);
+- `fp_padrao`: só o regex.
+
+Ao reprocessar, uma regra é reaproveitada se o `fp` não mudou, ou se só mudou
+validador/contexto e o regex não teve candidatos naquele texto (ex.: mudar as
+palavras de endereço do `cep` só reavalia textos com candidatos a CEP). Regras
+alteradas são varridas de novo apenas nos textos afetados.
+
+Overlaps, score, anonimização e decisão (`PoliticaRisco`) são sempre
+remontados a partir dos matches: é barato e deixa a política fora da chave.
+
+Atenção: o armazém guarda spans e valores normalizados dos dados detectados;
+use em armazenamento protegido, como o próprio acervo de origem.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+import sqlite3
+import time
+import types
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from .config import DEFAULT_POLITICA, PoliticaRisco, TEMPO_MAX_VARREDURA_MS
+from .detector import (
+    REGRAS,
+    MatchInfo,
+    Regra,
+    _avaliar_match,
+    _montar_resultado,
+    _varrer_regra,
+    analisar_texto,
+    normalizar_busca,
+    normalizar_raw,
+)
+from .indice_identificadores import indice_identificadores
+
+_RAIZ_PACOTE = __name__.split(".")[0]
+
+
+# =========================
+# Impressões digitais
+# =========================
+
+def _fp_valor(valor: Any, vistos: Set[int]) -> str:
+    if isinstance(valor, (types.FunctionType, types.MethodType)):
+        return _fp_funcao(getattr(valor, "__func__", valor), vistos)
+    if isinstance(valor, type):
+        if valor.__module__.split(".")[0] != _RAIZ_PACOTE:
+            return f"type:{valor.__module__}.{valor.__qualname__}"
+        partes = [
+            _fp_valor(v, vistos) for k, v in sorted(vars(valor).items()) if isinstance(v, types.FunctionType)
+        ]
+        return f"class:{valor.__qualname__}:" + "|".join(partes)
+    if isinstance(valor, re.Pattern):
+        return f"re:{valor.pattern!r}:{valor.flags}"
+    if hasattr(valor, "finditer") and hasattr(valor, "padrao"):  # ex.: _PadraoEmail
+        return _fp_valor(type(valor), vistos) + _fp_valor(valor.padrao, vistos)
+    if isinstance(valor, (set, frozenset)):
+        return repr(sorted(valor, key=repr))
+    if isinstance(valor, types.ModuleType):
+        return f"mod:{valor.__name__}"
+    return repr(valor)
+
+
+def _fp_codigo(code: types.CodeType, fn_globals: Dict[str, Any], vistos: Set[int]) -> str:
+    partes = [code.co_code.hex(), repr(code.co_names)]
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            partes.append(_fp_codigo(const, fn_globals, vistos))
+        else:
+            partes.append(_fp_valor(const, vistos))
+    # valores globais referenciados (listas de palavras-chave, helpers, padrões)
+    for nome in code.co_names:
+        if nome in fn_globals:
+            partes.append(f"{nome}={_fp_valor(fn_globals[nome], vistos)}")
+    return "|".join(partes)
+
+
+def _fp_funcao(fn: types.FunctionType, vistos: Set[int]) -> str:
+    if fn.__module__.split(".")[0] != _RAIZ_PACOTE:
+        return f"fn:{fn.__module__}.{fn.__qualname__}"
+    if id(fn) in vistos:
+        return f"fn:{fn.__qualname__}"
+    vistos.add(id(fn))
+
+    partes = [fn.__qualname__, _fp_codigo(fn.__code__, fn.__globals__, vistos)]
+    for celula in fn.__closure__ or ():
+        partes.append(_fp_valor(celula.cell_contents, vistos))
+    return "|".join(partes)
+
+
+def _hash(*partes: str) -> str:
+    return hashlib.sha256("\x1f".join(partes).encode("utf-8")).hexdigest()
+
+
+def fingerprint_regra(regra: Regra) -> Tuple[str, str]:
+    """(fp da regra completa, fp só do regex)."""
+    fp_padrao = _hash(_fp_valor(regra.padrao, set()))
+    campos = repr((
+        regra.nome, regra.tipo, regra.peso, regra.prioridade, regra.peso_min_sem_contexto,
+        regra.boost_contexto, regra.min_len, regra.exige_contexto, regra.indice,
+    ))
+    # o conteúdo do índice de identificadores muda o resultado das regras que o consultam
+    indice = indice_identificadores() if regra.indice is not None else None
+    fp = _hash(
+        fp_padrao,
+        campos,
+        _fp_valor(regra.validator, set()),
+        _fp_funcao(_avaliar_match, set()),
+        _fp_funcao(_varrer_regra, set()),
+        _fp_funcao(normalizar_busca, set()),
+        indice.assinatura if indice is not None else "",
+    )
+    return fp, fp_padrao
+
+
+def hash_texto(raw_text: str) -> bytes:
+    return hashlib.blake2b(raw_text.encode("utf-8"), digest_size=16).digest()
+
+
+# =========================
+# Armazém
+# =========================
+
+_ESQUEMA = """
+CREATE TABLE IF NOT EXISTS regras_texto (
+    texto       BLOB NOT NULL,
+    regra       TEXT NOT NULL,
+    fp          TEXT NOT NULL,
+    fp_padrao   TEXT NOT NULL,
+    candidatos  INTEGER NOT NULL,
+    matches     TEXT NOT NULL,
+    PRIMARY KEY (texto, regra)
+) WITHOUT ROWID;
+"""
+
+
+def _codificar(matches: List[MatchInfo]) -> str:
+    return json.dumps([[x.start, x.end, x.norm, x.motivo, x.peso_aplicado] for x in matches], ensure_ascii=False)
+
+
+def _decodificar(regra: Regra, dados: str, raw_text: str) -> List[MatchInfo]:
+    return [
+        MatchInfo(
+            regra=regra.nome,
+            prioridade=regra.prioridade,
+            start=start,
+            end=end,
+            raw=raw_text[start:end],
+            norm=norm,
+            ok=True,
+            motivo=motivo,
+            peso_aplicado=peso,
+        )
+        for start, end, norm, motivo, peso in json.loads(dados)
+    ]
+
+
+class ArmazemAnalises:
+    """
+    Uso:
+        with ArmazemAnalises("analises.sqlite") as armazem:
+            resultados = analisar_dataframe(df, "Texto Mascarado", armazem=armazem)
+
+    Pode ser enviado a outro processo (pickle leva só o caminho).
+    """
+
+    LOTE_COMMIT = 500
+
+    def __init__(self, caminho: str):
+        self.caminho = caminho
+        self._conn: Optional[sqlite3.Connection] = None
+        self._fps = {r.nome: fingerprint_regra(r) for r in REGRAS}
+        self._pendentes = 0
+        self.estatisticas = {
+            "textos": 0,
+            "textos_sem_varredura": 0,
+            "regras_reaproveitadas": 0,
+            "regras_varridas": 0,
+        }
+
+    def __getstate__(self) -> Dict[str, Any]:
+        return {"caminho": self.caminho}
+
+    def __setstate__(self, estado: Dict[str, Any]) -> None:
+        self.__init__(estado["caminho"])
+
+    def __enter__(self) -> "ArmazemAnalises":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.fechar()
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.caminho, timeout=30)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(_ESQUEMA)
+        return self._conn
+
+    def salvar(self) -> None:
+        if self._conn is not None:
+            self._conn.commit()
+        self._pendentes = 0
+
+    def fechar(self) -> None:
+        if self._conn is not None:
+            self.salvar()
+            self._conn.close()
+            self._conn = None
+
+    def analisar(
+        self,
+        texto: Any,
+        politica: PoliticaRisco = DEFAULT_POLITICA,
+        tempo_max_ms: Optional[float] = TEMPO_MAX_VARREDURA_MS,
+    ) -> Dict[str, Any]:
+        """Mesmo resultado de `analisar_texto`, reaproveitando regras já avaliadas."""
+        raw_text = normalizar_raw(texto)
+        if not raw_text:
+            return analisar_texto(raw_text, politica=politica)
+
+        chave = hash_texto(raw_text)
+        salvos = {
+            regra: (fp, fp_padrao, candidatos, matches)
+            for regra, fp, fp_padrao, candidatos, matches in self.conn.execute(
+                "SELECT regra, fp, fp_padrao, candidatos, matches FROM regras_texto WHERE texto = ?",
+                (chave,),
+            )
+        }
+
+        prazo = time.perf_counter() + tempo_max_ms / 1000 if tempo_max_ms is not None else None
+        search_text: Optional[str] = None
+        encontrados: List[MatchInfo] = []
+        degradadas: List[str] = []
+        gravar: List[Tuple[Any, ...]] = []
+        varridas = 0
+        reaproveitadas = 0
+
+        for regra in REGRAS:
+            fp, fp_padrao = self._fps[regra.nome]
+            salvo = salvos.get(regra.nome)
+
+            if salvo is not None and (salvo[0] == fp or (salvo[1] == fp_padrao and salvo[2] == 0)):
+                encontrados.extend(_decodificar(regra, salvo[3], raw_text))
+                reaproveitadas += 1
+                if salvo[0] != fp:
+                    gravar.append((chave, regra.nome, fp, fp_padrao, salvo[2], salvo[3]))
+                continue
+
+            if prazo is not None and time.perf_counter() > prazo:
+                degradadas.append(regra.nome)
+                continue
+
+            if search_text is None:
+                search_text = normalizar_busca(raw_text)
+            achados, candidatos, _, estourou = _varrer_regra(regra, raw_text, search_text, prazo)
+            encontrados.extend(achados)
+            varridas += 1
+            if estourou:
+                degradadas.append(regra.nome)  # incompleta: não grava
+            else:
+                gravar.append((chave, regra.nome, fp, fp_padrao, candidatos, _codificar(achados)))
+
+        if gravar:
+            self.conn.executemany("INSERT OR REPLACE INTO regras_texto VALUES (?, ?, ?, ?, ?, ?)", gravar)
+            self._pendentes += 1
+            if self._pendentes >= self.LOTE_COMMIT:
+                self.salvar()
+
+        self.estatisticas["textos"] += 1
+        self.estatisticas["regras_varridas"] += varridas
+        self.estatisticas["regras_reaproveitadas"] += reaproveitadas
+        if varridas == 0:
+            self.estatisticas["textos_sem_varredura"] += 1
+
+        return _montar_resultado(raw_text, encontrados, politica, degradadas, tempo_max_ms)
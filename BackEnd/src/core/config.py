@@ -1,3 +1,4 @@
+import os
 from dataclasses import dataclass
 
 TEXT_COLUMN_CANDIDATES = [
@@ -7,6 +8,38 @@ TEXT_COLUMN_CANDIDATES = [
 DEFAULT_ENCODING = "utf-8"
 MAX_TEXT_LENGTH = 20_000
 
+# Modo documento longo (textos acima de MAX_TEXT_LENGTH)
+JANELA_DOCUMENTO_LONGO = 8_000          # caracteres confirmados por janela
+MAIOR_MATCH_DOCUMENTO_LONGO = 512       # maior match esperado de uma regra
+
+# Admissão de jobs pesados (CSV, documentos longos)
+MAX_JOBS_PESADOS = int(os.getenv("SAFEDOC_MAX_JOBS_PESADOS", max(1, (os.cpu_count() or 2) - 1)))
+MAX_FILA_JOBS = int(os.getenv("SAFEDOC_MAX_FILA_JOBS", 4))
+RETRY_AFTER_S = 5
+
+# Observabilidade
+LIMIAR_REQUISICAO_LENTA_MS = float(os.getenv("SAFEDOC_LIMIAR_LENTO_MS", 2_000))
+ADMIN_TOKEN = os.getenv("SAFEDOC_ADMIN_TOKEN")  # sem token, rotas /admin ficam desligadas
+
+# Orçamento de tempo da varredura de regex por texto (por janela no modo documento longo), em ms.
+# Não é um limite rígido: o prazo é conferido entre regras e entre candidatos de uma
+# regra, então um único passo do finditer (a busca até o próximo candidato) não é
+# interrompido. Os padrões são lineares (tools/bench_regex.py) para esse passo ser curto.
+TEMPO_MAX_VARREDURA_MS = 2_000
+
+# Índice de identificadores conhecidos (públicos/pessoais); ver core/indice_identificadores.py
+ARQUIVO_INDICE_IDENTIFICADORES = os.getenv("SAFEDOC_INDICE_IDENTIFICADORES")  # sem arquivo, desligado
+
+# Varredura concatenada em lote (textos curtos compartilham um único finditer por regra)
+LOTE_CONCATENADO_MAX_TEXTO = 5_000      # textos maiores são analisados sozinhos
+LOTE_CONCATENADO_MAX_CHARS = 250_000    # tamanho aproximado de cada buffer
+
+# Modo resumo (/validate/csv/resumo): linhas lidas e analisadas por vez
+LINHAS_POR_BLOCO_RESUMO = 20_000
+
+# Exportação anonimizada (/export/csv): linhas lidas, analisadas e enviadas por vez
+LINHAS_POR_BLOCO_EXPORTACAO = 5_000
+
 @dataclass(frozen=True)
 class PoliticaRisco:
     # Scores de sensibilidade
@@ -27,5 +60,6 @@ class PoliticaRisco:
     # Regras de revisão
     revisar_se_telefone_suspeito: bool = True
     revisar_se_hard_suspeito_com_contexto: bool = True
+    revisar_se_varredura_incompleta: bool = True
 
 DEFAULT_POLITICA = PoliticaRisco()
\ No newline at end of file
@@ -1,19 +1,40 @@
 from __future__ import annotations
 
+import bisect
+import hashlib
+import logging
 import re
+import string
+import time
 import unicodedata
 import pandas as pd
+from collections import Counter
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Tuple, Callable
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Optional, Tuple, Callable
 
 # Importações da estrutura do projeto
 from ..models.validators import (
     validar_cpf,
     validar_cnpj,
     validar_telefone_br,  # pode retornar bool ou tuple; vamos adaptar
+    normalizar_telefone_br,
     apenas_digitos,
 )
-from .config import DEFAULT_POLITICA, PoliticaRisco
+from ..utils.rastreio import etapa, rastreio_atual
+from .config import (
+    DEFAULT_POLITICA,
+    LOTE_CONCATENADO_MAX_CHARS,
+    LOTE_CONCATENADO_MAX_TEXTO,
+    PoliticaRisco,
+    TEMPO_MAX_VARREDURA_MS,
+)
+from .indice_identificadores import PESSOAL, PUBLICO, indice_identificadores
+from .resumo import ResumoLote
+
+if TYPE_CHECKING:
+    from .armazem import ArmazemAnalises
+
+logger = logging.getLogger(__name__)
 
 # =========================
 # Tipos
@@ -26,7 +47,7 @@ ValidatorFn = Callable[["re.Match[str]", str, str], Tuple[bool, Optional[str], O
 @dataclass(frozen=True)
 class Regra:
     nome: str
-    padrao: re.Pattern
+    padrao: re.Pattern  # ou objeto com .finditer(texto, pos), ex.: _PadraoEmail
     tipo: str  # 'hard' ou 'soft'
     peso: int
     prioridade: int  # menor = mais prioritário no overlap
@@ -36,6 +57,10 @@ class Regra:
     boost_contexto: int = 2               # quanto soma quando tem contexto
     min_len: int = 0                      # tamanho mínimo do match (raw)
     exige_contexto: bool = False          # se True, sem contexto ignora
+    indice: Optional[str] = None          # categoria no índice de identificadores conhecidos
+    # regras sem comprimento máximo: início do candidato que ainda pode continuar
+    # depois do fim do texto (usado pelo modo documento longo)
+    continuacao: Optional[Callable[[str], int]] = None
 
 
 @dataclass
@@ -49,6 +74,7 @@ class MatchInfo:
     ok: bool
     motivo: Optional[str]
     peso_aplicado: int
+    contexto: str = ""
 
 
 # =========================
@@ -150,6 +176,11 @@ KW_CNH = ["cnh", "carteira nacional de habilitacao", "carteira nacional de habil
 KW_TITULO = ["titulo de eleitor", "título de eleitor"]
 
 
+# maior janela de contexto usada pelos validadores/contexto soft (ver _tem_gatilho_nome,
+# _validator_id_contextual_factory). Ao aumentar alguma janela, atualize aqui.
+RAIO_CONTEXTO_MAX = 140
+
+
 def _fragmento(texto_norm: str, start: int, end: int, window: int = 80) -> str:
     s = max(0, start - window)
     e = min(len(texto_norm), end + window)
@@ -223,14 +254,11 @@ def _validator_telefone_strito(m: "re.Match[str]", raw_text: str, search_text: s
     - valida com validar_telefone_br quando possível
     """
     raw = m.group(0)
-    dig = apenas_digitos(raw)
+    dig = normalizar_telefone_br(raw)
 
     if _tem_kw(search_text, m.start(), m.end(), PALAVRAS_NEGATIVAS_TELEFONE, window=60):
         return (False, None, "telefone_contexto_negativo")
 
-    if dig.startswith("55") and len(dig) in (12, 13):
-        dig = dig[2:]
-
     if len(dig) not in (10, 11):
         return (False, None, "telefone_tamanho_invalido")
 
@@ -346,6 +374,88 @@ def _validator_nome_contextual(m: "re.Match[str]", raw_text: str, search_text: s
     return (True, raw, None)
 
 
+# =========================
+# Padrões lineares
+# =========================
+
+_PALAVRA_NOME = "[A-ZÁÀÂÃÉÈÊÍÌÎÓÒÔÕÚÙÛÇ][a-záàâãéèêíìîóòôõúùûç]{2,}"
+
+_CHAR_LOCAL_EMAIL = _comp(r"[a-zA-Z0-9_.+-]")
+_FRONTEIRA = _comp(r"\b")
+
+
+_CHARS_EMAIL = string.ascii_letters + string.digits + "_.+-@" + "\u017f\u212a"  # ſ e K casam s/k com IGNORECASE
+_LETRAS_NOME = string.ascii_letters + "ÁÀÂÃÉÈÊÍÌÎÓÒÔÕÚÙÛÇáàâãéèêíìîóòôõúùûç" + "\u017f\u212a"
+
+
+def _continuacao_email(texto: str) -> int:
+    # um e-mail em andamento é uma sequência final de caracteres de e-mail
+    return len(texto.rstrip(_CHARS_EMAIL))
+
+
+def _continuacao_nome(texto: str) -> int:
+    """
+    Do fim para o começo: até 5 palavras livres (conectivo + nome + 3
+    sobrenomes), a repetição "d[aeo]/e + palavra" (a parte sem limite do
+    padrão) e a primeira palavra. Devolve o início mais à esquerda possível.
+    """
+    inicio_sequencia = len(texto.rstrip(_LETRAS_NOME + " "))
+    fim = len(texto)
+    inicio = fim
+    livres = 5
+    for palavra in reversed(texto[inicio_sequencia:].split(" ")):
+        if not palavra:
+            fim -= 1
+            continue
+        comeco = fim - len(palavra)
+        if livres:
+            livres -= 1
+        elif not palavra.lower().startswith(("da", "de", "do", "e")):
+            return comeco
+        inicio = comeco
+        fim = comeco - 1
+    return inicio
+
+
+class _PadraoEmail:
+    """
+    Executa o regex de e-mail só a partir de posições que podem casar.
+
+    No `finditer` direto, cada fronteira de palavra numa sequência longa de
+    caracteres de e-mail sem "@" (ex.: "1.1.1.1...") reinicia a varredura até o
+    fim da sequência: tempo quadrático. Aqui cada "@" é ancorado uma única vez:
+    o início é a primeira fronteira da sequência local que termina nele (todas
+    as outras levariam ao mesmo "@" e ao mesmo domínio), e o regex original
+    confirma o match a partir dali. Os matches são idênticos aos do regex.
+    """
+
+    def __init__(self, padrao: re.Pattern):
+        self.padrao = padrao
+        self.pattern = padrao.pattern
+
+    def finditer(self, texto: str, pos: int = 0):
+        while True:
+            arroba = texto.find("@", pos)
+            if arroba < 0:
+                return
+
+            inicio = arroba
+            while inicio > pos and _CHAR_LOCAL_EMAIL.match(texto, inicio - 1):
+                inicio -= 1
+
+            fronteira = _FRONTEIRA.search(texto, inicio)
+            m = None
+            if fronteira is not None and fronteira.start() < arroba:
+                m = self.padrao.match(texto, fronteira.start())
+
+            if m is None:
+                pos = arroba + 1
+                continue
+
+            yield m
+            pos = m.end()
+
+
 # =========================
 # Regras (prioridades e padrões)
 # =========================
@@ -365,6 +475,7 @@ REGRAS: List[Regra] = [
         prioridade=1,
         validator=_validator_cpf,
         min_len=11,
+        indice="cpf",
     ),
     Regra(
         nome="cnpj",
@@ -374,15 +485,17 @@ REGRAS: List[Regra] = [
         prioridade=1,
         validator=_validator_cnpj,
         min_len=14,
+        indice="cnpj",
     ),
     Regra(
         nome="email",
-        padrao=_comp(r"\b[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+(?:\.[a-zA-Z0-9-]+)+\b"),
+        padrao=_PadraoEmail(_comp(r"\b[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+(?:\.[a-zA-Z0-9-]+)+\b")),
         tipo="hard",
         peso=5,
         prioridade=1,
         validator=_validator_email_tld_suspeito,
         min_len=6,
+        continuacao=_continuacao_email,
     ),
 
     # --- PROCESSOS ---
@@ -392,6 +505,7 @@ REGRAS: List[Regra] = [
         tipo="hard",
         peso=5,
         prioridade=3,
+        indice="processo",
     ),
     Regra(
         nome="processo_sei",
@@ -399,6 +513,7 @@ REGRAS: List[Regra] = [
         tipo="hard",
         peso=4,
         prioridade=3,
+        indice="processo",
     ),
     Regra(
         nome="processo_sei_generico",
@@ -406,6 +521,7 @@ REGRAS: List[Regra] = [
         tipo="hard",
         peso=4,
         prioridade=3,
+        indice="processo",
     ),
 
     # --- TELEFONE ---
@@ -417,6 +533,7 @@ REGRAS: List[Regra] = [
         prioridade=2,
         validator=_validator_telefone_strito,
         min_len=8,
+        indice="telefone",
     ),
 
     # --- ENDEREÇO / SOFT ---
@@ -579,10 +696,14 @@ REGRAS: List[Regra] = [
     Regra(
         nome="nome_completo",
         padrao=_comp(
-            r"\b(?:[A-ZÁÀÂÃÉÈÊÍÌÎÓÒÔÕÚÙÛÇ][a-záàâãéèêíìîóòôõúùûç]{2,}"
-            r"(?:\s+(?:de|da|do|dos|das|e))?){1,}"
-            r"\s+[A-ZÁÀÂÃÉÈÊÍÌÎÓÒÔÕÚÙÛÇ][a-záàâãéèêíìîóòôõúùûç]{2,}"
-            r"(?:\s+[A-ZÁÀÂÃÉÈÊÍÌÎÓÒÔÕÚÙÛÇ][a-záàâãéèêíìîóòôõúùûç]{2,}){0,3}\b"
+            # forma sem grupos quantificados aninhados: a versão antiga
+            # "(?:W(?:\s+(?:de|...))?){1,}" deixava palavras W colarem umas nas
+            # outras e dividia cada sequência de letras de forma exponencial.
+            # Casa os mesmos trechos (ver tools/bench_regex.py --equivalencia).
+            rf"\b{_PALAVRA_NOME}"
+            rf"(?:\s+(?:d[aeo]|e){_PALAVRA_NOME})*"
+            r"(?:\s+(?:de|da|do|dos|das|e))?"
+            rf"\s+{_PALAVRA_NOME}(?:\s+{_PALAVRA_NOME}){{0,3}}\b"
         ),
         tipo="soft",
         peso=3,
@@ -592,6 +713,7 @@ REGRAS: List[Regra] = [
         exige_contexto=True,
         peso_min_sem_contexto=0,
         boost_contexto=0,
+        continuacao=_continuacao_nome,
     ),
 ]
 
@@ -611,30 +733,40 @@ def _resolver_overlaps(matches: List[MatchInfo]) -> List[MatchInfo]:
     if not matches:
         return []
 
-    matches_sorted = sorted(
-        matches,
-        key=lambda x: (x.start, x.prioridade, -x.peso_aplicado, -(x.end - x.start)),
-    )
+    matches_sorted = sorted(matches, key=_chave_ordenacao)
 
     resultado: List[MatchInfo] = []
     current = matches_sorted[0]
 
     for nxt in matches_sorted[1:]:
-        if nxt.start >= current.end:
-            resultado.append(current)
-            current = nxt
-            continue
-
-        cur_key = (current.prioridade, -current.peso_aplicado, -(current.end - current.start))
-        nxt_key = (nxt.prioridade, -nxt.peso_aplicado, -(nxt.end - nxt.start))
-
-        if nxt_key < cur_key:
-            current = nxt
+        finalizado, current = _resolver_passo(current, nxt)
+        if finalizado is not None:
+            resultado.append(finalizado)
 
     resultado.append(current)
     return resultado
 
 
+def _chave_ordenacao(x: MatchInfo) -> Tuple[int, int, int, int]:
+    return (x.start, x.prioridade, -x.peso_aplicado, -(x.end - x.start))
+
+
+def _resolver_passo(current: MatchInfo, nxt: MatchInfo) -> Tuple[Optional[MatchInfo], MatchInfo]:
+    """
+    Um passo da varredura de overlaps (matches em ordem de `_chave_ordenacao`).
+    Retorna (match finalizado ou None, novo match corrente).
+    """
+    if nxt.start >= current.end:
+        return current, nxt
+
+    cur_key = (current.prioridade, -current.peso_aplicado, -(current.end - current.start))
+    nxt_key = (nxt.prioridade, -nxt.peso_aplicado, -(nxt.end - nxt.start))
+
+    if nxt_key < cur_key:
+        return None, nxt
+    return None, current
+
+
 # =========================
 # Utilitários
 # =========================
@@ -645,6 +777,91 @@ def _extrair_contexto(texto: str, start: int, end: int, window: int = 60) -> str
     return texto[s:e]
 
 
+def _detalhe_match(x: MatchInfo, contexto: str) -> Dict[str, Any]:
+    return {
+        "tipo": x.regra,
+        "valor_detectado": x.raw,
+        "valor_normalizado": x.norm,
+        "motivo": x.motivo,
+        "contexto": contexto,
+        "score": x.peso_aplicado,
+    }
+
+
+def _avaliar_match(regra: Regra, m: "re.Match[str]", raw_text: str, search_text: str) -> Optional[MatchInfo]:
+    """
+    Aplica tamanho mínimo, validador e regras de contexto (soft) a um candidato.
+    Retorna None quando o candidato é descartado.
+    """
+    raw = m.group(0)
+
+    if regra.min_len and len(raw) < regra.min_len:
+        return None
+
+    # identificadores conhecidos: público é descartado, pessoal é marcado sem depender do validador
+    if regra.indice is not None:
+        indice = indice_identificadores()
+        lista = indice.consultar(regra.indice, raw) if indice is not None else None
+        if lista == PUBLICO:
+            return None
+        if lista == PESSOAL:
+            return MatchInfo(
+                regra=regra.nome,
+                prioridade=regra.prioridade,
+                start=m.start(),
+                end=m.end(),
+                raw=raw,
+                # mesma forma de valor_normalizado dos validadores; a chave do
+                # índice (NORMALIZADORES) pode ser outra, ex.: telefone sem DDI
+                norm=apenas_digitos(raw),
+                ok=True,
+                motivo="identificador_conhecido",
+                peso_aplicado=regra.peso,
+            )
+
+    ok = True
+    norm_val: Optional[str] = raw
+    motivo: Optional[str] = "padrao_direto"
+
+    if regra.validator:
+        ok, norm_val, motivo = regra.validator(m, raw_text, search_text)
+
+    if not ok:
+        return None
+
+    peso_final = regra.peso
+
+    # soft: exige contexto? (ou aplica min/boost)
+    if regra.tipo == "soft":
+        has_ctx = _tem_kw(search_text, m.start(), m.end(), PALAVRAS_CHAVE_RISCO, window=110)
+
+        if regra.exige_contexto and not has_ctx:
+            return None
+
+        if has_ctx:
+            peso_final = max(peso_final, regra.peso_min_sem_contexto) + regra.boost_contexto
+            if motivo is None or motivo == "padrao_direto":
+                motivo = "soft_com_contexto"
+        else:
+            if regra.peso_min_sem_contexto <= 0:
+                return None
+            peso_final = regra.peso_min_sem_contexto
+            if motivo is None or motivo == "padrao_direto":
+                motivo = "soft_sem_contexto"
+
+    return MatchInfo(
+        regra=regra.nome,
+        prioridade=regra.prioridade,
+        start=m.start(),
+        end=m.end(),
+        raw=raw,
+        norm=norm_val,
+        ok=True,
+        motivo=motivo,
+        peso_aplicado=peso_final,
+    )
+
+
 def _decidir_acao(score_total: int, politica: PoliticaRisco) -> str:
     if score_total >= politica.score_bloquear:
         return "BLOQUEAR"
@@ -657,113 +874,458 @@ def _decidir_acao(score_total: int, politica: PoliticaRisco) -> str:
 # Core
 # =========================
 
-def analisar_texto(texto: Any, politica: PoliticaRisco = DEFAULT_POLITICA) -> Dict[str, Any]:
+def analisar_texto(
+    texto: Any,
+    politica: PoliticaRisco = DEFAULT_POLITICA,
+    tempo_max_ms: Optional[float] = TEMPO_MAX_VARREDURA_MS,
+    detalhado: bool = True,
+) -> Dict[str, Any]:
+    """
+    `tempo_max_ms` é o orçamento da varredura: regras que não terminam dentro
+    dele são interrompidas e listadas em "regras_degradadas" (None = sem limite).
+
+    Com `detalhado=False` o resultado traz só o que `ResumoLote` soma: sem
+    texto_anonimizado e, em cada match, só tipo, motivo e score.
+    """
+    rastreio = rastreio_atual()
+
+    inicio = time.perf_counter()
     raw_text = normalizar_raw(texto)
+    fim_raw = time.perf_counter()
     search_text = normalizar_busca(raw_text)
+    if rastreio is not None:
+        rastreio.registrar("normalizar_raw", fim_raw - inicio)
+        rastreio.registrar("normalizar_busca", time.perf_counter() - fim_raw)
 
     if not raw_text:
-        return {
-            "status": "PUBLICAR",
-            "score": 0,
-            "total_matches": 0,
-            "matches": [],
-            "texto_anonimizado": "",
-        }
+        vazio: Dict[str, Any] = {"status": "PUBLICAR", "score": 0, "total_matches": 0, "matches": []}
+        if detalhado:
+            vazio["texto_anonimizado"] = ""
+        return vazio
 
     encontrados: List[MatchInfo] = []
 
-    # 1) varredura
+    degradadas: List[str] = []
+    prazo = time.perf_counter() + tempo_max_ms / 1000 if tempo_max_ms is not None else None
+
+    # 1) varredura (tempo de regex e de validação medidos separadamente)
+    tempo_validadores = 0.0
     for regra in REGRAS:
-        for m in regra.padrao.finditer(raw_text):
-            raw = m.group(0)
+        inicio_regra = time.perf_counter()
+        if prazo is not None and inicio_regra > prazo:
+            degradadas.append(regra.nome)
+            continue
 
-            if regra.min_len and len(raw) < regra.min_len:
-                continue
+        achados, _, validacao_regra, estourou = _varrer_regra(regra, raw_text, search_text, prazo)
+        encontrados.extend(achados)
+        if estourou:
+            degradadas.append(regra.nome)
 
-            ok = True
-            norm_val: Optional[str] = raw
-            motivo: Optional[str] = "padrao_direto"
+        tempo_validadores += validacao_regra
+        if rastreio is not None:
+            rastreio.registrar(f"regex.{regra.nome}", time.perf_counter() - inicio_regra - validacao_regra)
 
-            if regra.validator:
-                ok, norm_val, motivo = regra.validator(m, raw_text, search_text)
+    if rastreio is not None:
+        rastreio.registrar("validadores", tempo_validadores)
 
-            if not ok:
-                continue
+    return _montar_resultado(raw_text, encontrados, politica, degradadas, tempo_max_ms, detalhado)
 
-            peso_final = regra.peso
-
-            # soft: exige contexto? (ou aplica min/boost)
-            if regra.tipo == "soft":
-                has_ctx = _tem_kw(search_text, m.start(), m.end(), PALAVRAS_CHAVE_RISCO, window=110)
-
-                if regra.exige_contexto and not has_ctx:
-                    continue
-
-                if has_ctx:
-                    peso_final = max(peso_final, regra.peso_min_sem_contexto) + regra.boost_contexto
-                    if motivo is None or motivo == "padrao_direto":
-                        motivo = "soft_com_contexto"
-                else:
-                    if regra.peso_min_sem_contexto <= 0:
-                        continue
-                    peso_final = regra.peso_min_sem_contexto
-                    if motivo is None or motivo == "padrao_direto":
-                        motivo = "soft_sem_contexto"
-
-            encontrados.append(
-                MatchInfo(
-                    regra=regra.nome,
-                    prioridade=regra.prioridade,
-                    start=m.start(),
-                    end=m.end(),
-                    raw=raw,
-                    norm=norm_val,
-                    ok=True,
-                    motivo=motivo,
-                    peso_aplicado=peso_final,
-                )
-            )
+
+def _varrer_regra(
+    regra: Regra,
+    raw_text: str,
+    search_text: str,
+    prazo: Optional[float] = None,
+) -> Tuple[List[MatchInfo], int, float, bool]:
+    """
+    Varre uma regra: (matches aceitos, candidatos do regex, tempo de validação, estourou o prazo).
+    """
+    encontrados: List[MatchInfo] = []
+    candidatos = 0
+    validacao = 0.0
+
+    for m in regra.padrao.finditer(raw_text):
+        candidatos += 1
+        inicio_validacao = time.perf_counter()
+        info = _avaliar_match(regra, m, raw_text, search_text)
+        if info is not None:
+            encontrados.append(info)
+
+        agora = time.perf_counter()
+        validacao += agora - inicio_validacao
+        if prazo is not None and agora > prazo:
+            return encontrados, candidatos, validacao, True
+
+    return encontrados, candidatos, validacao, False
+
+
+def _montar_resultado(
+    raw_text: str,
+    encontrados: List[MatchInfo],
+    politica: PoliticaRisco,
+    degradadas: List[str],
+    tempo_max_ms: Optional[float],
+    detalhado: bool = True,
+) -> Dict[str, Any]:
+    """Overlaps, score, anonimização e decisão a partir dos matches de todas as regras (na ordem de REGRAS)."""
+    rastreio = rastreio_atual()
 
     # 2) resolve overlaps
-    limpos = _resolver_overlaps(encontrados)
+    with etapa("overlaps"):
+        limpos = _resolver_overlaps(encontrados)
 
     # 3) score + anonimização
     score_total = sum(x.peso_aplicado for x in limpos)
-    texto_anon = list(raw_text)
+    status = _decidir_acao(score_total, politica)
+
+    if not detalhado:
+        # só o que ResumoLote soma: sem valores, contexto nem texto anonimizado
+        resultado: Dict[str, Any] = {
+            "status": status,
+            "score": score_total,
+            "total_matches": len(limpos),
+            "matches": [{"tipo": x.regra, "motivo": x.motivo, "score": x.peso_aplicado} for x in limpos],
+        }
+    else:
+        inicio_anon = time.perf_counter()
+        texto_anon = list(raw_text)
+
+        detalhes: List[Dict[str, Any]] = []
+        for x in limpos:
+            for i in range(x.start, x.end):
+                texto_anon[i] = "*"
+
+            detalhes.append(_detalhe_match(x, _extrair_contexto(raw_text, x.start, x.end)))
+
+        texto_anonimizado = "".join(texto_anon)
+        if rastreio is not None:
+            rastreio.registrar("anonimizacao", time.perf_counter() - inicio_anon)
+
+        resultado = {
+            "status": status,
+            "score": score_total,
+            "total_matches": len(limpos),
+            "matches": detalhes,
+            "texto_anonimizado": texto_anonimizado,
+        }
 
-    detalhes: List[Dict[str, Any]] = []
-    for x in limpos:
-        for i in range(x.start, x.end):
-            texto_anon[i] = "*"
+    # varredura incompleta: não dá para garantir que o texto pode ser publicado
+    if degradadas:
+        logger.warning("Varredura excedeu %s ms; regras degradadas: %s", tempo_max_ms, degradadas)
+        resultado["regras_degradadas"] = degradadas
+        if status == "PUBLICAR" and politica.revisar_se_varredura_incompleta:
+            resultado["status"] = "REVISAR"
 
-        detalhes.append(
-            {
-                "tipo": x.regra,
-                "valor_detectado": x.raw,
-                "valor_normalizado": x.norm,
-                "motivo": x.motivo,
-                "contexto": _extrair_contexto(raw_text, x.start, x.end),
-                "score": x.peso_aplicado,
-            }
-        )
+    return resultado
+
+
+# =========================
+# Varredura concatenada (lote de textos curtos)
+# =========================
+
+# Nenhum padrão de REGRAS aceita este caractere (não é letra, dígito, espaço nem
+# pontuação usada nos padrões), e para `\b` ele equivale ao início/fim do texto:
+# nenhum match atravessa o separador e cada texto casa como se estivesse sozinho.
+SEPARADOR_LOTE = "\x00"
+
+
+class _MatchLocal:
+    """Match do buffer concatenado visto com os offsets do texto de origem."""
+
+    __slots__ = ("_m", "_deslocamento")
+
+    def __init__(self, m: "re.Match[str]", deslocamento: int):
+        self._m = m
+        self._deslocamento = deslocamento
+
+    def group(self, *grupos: Any) -> Any:
+        return self._m.group(*grupos)
+
+    def start(self, grupo: Any = 0) -> int:
+        return self._m.start(grupo) - self._deslocamento
+
+    def end(self, grupo: Any = 0) -> int:
+        return self._m.end(grupo) - self._deslocamento
+
+    def span(self, grupo: Any = 0) -> Tuple[int, int]:
+        return self.start(grupo), self.end(grupo)
 
-    return {
-        "status": _decidir_acao(score_total, politica),
-        "score": score_total,
-        "total_matches": len(limpos),
-        "matches": detalhes,
-        "texto_anonimizado": "".join(texto_anon),
-    }
 
+def _largura(texto: str) -> int:
+    # bytes por caractere da str no CPython; juntar textos de larguras diferentes
+    # alarga o buffer inteiro e deixa o regex mais lento
+    maior = ord(max(texto))
+    return 1 if maior < 0x100 else 2 if maior < 0x10000 else 4
 
-def analisar_dataframe(df: pd.DataFrame, col_texto: str, politica: PoliticaRisco = DEFAULT_POLITICA) -> List[Dict[str, Any]]:
+
+_NAO_ASCII = re.compile(r"[^\x00-\x7f]+")
+
+
+def _sem_combinantes(m: "re.Match[str]") -> str:
+    return "".join(ch for ch in m.group(0) if not unicodedata.combining(ch))
+
+
+def _normalizar_busca_lote(textos: List[str]) -> List[str]:
+    """
+    `[normalizar_busca(t) for t in textos]` com uma única NFKD sobre o lote e a
+    remoção de diacríticos só nos trechos não-ASCII. Os textos não podem conter
+    SEPARADOR_LOTE, que (como caractere base) isola a reordenação da NFKD.
+    """
+    s = unicodedata.normalize("NFKD", SEPARADOR_LOTE.join(textos))
+    s = _NAO_ASCII.sub(_sem_combinantes, s)
+    return [re.sub(r"\s+", " ", parte).strip().casefold() for parte in s.split(SEPARADOR_LOTE)]
+
+
+def analisar_textos_concatenados(
+    textos: List[str],
+    politica: PoliticaRisco = DEFAULT_POLITICA,
+    tempo_max_ms: Optional[float] = TEMPO_MAX_VARREDURA_MS,
+) -> List[Dict[str, Any]]:
+    """
+    Mesmo resultado de `[analisar_texto(t) for t in textos]`, mas os textos
+    curtos (já passados por `normalizar_raw`) são unidos em buffers separados
+    por SEPARADOR_LOTE e cada regex roda uma vez por buffer em vez de uma vez
+    por texto. Validadores e contexto continuam vendo só o texto de origem.
+
+    Textos vazios, longos (> LOTE_CONCATENADO_MAX_TEXTO) ou que contenham
+    SEPARADOR_LOTE são analisados individualmente.
+    """
+    resultados: List[Optional[Dict[str, Any]]] = [None] * len(textos)
+    for i, analise in _iterar_concatenados(textos, politica, tempo_max_ms):
+        resultados[i] = analise
+    return resultados  # type: ignore[return-value]
+
+
+def _iterar_concatenados(
+    textos: List[str],
+    politica: PoliticaRisco,
+    tempo_max_ms: Optional[float],
+    detalhado: bool = True,
+) -> Iterator[Tuple[int, Dict[str, Any]]]:
+    """(índice, análise) à medida que cada buffer é concluído (fora da ordem de entrada)."""
+    grupos: Dict[int, Tuple[List[int], List[int]]] = {}  # largura -> (índices, [tamanho])
+
+    def _fechar_grupo(indices: List[int]) -> Iterator[Tuple[int, Dict[str, Any]]]:
+        analises = _analisar_grupo([textos[i] for i in indices], politica, tempo_max_ms, detalhado)
+        return zip(list(indices), analises)
+
+    for i, raw in enumerate(textos):
+        if not raw or len(raw) > LOTE_CONCATENADO_MAX_TEXTO or SEPARADOR_LOTE in raw:
+            yield i, analisar_texto(raw, politica=politica, tempo_max_ms=tempo_max_ms, detalhado=detalhado)
+            continue
+
+        indices, tamanho = grupos.setdefault(_largura(raw), ([], [0]))
+        indices.append(i)
+        tamanho[0] += len(raw) + 1
+        if tamanho[0] >= LOTE_CONCATENADO_MAX_CHARS:
+            yield from _fechar_grupo(indices)
+            indices.clear()
+            tamanho[0] = 0
+
+    for indices, _ in grupos.values():
+        if indices:
+            yield from _fechar_grupo(indices)
+
+
+def _analisar_grupo(
+    textos: List[str],
+    politica: PoliticaRisco,
+    tempo_max_ms: Optional[float],
+    detalhado: bool = True,
+) -> List[Dict[str, Any]]:
+    rastreio = rastreio_atual()
+
+    with etapa("normalizar_busca"):
+        buscas = _normalizar_busca_lote(textos)
+
+    # tabela ordenada de offsets: match no buffer -> (texto, offset local)
+    offsets: List[int] = []
+    pos = 0
+    for raw in textos:
+        offsets.append(pos)
+        pos += len(raw) + len(SEPARADOR_LOTE)
+    buffer = SEPARADOR_LOTE.join(textos)
+
+    # o orçamento vale para o buffer inteiro; se estourar, cada texto é refeito
+    # sozinho com o próprio orçamento (mesma semântica de analisar_texto)
+    prazo = time.perf_counter() + tempo_max_ms / 1000 if tempo_max_ms is not None else None
+    por_texto: List[List[MatchInfo]] = [[] for _ in textos]
+    tempo_validadores = 0.0
+
+    for regra in REGRAS:
+        inicio_regra = time.perf_counter()
+        validacao_regra = 0.0
+
+        for m in regra.padrao.finditer(buffer):
+            inicio_validacao = time.perf_counter()
+            i = bisect.bisect_right(offsets, m.start()) - 1
+            info = _avaliar_match(regra, _MatchLocal(m, offsets[i]), textos[i], buscas[i])
+            if info is not None:
+                por_texto[i].append(info)
+
+            agora = time.perf_counter()
+            validacao_regra += agora - inicio_validacao
+            if prazo is not None and agora > prazo:
+                logger.info("Buffer concatenado excedeu o orçamento em %s; analisando textos individualmente", regra.nome)
+                return [
+                    analisar_texto(raw, politica=politica, tempo_max_ms=tempo_max_ms, detalhado=detalhado)
+                    for raw in textos
+                ]
+
+        tempo_validadores += validacao_regra
+        if rastreio is not None:
+            rastreio.registrar(f"regex.{regra.nome}", time.perf_counter() - inicio_regra - validacao_regra)
+
+    if rastreio is not None:
+        rastreio.registrar("validadores", tempo_validadores)
+
+    return [
+        _montar_resultado(raw, encontrados, politica, [], tempo_max_ms, detalhado)
+        for raw, encontrados in zip(textos, por_texto)
+    ]
+
+
+def _deduplicar(textos: Iterable[Any]) -> Tuple[List[bytes], Dict[bytes, str]]:
+    """(hash de cada texto na ordem de entrada, hash -> texto normalizado distinto)."""
+    chaves: List[bytes] = []
+    distintos: Dict[bytes, str] = {}
+
+    with etapa("normalizar_raw"):
+        for texto in textos:
+            raw = normalizar_raw(texto)
+            chave = hashlib.blake2b(raw.encode("utf-8"), digest_size=16).digest()
+            chaves.append(chave)
+            distintos.setdefault(chave, raw)
+    return chaves, distintos
+
+
+def _iterar_distintos(
+    distintos: Dict[bytes, str],
+    politica: PoliticaRisco,
+    armazem: Optional["ArmazemAnalises"],
+    detalhado: bool = True,
+) -> Iterator[Tuple[bytes, Dict[str, Any]]]:
+    """(hash, análise) de cada texto distinto, à medida que é produzida."""
+    if armazem is not None:
+        for chave, raw in distintos.items():
+            yield chave, armazem.analisar(raw, politica=politica)
+        return
+
+    chaves = list(distintos)
+    for i, analise in _iterar_concatenados(list(distintos.values()), politica, TEMPO_MAX_VARREDURA_MS, detalhado):
+        yield chaves[i], analise
+
+
+def _copiar_analise(analise: Dict[str, Any]) -> Dict[str, Any]:
+    """Cópia com listas próprias: editar os matches de uma linha não altera as repetidas."""
+    copia = dict(analise)
+    copia["matches"] = [dict(m) for m in analise["matches"]]
+    if "regras_degradadas" in analise:
+        copia["regras_degradadas"] = list(analise["regras_degradadas"])
+    return copia
+
+
+def analisar_lote(
+    textos: Iterable[Any],
+    politica: PoliticaRisco = DEFAULT_POLITICA,
+    armazem: Optional["ArmazemAnalises"] = None,
+    resumo_lote: Optional[ResumoLote] = None,
+) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+    """
+    Analisa uma sequência de textos deduplicando por conteúdo: o hash de
+    `normalizar_raw` identifica textos iguais (inclusive variações de espaço),
+    cada texto distinto é analisado uma vez e o resultado é replicado.
+
+    Os textos distintos passam pela varredura concatenada
+    (`analisar_textos_concatenados`). Com `armazem` (ver core/armazem.py), a
+    análise é feita texto a texto, reaproveitando regras já avaliadas em
+    execuções anteriores.
+
+    Com `resumo_lote`, cada texto distinto também é somado a ele com o número
+    de repetições (mesma contagem de `resumir_lote`).
+
+    Retorna (resultados na ordem de entrada, resumo da deduplicação).
+    """
+    chaves, distintos = _deduplicar(textos)
+    cache: Dict[bytes, Dict[str, Any]] = dict(_iterar_distintos(distintos, politica, armazem))
+    if resumo_lote is not None:
+        for chave, n in Counter(chaves).items():
+            resumo_lote.adicionar(cache[chave], n)
+    # a primeira ocorrência fica com a análise; as repetidas recebem cópias
     resultados: List[Dict[str, Any]] = []
+    entregues = set()
+    for chave in chaves:
+        if chave in entregues:
+            resultados.append(_copiar_analise(cache[chave]))
+        else:
+            entregues.add(chave)
+            resultados.append(cache[chave])
+
+    total = len(resultados)
+    resumo = {
+        "total": total,
+        "textos_distintos": len(cache),
+        "taxa_deduplicacao": round(1 - len(cache) / total, 4) if total else 0.0,
+    }
+    if armazem is not None:
+        armazem.salvar()
+        resumo["armazem"] = dict(armazem.estatisticas)
+    return resultados, resumo
+
+
+def resumir_lote(
+    textos: Iterable[Any],
+    politica: PoliticaRisco = DEFAULT_POLITICA,
+    armazem: Optional["ArmazemAnalises"] = None,
+) -> ResumoLote:
+    """
+    Só os agregados de `analisar_lote` (ver core/resumo.py): cada texto distinto
+    é analisado sem texto anonimizado nem detalhe dos matches, somado ao resumo
+    com o número de repetições assim que o buffer dele termina e descartado.
+    """
+    chaves, distintos = _deduplicar(textos)
+    repeticoes = Counter(chaves)
+    del chaves
+
+    resumo = ResumoLote()
+    for chave, analise in _iterar_distintos(distintos, politica, armazem, detalhado=False):
+        resumo.adicionar(analise, repeticoes[chave])
+    if armazem is not None:
+        armazem.salvar()
+    return resumo
+
+
+def anonimizar_lote(
+    textos: Iterable[Any],
+    politica: PoliticaRisco = DEFAULT_POLITICA,
+) -> List[Tuple[str, str, int]]:
+    """(texto_anonimizado, status, score) de cada texto, na ordem de entrada (para exportação)."""
+    chaves, distintos = _deduplicar(textos)
+    cache = {
+        chave: (analise["texto_anonimizado"], analise["status"], analise["score"])
+        for chave, analise in _iterar_distintos(distintos, politica, None)
+    }
+    return [cache[chave] for chave in chaves]
+
+
+def analisar_dataframe(
+    df: pd.DataFrame,
+    col_texto: str,
+    politica: PoliticaRisco = DEFAULT_POLITICA,
+    armazem: Optional["ArmazemAnalises"] = None,
+    resumo_lote: Optional[ResumoLote] = None,
+) -> List[Dict[str, Any]]:
     df = df.copy()
     df[col_texto] = df[col_texto].fillna("")
 
-    for idx, row in df.iterrows():
-        texto = row[col_texto]
-        analise = analisar_texto(texto, politica=politica)
+    analises, dedup = analisar_lote(df[col_texto], politica=politica, armazem=armazem, resumo_lote=resumo_lote)
+    logger.info(
+        "analisar_dataframe: %s linhas, %s textos distintos (taxa de deduplicação %.1f%%)",
+        dedup["total"], dedup["textos_distintos"], 100 * dedup["taxa_deduplicacao"],
+    )
+
+    resultados: List[Dict[str, Any]] = []
+    for idx, texto, analise in zip(df.index, df[col_texto], analises):
         resultados.append(
             {
                 "index": idx,
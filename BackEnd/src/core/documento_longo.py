@@ -0,0 +1,381 @@
+# BackEnd/src/core/documento_longo.py
+"""
+Modo documento longo: varredura em janelas sobrepostas com memória limitada.
+
+O texto é lido em pedaços, normalizado em fluxo e analisado em janelas de
+`janela` caracteres. Cada janela carrega uma sobreposição de
+`maior_match + RAIO_CONTEXTO_MAX` caracteres à direita (e o raio de contexto à
+esquerda), de modo que regex, validadores e contexto enxergam exatamente o
+mesmo entorno que na varredura completa.
+
+Não há deduplicação "a posteriori" nas emendas: cada regra retoma o `finditer`
+do ponto onde parou na janela anterior e só são confirmados matches que começam
+antes do corte da janela, então nenhum match é avaliado duas vezes.
+
+O resultado coincide com o de `analisar_texto` quando nenhum match passa de
+`maior_match` caracteres e `normalizar_busca` preserva o comprimento do texto
+(caso normal em português; ligaduras como "ﬁ" ou "ß" deslocam os offsets da
+busca). Matches mais longos são cortados e a regra fica degradada (REVISAR).
+"""
+from __future__ import annotations
+
+import logging
+import re
+import time
+import unicodedata
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from ..utils.rastreio import etapa
+from .config import (
+    DEFAULT_POLITICA,
+    JANELA_DOCUMENTO_LONGO,
+    MAIOR_MATCH_DOCUMENTO_LONGO,
+    PoliticaRisco,
+    TEMPO_MAX_VARREDURA_MS,
+)
+from .detector import (
+    REGRAS,
+    RAIO_CONTEXTO_MAX,
+    MatchInfo,
+    _MatchLocal,
+    _avaliar_match,
+    _chave_ordenacao,
+    _decidir_acao,
+    _detalhe_match,
+    _extrair_contexto,
+    _resolver_passo,
+)
+
+logger = logging.getLogger(__name__)
+
+
+# =========================
+# Normalização em fluxo
+# =========================
+
+def _pedacos(texto: Any, tamanho: int) -> Iterator[str]:
+    """Aceita str, iterável de str (ex.: arquivo aberto) ou qualquer valor (via str())."""
+    if texto is None:
+        return
+    if isinstance(texto, str):
+        for i in range(0, len(texto), tamanho):
+            yield texto[i:i + tamanho]
+        return
+    if isinstance(texto, Iterable) and not isinstance(texto, (bytes, bytearray)):
+        for pedaco in texto:
+            yield str(pedaco)
+        return
+    yield str(texto)
+
+
+def normalizar_raw_fluxo(pedacos: Iterable[str]) -> Iterator[str]:
+    """
+    Equivalente em fluxo de `normalizar_raw`: troca NBSP por espaço, compacta
+    espaços (inclusive entre pedaços) e remove espaços das pontas.
+    """
+    inicio = True
+    espaco_pendente = False
+
+    for pedaco in pedacos:
+        s = re.sub(r"\s+", " ", pedaco.replace("\u00a0", " "))
+        if not s:
+            continue
+        if s[0] == " ":
+            espaco_pendente = True
+            s = s[1:]
+            if not s:
+                continue
+        termina_com_espaco = s.endswith(" ")
+        if termina_com_espaco:
+            s = s[:-1]
+
+        if espaco_pendente and not inicio:
+            yield " "
+        yield s
+        inicio = False
+        espaco_pendente = termina_com_espaco
+
+
+def _normalizar_busca_trecho(raw: str) -> str:
+    """`normalizar_busca` sem compactar/aparar espaços (o trecho já vem de normalizar_raw)."""
+    s = unicodedata.normalize("NFKD", raw)
+    s = "".join(ch for ch in s if not unicodedata.combining(ch))
+    return s.casefold()
+
+
+# =========================
+# Varredura por janela
+# =========================
+
+def _varrer_janela(
+    buf: str,
+    base: int,
+    corte: int,
+    limite: int,
+    fim: bool,
+    retomar: List[int],
+    cortadas: List[bool],
+    pode_ampliar: bool,
+    prazo: Optional[float] = None,
+) -> Optional[Tuple[List[MatchInfo], List[int], List[bool], List[str]]]:
+    """
+    Avalia os matches que começam antes de `corte` (offsets globais).
+
+    Um match que começa antes do corte e pode terminar além do buffer (encosta
+    no fim, ou `Regra.continuacao` indica um candidato em andamento) passa de
+    `maior_match`. Com `pode_ampliar`, retorna None para a janela ser ampliada;
+    senão o match é cortado no fim do buffer e a regra é marcada em `cortadas`.
+    Na janela seguinte, uma regra cortada recomeça como se o texto começasse
+    no ponto de retomada, para casar o restante do match.
+
+    Regras que passam do `prazo` param nesta janela e voltam na próxima a
+    partir do corte; são devolvidas em `estouradas`.
+    """
+    with etapa("normalizar_busca"):
+        busca = _normalizar_busca_trecho(buf)
+    encontrados: List[MatchInfo] = []
+    novo_retomar = list(retomar)
+    novas_cortadas = [False] * len(REGRAS)
+    estouradas: List[str] = []
+
+    for i, regra in enumerate(REGRAS):
+        if prazo is not None and time.perf_counter() > prazo:
+            estouradas.append(regra.nome)
+            novo_retomar[i] = max(novo_retomar[i], corte)
+            continue
+
+        inicio = retomar[i] - base
+        if cortadas[i]:
+            candidatos = (_MatchLocal(m, -inicio) for m in regra.padrao.finditer(buf[inicio:]))
+        else:
+            candidatos = regra.padrao.finditer(buf, inicio)
+
+        cortada = False
+        estourou = False
+        for m in candidatos:
+            if prazo is not None and time.perf_counter() > prazo:
+                estourou = True
+                break
+            if m.start() + base >= corte:
+                break
+            if not fim and m.end() + base + RAIO_CONTEXTO_MAX > limite:
+                if pode_ampliar:
+                    return None
+                cortada = True
+
+            novo_retomar[i] = m.end() + base
+            info = _avaliar_match(regra, m, buf, busca)
+            if info is None:
+                continue
+
+            info.contexto = _extrair_contexto(buf, m.start(), m.end())
+            info.start += base
+            info.end += base
+            encontrados.append(info)
+
+        if estourou:
+            estouradas.append(regra.nome)
+        elif not fim and regra.continuacao is not None:
+            em_andamento = max(regra.continuacao(buf) + base, novo_retomar[i])
+            if em_andamento < corte:
+                if pode_ampliar:
+                    return None
+                cortada = True
+
+        novas_cortadas[i] = cortada
+
+        # nenhum outro match desta regra começa entre o último fim e o corte
+        novo_retomar[i] = max(novo_retomar[i], corte)
+
+    encontrados.sort(key=_chave_ordenacao)
+    return encontrados, novo_retomar, novas_cortadas, estouradas
+
+
+def _anonimizar_trecho(buf: str, base: int, inicio: int, fim: int, mascaras: List[MatchInfo]) -> str:
+    chars = list(buf[inicio - base:fim - base])
+    for x in mascaras:
+        for i in range(max(x.start, inicio), min(x.end, fim)):
+            chars[i - inicio] = "*"
+    return "".join(chars)
+
+
+def varrer_documento_longo(
+    texto: Any,
+    politica: PoliticaRisco = DEFAULT_POLITICA,
+    janela: int = JANELA_DOCUMENTO_LONGO,
+    maior_match: int = MAIOR_MATCH_DOCUMENTO_LONGO,
+    tempo_max_ms: Optional[float] = TEMPO_MAX_VARREDURA_MS,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Gera eventos à medida que o texto é processado:
+    - {"evento": "match", "inicio", "fim", "detalhe"}: match confirmado (já sem overlaps)
+    - {"evento": "trecho", "texto"}: próximo trecho do texto anonimizado
+    - {"evento": "resumo", "status", "score", "total_matches", "regras_degradadas"}: último evento
+
+    A memória fica proporcional a `janela + 2 * maior_match + RAIO_CONTEXTO_MAX`:
+    a janela é ampliada no máximo uma vez, em `maior_match`. Matches maiores que
+    isso são cortados e a regra é listada em "regras_degradadas" (REVISAR).
+
+    `tempo_max_ms` é o orçamento de cada janela (o de `analisar_texto` para um
+    texto): regras que não terminam a janela dentro dele também ficam
+    degradadas, e o restante da janela não é varrido por elas.
+    """
+    sobreposicao = maior_match + RAIO_CONTEXTO_MAX
+    fonte = normalizar_raw_fluxo(_pedacos(texto, janela))
+
+    buf = ""            # raw[base : base + len(buf)]
+    excedente = ""      # lido da fonte, ainda fora do buffer
+    base = 0
+    fim = False
+    confirmado = 0      # matches com start < confirmado já foram avaliados
+    emitido = 0         # raw[:emitido] já saiu como trecho anonimizado
+    retomar = [0] * len(REGRAS)
+    cortadas = [False] * len(REGRAS)
+    corrente: Optional[MatchInfo] = None
+    alvo = janela + sobreposicao
+    ampliada = False
+    prazo: Optional[float] = None
+    cortadas_doc: List[str] = []     # matches além de maior_match
+    estouradas_doc: List[str] = []   # orçamento de tempo da janela
+
+    score_total = 0
+    total_matches = 0
+
+    while True:
+        # 1) lê até cobrir a janela + sobreposição (o que passar fica para a próxima leitura)
+        novos: List[str] = []
+        tamanho = base + len(buf)
+        while not fim and tamanho < confirmado + alvo:
+            if excedente:
+                pedaco, excedente = excedente, ""
+            else:
+                try:
+                    pedaco = next(fonte)
+                except StopIteration:
+                    fim = True
+                    break
+            falta = confirmado + alvo - tamanho
+            if len(pedaco) > falta:
+                pedaco, excedente = pedaco[:falta], pedaco[falta:]
+            novos.append(pedaco)
+            tamanho += len(pedaco)
+        if novos:
+            buf += "".join(novos)
+
+        limite = base + len(buf)
+        corte = limite if fim else limite - sobreposicao
+
+        # 2) varredura (amplia a janela uma vez se um match passar de maior_match)
+        if not ampliada:
+            prazo = time.perf_counter() + tempo_max_ms / 1000 if tempo_max_ms is not None else None
+        with etapa("varredura_janela"):
+            varredura = _varrer_janela(
+                buf, base, corte, limite, fim, retomar, cortadas, pode_ampliar=not ampliada, prazo=prazo
+            )
+        if varredura is None:
+            ampliada = True
+            alvo += maior_match
+            continue
+        encontrados, retomar, cortadas, estouradas = varredura
+        for regra, cortada in zip(REGRAS, cortadas):
+            if cortada and regra.nome not in cortadas_doc:
+                cortadas_doc.append(regra.nome)
+        for nome in estouradas:
+            if nome not in estouradas_doc:
+                estouradas_doc.append(nome)
+        alvo = janela + sobreposicao
+        ampliada = False
+
+        # 3) overlaps: mesma varredura de _resolver_overlaps, de forma incremental
+        finalizados: List[MatchInfo] = []
+        for nxt in encontrados:
+            if corrente is None:
+                corrente = nxt
+                continue
+            finalizado, corrente = _resolver_passo(corrente, nxt)
+            if finalizado is not None:
+                finalizados.append(finalizado)
+
+        # matches futuros começam em >= corte: o corrente não pode mais ser trocado
+        if corrente is not None and (fim or corrente.end <= corte):
+            finalizados.append(corrente)
+            corrente = None
+
+        for x in finalizados:
+            score_total += x.peso_aplicado
+            total_matches += 1
+            yield {
+                "evento": "match",
+                "inicio": x.start,
+                "fim": x.end,
+                "detalhe": _detalhe_match(x, x.contexto),
+            }
+
+        # 4) trecho anonimizado até onde nada mais pode mudar
+        pronto = corte if corrente is None else min(corte, corrente.start)
+        if pronto > emitido:
+            yield {
+                "evento": "trecho",
+                "texto": _anonimizar_trecho(buf, base, emitido, pronto, finalizados),
+            }
+            emitido = pronto
+
+        confirmado = corte
+        if fim:
+            break
+
+        # 5) descarta o que não é mais necessário (contexto à esquerda + pendências)
+        novo_base = min(corte - RAIO_CONTEXTO_MAX - 1, emitido)
+        if novo_base > base:
+            buf = buf[novo_base - base:]
+            base = novo_base
+
+    if cortadas_doc:
+        logger.warning("Documento longo com matches além de %s caracteres: %s", maior_match, cortadas_doc)
+    if estouradas_doc:
+        logger.warning("Varredura de janela excedeu %s ms; regras degradadas: %s", tempo_max_ms, estouradas_doc)
+
+    degradadas = [regra.nome for regra in REGRAS if regra.nome in cortadas_doc or regra.nome in estouradas_doc]
+    status = _decidir_acao(score_total, politica)
+    if degradadas:
+        if status == "PUBLICAR" and politica.revisar_se_varredura_incompleta:
+            status = "REVISAR"
+
+    yield {
+        "evento": "resumo",
+        "status": status,
+        "score": score_total,
+        "total_matches": total_matches,
+        "regras_degradadas": degradadas,
+    }
+
+
+def analisar_documento_longo(
+    texto: Any,
+    politica: PoliticaRisco = DEFAULT_POLITICA,
+    janela: int = JANELA_DOCUMENTO_LONGO,
+    tempo_max_ms: Optional[float] = TEMPO_MAX_VARREDURA_MS,
+) -> Dict[str, Any]:
+    """Mesmo formato de retorno de `analisar_texto`, usando a varredura em janelas."""
+    detalhes: List[Dict[str, Any]] = []
+    trechos: List[str] = []
+    resumo: Dict[str, Any] = {}
+
+    for evento in varrer_documento_longo(texto, politica=politica, janela=janela, tempo_max_ms=tempo_max_ms):
+        if evento["evento"] == "match":
+            detalhes.append(evento["detalhe"])
+        elif evento["evento"] == "trecho":
+            trechos.append(evento["texto"])
+        else:
+            resumo = evento
+
+    resultado: Dict[str, Any] = {
+        "status": resumo["status"],
+        "score": resumo["score"],
+        "total_matches": resumo["total_matches"],
+        "matches": detalhes,
+        "texto_anonimizado": "".join(trechos),
+    }
+    if resumo["regras_degradadas"]:
+        resultado["regras_degradadas"] = resumo["regras_degradadas"]
+    return resultado
@@ -0,0 +1,446 @@
+# BackEnd/src/core/fila_shards.py
+"""
+Fila de shards num diretório compartilhado (processamento distribuído de acervos).
+
+Layout de `raiz` (volume de rede ou, para testes, um diretório local):
+    config.json                          lease_s
+    shards/shard-000000.csv              linhas do shard, copiadas do CSV de origem
+    manifestos/shard-000000.json         {"id", "arquivo", "coluna", "inicio", "linhas"}
+    leases/shard-000000.lease            {"dono", "token", "desde"}; o mtime é o heartbeat
+    resultados/shard-000000.jsonl        um resultado de `analisar_dataframe` por linha
+    resultados/shard-000000.resumo.json  ResumoLote do shard (gravado por último = concluído)
+
+Protocolo:
+- o coordenador (`dividir`) grava os shards e, depois de cada um, o manifesto;
+- um worker reivindica um shard criando o lease com O_CREAT|O_EXCL, que é
+  atômico: só um worker consegue. O lease guarda um token único do worker;
+- enquanto processa, uma thread atualiza o mtime do lease a cada lease_s/3,
+  depois de conferir o token no mesmo arquivo aberto. Falhas transitórias
+  (lease ausente ou ilegível enquanto outro worker o renomeia para conferir a
+  idade) são repetidas algumas vezes; token de outro dono encerra o heartbeat
+  na hora. O shard é analisado em blocos e o worker desiste, sem gravar nada,
+  no primeiro bloco após perder o lease;
+- um lease sem heartbeat há mais de lease_s é de um worker que morreu; quem o
+  encontra renomeia o lease para um nome só seu (só um rename vence), confere
+  de novo a idade do arquivo renomeado (o dono pode ter renovado, ou outro
+  worker recriado o lease, entre o stat e o rename) e, se ainda expirado,
+  reivindica o shard; se não, devolve o lease;
+- o token é conferido antes de gravar o resultado e antes de remover o lease:
+  um worker lento dado como morto não apaga o lease do novo dono. Resultados
+  são gravados em temporário + os.replace; um shard pode ainda assim ser
+  processado duas vezes, com o mesmo resultado.
+
+Os relógios dos nós precisam estar sincronizados (NTP): a idade do lease é
+comparada com o horário local.
+"""
+from __future__ import annotations
+
+import json
+import logging
+import os
+import shutil
+import socket
+import threading
+import time
+import uuid
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+import pandas as pd
+
+from .config import TEXT_COLUMN_CANDIDATES
+from .detector import analisar_dataframe
+from .resumo import ResumoLote
+
+logger = logging.getLogger(__name__)
+
+LINHAS_POR_SHARD = 50_000
+LEASE_S = 120.0
+BLOCO_SHARD = 5_000          # linhas analisadas entre duas conferências do lease
+TENTATIVAS_HEARTBEAT = 5     # falhas transitórias seguidas antes de dar o lease por perdido
+
+_SUBDIRS = ("shards", "manifestos", "leases", "resultados")
+
+
+def _gravar_atomico(caminho: str, conteudo: str) -> None:
+    temporario = f"{caminho}.{socket.gethostname()}.{os.getpid()}.tmp"
+    with open(temporario, "w", encoding="utf-8") as f:
+        f.write(conteudo)
+    os.replace(temporario, caminho)
+
+
+def _caminho(raiz: str, subdir: str, shard: str, extensao: str) -> str:
+    return os.path.join(raiz, subdir, shard + extensao)
+
+
+def dono_padrao() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+# =========================
+# Coordenador
+# =========================
+
+def dividir(
+    arquivos: List[str],
+    raiz: str,
+    linhas_por_shard: int = LINHAS_POR_SHARD,
+    lease_s: float = LEASE_S,
+) -> int:
+    """Divide os CSVs em shards em `raiz` e devolve quantos foram criados."""
+    for subdir in _SUBDIRS:
+        os.makedirs(os.path.join(raiz, subdir), exist_ok=True)
+    if os.listdir(os.path.join(raiz, "manifestos")):
+        raise ValueError(f"{raiz} já tem manifestos; use um diretório novo para cada execução")
+    _gravar_atomico(os.path.join(raiz, "config.json"), json.dumps({"lease_s": lease_s}))
+
+    n = 0
+    for arquivo in arquivos:
+        coluna = None
+        inicio = 0
+        for bloco in pd.read_csv(arquivo, chunksize=linhas_por_shard):
+            if coluna is None:
+                coluna = next((c for c in bloco.columns if c.lower() in TEXT_COLUMN_CANDIDATES), None)
+                if not coluna:
+                    logger.warning("%s: nenhuma coluna de texto encontrada", arquivo)
+                    break
+
+            shard = f"shard-{n:06d}"
+            bloco.to_csv(_caminho(raiz, "shards", shard, ".csv"), index=False)
+            manifesto = {"id": shard, "arquivo": arquivo, "coluna": coluna, "inicio": inicio, "linhas": len(bloco)}
+            _gravar_atomico(_caminho(raiz, "manifestos", shard, ".json"), json.dumps(manifesto, ensure_ascii=False))
+            inicio += len(bloco)
+            n += 1
+    return n
+
+
+# =========================
+# Estado dos shards
+# =========================
+
+def manifestos(raiz: str) -> Iterator[Dict[str, Any]]:
+    pasta = os.path.join(raiz, "manifestos")
+    for nome in sorted(os.listdir(pasta)):
+        if nome.endswith(".json"):
+            with open(os.path.join(pasta, nome), encoding="utf-8") as f:
+                yield json.load(f)
+
+
+def _lease_s(raiz: str) -> float:
+    with open(os.path.join(raiz, "config.json"), encoding="utf-8") as f:
+        return float(json.load(f)["lease_s"])
+
+
+def concluido(raiz: str, shard: str) -> bool:
+    return os.path.exists(_caminho(raiz, "resultados", shard, ".resumo.json"))
+
+
+def _idade_lease(caminho: str) -> Optional[float]:
+    try:
+        return time.time() - os.stat(caminho).st_mtime
+    except FileNotFoundError:
+        return None
+
+
+def situacao(raiz: str) -> Dict[str, Any]:
+    """Contagem de shards por estado e leases ativos/expirados."""
+    lease_s = _lease_s(raiz)
+    contagem = {"total": 0, "concluidos": 0, "em_andamento": 0, "expirados": 0, "pendentes": 0}
+    donos: Dict[str, int] = {}
+
+    for manifesto in manifestos(raiz):
+        shard = manifesto["id"]
+        contagem["total"] += 1
+        lease = _caminho(raiz, "leases", shard, ".lease")
+        idade = _idade_lease(lease)
+        if concluido(raiz, shard):
+            contagem["concluidos"] += 1
+        elif idade is None:
+            contagem["pendentes"] += 1
+        elif idade > lease_s:
+            contagem["expirados"] += 1
+        else:
+            contagem["em_andamento"] += 1
+            try:
+                with open(lease, encoding="utf-8") as f:
+                    dono = json.load(f)["dono"]
+                donos[dono] = donos.get(dono, 0) + 1
+            except (OSError, ValueError, KeyError):
+                pass
+    return {**contagem, "workers_ativos": donos}
+
+
+# =========================
+# Worker
+# =========================
+
+def _tentar_lease(caminho: str, dono: str) -> Optional[str]:
+    """Cria o lease (O_EXCL) e devolve o token do novo dono; None se já existir."""
+    try:
+        fd = os.open(caminho, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644)
+    except FileExistsError:
+        return None
+    token = uuid.uuid4().hex
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        json.dump({"dono": dono, "token": token, "desde": time.time()}, f)
+    return token
+
+
+def _token(caminho: str) -> Optional[str]:
+    try:
+        with open(caminho, encoding="utf-8") as f:
+            return json.load(f).get("token")
+    except (OSError, ValueError, AttributeError):
+        return None  # ausente, ou ainda sendo escrito por quem acabou de criá-lo
+
+
+def _devolver(renomeado: str, lease: str) -> None:
+    """Põe de volta um lease tirado do lugar por engano, sem sobrescrever um lease novo."""
+    try:
+        os.link(renomeado, lease)
+    except FileExistsError:
+        pass  # outro worker já criou um lease novo; o antigo perdeu a vez
+    os.remove(renomeado)
+
+
+def _liberar(lease: str, token: str) -> None:
+    """Remove o lease só se ele ainda for deste token."""
+    liberando = f"{lease}.liberando.{token}"
+    try:
+        os.rename(lease, liberando)
+    except FileNotFoundError:
+        return
+    if _token(liberando) == token:
+        os.remove(liberando)
+    else:
+        logger.warning("%s pertence a outro worker; mantido", lease)
+        _devolver(liberando, lease)
+
+
+def _nao_concluidos(raiz: str) -> List[Dict[str, Any]]:
+    return [m for m in manifestos(raiz) if not concluido(raiz, m["id"])]
+
+
+def reivindicar(
+    raiz: str,
+    dono: str,
+    pendentes: Optional[List[Dict[str, Any]]] = None,
+) -> Optional[Tuple[Dict[str, Any], str]]:
+    """
+    Reivindica o primeiro shard livre (ou com lease expirado): (manifesto, token) ou None.
+
+    `pendentes` é a lista de manifestos ainda não concluídos mantida pelo
+    chamador entre chamadas: os que estiverem concluídos saem dela, então cada
+    shard concluído é conferido uma vez, não a cada reivindicação.
+    """
+    lease_s = _lease_s(raiz)
+    if pendentes is None:
+        pendentes = list(manifestos(raiz))
+    concluidos: Set[str] = set()
+    try:
+        return _reivindicar(raiz, dono, pendentes, lease_s, concluidos)
+    finally:
+        if concluidos:
+            pendentes[:] = [m for m in pendentes if m["id"] not in concluidos]
+
+
+def _reivindicar(
+    raiz: str,
+    dono: str,
+    pendentes: List[Dict[str, Any]],
+    lease_s: float,
+    concluidos: Set[str],
+) -> Optional[Tuple[Dict[str, Any], str]]:
+    for manifesto in pendentes:
+        shard = manifesto["id"]
+        if concluido(raiz, shard):
+            concluidos.add(shard)
+            continue
+
+        lease = _caminho(raiz, "leases", shard, ".lease")
+        token = _tentar_lease(lease, dono)
+        if token is not None:
+            if concluido(raiz, shard):  # concluído entre a checagem e o lease
+                _liberar(lease, token)
+                concluidos.add(shard)
+                continue
+            return manifesto, token
+
+        idade = _idade_lease(lease)
+        if idade is not None and idade > lease_s:
+            expirado = f"{lease}.expirado.{uuid.uuid4().hex}"
+            try:
+                os.rename(lease, expirado)
+            except FileNotFoundError:
+                continue  # outro worker recuperou primeiro
+            # entre o stat e o rename o dono pode ter renovado o heartbeat ou
+            # outro worker pode ter recuperado e recriado o lease
+            idade = _idade_lease(expirado)
+            if idade is None or idade <= lease_s:
+                _devolver(expirado, lease)
+                continue
+            os.remove(expirado)
+            logger.warning("Lease de %s expirado (%.0fs sem heartbeat); recuperando", shard, idade)
+            token = _tentar_lease(lease, dono)
+            if token is not None:
+                return manifesto, token
+    return None
+
+
+class _Heartbeat:
+    """
+    Atualiza o mtime do lease em segundo plano enquanto o shard é processado.
+    Para (e marca `perdido`) quando o lease passa a ter outro token, ou depois
+    de TENTATIVAS_HEARTBEAT falhas transitórias seguidas.
+    """
+
+    def __init__(self, caminho: str, token: str, intervalo: float):
+        self.caminho = caminho
+        self.token = token
+        self.intervalo = intervalo
+        self.perdido = False
+        self._parar = threading.Event()
+        self._thread = threading.Thread(target=self._rodar, daemon=True)
+
+    def _renovar(self) -> Optional[bool]:
+        """True: renovado; False: o lease é de outro token; None: falha transitória."""
+        try:
+            with open(self.caminho, encoding="utf-8") as f:
+                if json.load(f).get("token") != self.token:
+                    return False
+                # pelo descritor: toca o mesmo arquivo cujo token foi conferido,
+                # mesmo que o caminho seja trocado entre a leitura e o utime
+                os.utime(f.fileno() if os.utime in os.supports_fd else self.caminho)
+        except (OSError, ValueError, AttributeError):
+            return None  # renomeado por quem confere a idade, ou ainda sendo escrito
+        return True
+
+    def _rodar(self) -> None:
+        falhas = 0
+        espera = self.intervalo
+        while not self._parar.wait(espera):
+            renovado = self._renovar()
+            if renovado is None and falhas < TENTATIVAS_HEARTBEAT:
+                falhas += 1
+                espera = min(self.intervalo, 0.05 * 2 ** falhas)
+                continue
+            if not renovado:
+                self.perdido = True
+                logger.warning("%s recuperado por outro worker; heartbeat encerrado", self.caminho)
+                return
+            falhas = 0
+            espera = self.intervalo
+
+    def __enter__(self) -> "_Heartbeat":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self._parar.set()
+        self._thread.join()
+
+
+def processar_shard(
+    raiz: str,
+    manifesto: Dict[str, Any],
+    token: Optional[str] = None,
+    heartbeat: Optional[_Heartbeat] = None,
+) -> Optional[ResumoLote]:
+    """
+    Analisa o shard em blocos de BLOCO_SHARD linhas e grava resultados e resumo.
+    Com `heartbeat`, desiste entre blocos assim que ele marca o lease como
+    perdido; com `token`, só grava se o lease ainda for dele. Nos dois casos
+    devolve None sem gravar nada.
+    """
+    shard = manifesto["id"]
+    coluna = manifesto["coluna"]
+    df = pd.read_csv(_caminho(raiz, "shards", shard, ".csv"), dtype={coluna: str})
+    df.index = range(manifesto["inicio"], manifesto["inicio"] + len(df))  # linha no CSV de origem
+
+    resumo = ResumoLote()
+    linhas: List[str] = []
+    for inicio in range(0, len(df), BLOCO_SHARD):
+        if heartbeat is not None and heartbeat.perdido:
+            logger.warning("%s: lease perdido durante o processamento; shard abandonado", shard)
+            return None
+        for resultado in analisar_dataframe(df.iloc[inicio:inicio + BLOCO_SHARD], coluna, resumo_lote=resumo):
+            linhas.append(json.dumps({"arquivo": manifesto["arquivo"], **resultado}, ensure_ascii=False, default=str))
+
+    if heartbeat is not None and heartbeat.perdido:
+        logger.warning("%s: lease perdido durante o processamento; shard abandonado", shard)
+        return None
+    if token is not None and _token(_caminho(raiz, "leases", shard, ".lease")) != token:
+        logger.warning("%s: lease assumido por outro worker; resultado descartado", shard)
+        return None
+    _gravar_atomico(_caminho(raiz, "resultados", shard, ".jsonl"), "".join(linha + "\n" for linha in linhas))
+    _gravar_atomico(_caminho(raiz, "resultados", shard, ".resumo.json"), json.dumps(resumo.para_estado()))
+    return resumo
+
+
+def trabalhar(raiz: str, dono: Optional[str] = None, espera_s: float = 1.0) -> int:
+    """
+    Processa shards até todos estarem concluídos e devolve quantos este worker
+    processou. Sem shard livre, espera `espera_s` e tenta de novo: shards de
+    workers que morrerem são recuperados quando o lease expirar.
+    """
+    dono = dono or dono_padrao()
+    intervalo = _lease_s(raiz) / 3
+    processados = 0
+    pendentes = _nao_concluidos(raiz)
+
+    while True:
+        reivindicado = reivindicar(raiz, dono, pendentes)
+        if reivindicado is None:
+            # relê do disco: inclui manifestos gravados depois (dividir ainda em curso)
+            pendentes = _nao_concluidos(raiz)
+            if not pendentes:
+                return processados
+            time.sleep(espera_s)
+            continue
+
+        manifesto, token = reivindicado
+        lease = _caminho(raiz, "leases", manifesto["id"], ".lease")
+        inicio = time.perf_counter()
+        with _Heartbeat(lease, token, intervalo) as heartbeat:
+            gravado = processar_shard(raiz, manifesto, token, heartbeat)
+        _liberar(lease, token)
+        if gravado is None:
+            continue
+        processados += 1
+        logger.info("%s: %s (%s linhas) em %.1fs", dono, manifesto["id"], manifesto["linhas"], time.perf_counter() - inicio)
+
+
+# =========================
+# Merge
+# =========================
+
+def mesclar(raiz: str, saida: Optional[str] = None) -> ResumoLote:
+    """
+    Junta os resultados dos shards (na ordem dos manifestos) em `saida` (JSON
+    Lines; .gz comprime) e devolve o resumo do acervo inteiro.
+    """
+    pendentes = [m["id"] for m in manifestos(raiz) if not concluido(raiz, m["id"])]
+    if pendentes:
+        raise ValueError(f"{len(pendentes)} shards não concluídos (ex.: {pendentes[0]})")
+
+    resumo = ResumoLote()
+    destino = None
+    if saida:
+        if saida.endswith(".gz"):
+            import gzip
+
+            destino = gzip.open(saida, "wb")
+        else:
+            destino = open(saida, "wb")
+
+    try:
+        for manifesto in manifestos(raiz):
+            shard = manifesto["id"]
+            with open(_caminho(raiz, "resultados", shard, ".resumo.json"), encoding="utf-8") as f:
+                resumo.mesclar(ResumoLote.de_estado(json.load(f)))
+            if destino is not None:
+                with open(_caminho(raiz, "resultados", shard, ".jsonl"), "rb") as f:
+                    shutil.copyfileobj(f, destino)
+    finally:
+        if destino is not None:
+            destino.close()
+    return resumo
@@ -0,0 +1,181 @@
+# BackEnd/src/core/indice_identificadores.py
+"""
+Índice de identificadores conhecidos (lista de permissão / lista de bloqueio).
+
+- "publico": números públicos que aparecem em milhares de pedidos (telefone de
+  órgão, CNPJ de governo, processo SEI público) -> o candidato é descartado;
+- "pessoal": identificadores de cadastros conhecidos -> o candidato é marcado
+  mesmo que o validador/contexto o rejeitasse.
+
+Se um valor estiver nas duas listas, "pessoal" vence.
+
+Formato do arquivo (gerado por `construir_indice` / tools/construir_indice.py):
+    cabeçalho fixo  MAGICO (8 bytes) + tamanho do JSON (uint32) + 4 bytes livres
+    cabeçalho JSON  {"ordem_bytes", "assinatura", "secoes": {"lista/categoria": [offset, n]}}
+    seções          arrays ordenados de uint64 (alinhados em 8 bytes)
+
+Cada valor vira uma chave de 64 bits (blake2b do valor normalizado da
+categoria). O arquivo é aberto com mmap somente leitura: os workers da API e o
+pool de processos compartilham as mesmas páginas do cache do SO, e a consulta é
+uma busca binária (~25 passos para dezenas de milhões de entradas).
+"""
+from __future__ import annotations
+
+import bisect
+import hashlib
+import json
+import logging
+import mmap
+import os
+import struct
+import sys
+from typing import Callable, Dict, Iterable, Optional, Tuple
+
+from ..models.validators import apenas_digitos, normalizar_telefone_br
+from .config import ARQUIVO_INDICE_IDENTIFICADORES
+
+logger = logging.getLogger(__name__)
+
+PUBLICO = "publico"
+PESSOAL = "pessoal"
+LISTAS = (PESSOAL, PUBLICO)  # ordem de precedência na consulta
+
+MAGICO = b"SDIDX001"
+_CABECALHO = struct.Struct("<8sI4x")
+
+
+# categoria -> normalização do valor (a mesma usada na construção e na consulta)
+NORMALIZADORES: Dict[str, Callable[[str], str]] = {
+    "cpf": apenas_digitos,
+    "cnpj": apenas_digitos,
+    "telefone": normalizar_telefone_br,  # sem DDI: "+55 61 ..." e "61 ..." são a mesma chave
+    "processo": apenas_digitos,
+}
+
+
+def chave_identificador(categoria: str, valor: str) -> Optional[int]:
+    norm = NORMALIZADORES[categoria](valor)
+    if not norm:
+        return None
+    return int.from_bytes(hashlib.blake2b(norm.encode("utf-8"), digest_size=8).digest(), "little")
+
+
+class IndiceIdentificadores:
+    def __init__(self, caminho: str):
+        self.caminho = caminho
+        with open(caminho, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magico, tamanho_json = _CABECALHO.unpack_from(self._mmap, 0)
+        if magico != MAGICO:
+            raise ValueError(f"{caminho}: não é um índice de identificadores")
+
+        inicio_json = _CABECALHO.size
+        cabecalho = json.loads(self._mmap[inicio_json:inicio_json + tamanho_json])
+        if cabecalho["ordem_bytes"] != sys.byteorder:
+            raise ValueError(f"{caminho}: gerado com ordem de bytes {cabecalho['ordem_bytes']}")
+
+        self.assinatura: str = cabecalho["assinatura"]
+        visao = memoryview(self._mmap)
+        self._secoes: Dict[Tuple[str, str], memoryview] = {}
+        for nome, (offset, n) in cabecalho["secoes"].items():
+            lista, categoria = nome.split("/", 1)
+            self._secoes[(lista, categoria)] = visao[offset:offset + 8 * n].cast("Q")
+
+    def __len__(self) -> int:
+        return sum(len(s) for s in self._secoes.values())
+
+    def consultar(self, categoria: str, valor: str) -> Optional[str]:
+        """PESSOAL, PUBLICO ou None (valor desconhecido)."""
+        chave = chave_identificador(categoria, valor)
+        if chave is None:
+            return None
+
+        for lista in LISTAS:
+            secao = self._secoes.get((lista, categoria))
+            if secao is None:
+                continue
+            i = bisect.bisect_left(secao, chave)
+            if i < len(secao) and secao[i] == chave:
+                return lista
+        return None
+
+    def fechar(self) -> None:
+        for secao in self._secoes.values():
+            secao.release()
+        self._secoes = {}
+        self._mmap.close()
+
+
+def construir_indice(entradas: Iterable[Tuple[str, str, str]], caminho: str) -> Dict[str, int]:
+    """
+    Gera o arquivo a partir de (lista, categoria, valor) e devolve a contagem
+    de chaves distintas por seção. Escreve num temporário e troca no final.
+    """
+    import numpy as np  # só na construção (ordenação de dezenas de milhões de chaves)
+    from array import array
+
+    brutas: Dict[str, array] = {}
+    for lista, categoria, valor in entradas:
+        if lista not in LISTAS:
+            raise ValueError(f"lista desconhecida: {lista!r} (use {PUBLICO!r} ou {PESSOAL!r})")
+        if categoria not in NORMALIZADORES:
+            raise ValueError(f"categoria desconhecida: {categoria!r} (use {sorted(NORMALIZADORES)})")
+        chave = chave_identificador(categoria, valor)
+        if chave is not None:
+            brutas.setdefault(f"{lista}/{categoria}", array("Q")).append(chave)
+
+    secoes = {nome: np.unique(np.frombuffer(chaves, dtype=np.uint64)) for nome, chaves in sorted(brutas.items())}
+
+    assinatura = hashlib.blake2b(digest_size=16)
+    for nome, chaves in secoes.items():
+        assinatura.update(nome.encode("utf-8"))
+        assinatura.update(chaves.tobytes())
+
+    # o tamanho do cabeçalho depende dos offsets; reserva espaço com offsets fictícios
+    def _cabecalho(offsets: Dict[str, int]) -> bytes:
+        return json.dumps({
+            "ordem_bytes": sys.byteorder,
+            "assinatura": assinatura.hexdigest(),
+            "secoes": {nome: [offsets.get(nome, 0), len(chaves)] for nome, chaves in secoes.items()},
+        }).encode("utf-8")
+
+    reserva = len(_cabecalho({nome: 2**62 for nome in secoes}))
+    inicio = _CABECALHO.size + reserva
+    inicio += -inicio % 8
+
+    offsets: Dict[str, int] = {}
+    pos = inicio
+    for nome, chaves in secoes.items():
+        offsets[nome] = pos
+        pos += 8 * len(chaves)
+
+    cabecalho = _cabecalho(offsets).ljust(reserva)
+    temporario = caminho + ".tmp"
+    with open(temporario, "wb") as f:
+        f.write(_CABECALHO.pack(MAGICO, len(cabecalho)))
+        f.write(cabecalho)
+        f.write(b"\0" * (inicio - _CABECALHO.size - len(cabecalho)))
+        for chaves in secoes.values():
+            f.write(chaves.tobytes())
+    os.replace(temporario, caminho)
+
+    return {nome: len(chaves) for nome, chaves in secoes.items()}
+
+
+_indice: Optional[IndiceIdentificadores] = None
+_carregado = False
+
+
+def indice_identificadores() -> Optional[IndiceIdentificadores]:
+    """Índice configurado em SAFEDOC_INDICE_IDENTIFICADORES (aberto uma vez por processo)."""
+    global _indice, _carregado
+    if not _carregado:
+        _carregado = True
+        if ARQUIVO_INDICE_IDENTIFICADORES:
+            try:
+                _indice = IndiceIdentificadores(ARQUIVO_INDICE_IDENTIFICADORES)
+                logger.info("Índice de identificadores: %s entradas (%s)", len(_indice), ARQUIVO_INDICE_IDENTIFICADORES)
+            except (OSError, ValueError) as exc:
+                logger.error("Índice de identificadores indisponível: %s", exc)
+    return _indice
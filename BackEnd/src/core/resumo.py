@@ -0,0 +1,114 @@
+# BackEnd/src/core/resumo.py
+"""
+Resumo agregado de lotes, sem resultados por linha.
+
+`ResumoLote` guarda só contadores: distribuição de status, linhas e matches por
+tipo, histograma de score e motivos. Cada análise é somada e descartada, então
+a memória depende do número de tipos/motivos e não do tamanho do lote.
+
+Resumos parciais (blocos de um CSV, processos do pool, shards) se combinam com
+`mesclar` ou `+`; a ordem da combinação não altera o resultado.
+"""
+from __future__ import annotations
+
+import bisect
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Dict, List
+
+# limite inferior de cada faixa do histograma (acompanha os cortes de PoliticaRisco)
+FAIXAS_SCORE = (0, 1, 3, 6, 8, 12, 20)
+
+
+def _rotulo_faixa(i: int) -> str:
+    inicio = FAIXAS_SCORE[i]
+    if i + 1 == len(FAIXAS_SCORE):
+        return f"{inicio}+"
+    fim = FAIXAS_SCORE[i + 1] - 1
+    return str(inicio) if fim == inicio else f"{inicio}-{fim}"
+
+
+@dataclass
+class ResumoLote:
+    total: int = 0
+    analises: int = 0                      # textos distintos analisados (deduplicação por bloco/shard)
+    linhas_com_matches: int = 0
+    linhas_degradadas: int = 0
+    soma_score: int = 0
+    score_max: int = 0
+    status: Counter = field(default_factory=Counter)
+    linhas_por_tipo: Counter = field(default_factory=Counter)
+    matches_por_tipo: Counter = field(default_factory=Counter)
+    motivos: Counter = field(default_factory=Counter)
+    histograma_score: List[int] = field(default_factory=lambda: [0] * len(FAIXAS_SCORE))
+
+    def adicionar(self, analise: Dict[str, Any], repeticoes: int = 1) -> None:
+        """
+        Soma o resultado de `analisar_texto` (basta `detalhado=False`) como
+        `repeticoes` linhas iguais: uma análise, `repeticoes` linhas no total.
+        """
+        score = analise["score"]
+        self.total += repeticoes
+        self.analises += 1
+        self.soma_score += score * repeticoes
+        self.score_max = max(self.score_max, score)
+        self.status[analise["status"]] += repeticoes
+        self.histograma_score[max(0, bisect.bisect_right(FAIXAS_SCORE, score) - 1)] += repeticoes
+
+        if analise.get("regras_degradadas"):
+            self.linhas_degradadas += repeticoes
+
+        matches = analise["matches"]
+        if matches:
+            self.linhas_com_matches += repeticoes
+        tipos = set()
+        for match in matches:
+            tipos.add(match["tipo"])
+            self.matches_por_tipo[match["tipo"]] += repeticoes
+            self.motivos[match["motivo"] or "sem_motivo"] += repeticoes
+        for tipo in tipos:
+            self.linhas_por_tipo[tipo] += repeticoes
+
+    def mesclar(self, outro: "ResumoLote") -> "ResumoLote":
+        """Acumula `outro` neste resumo (e o devolve)."""
+        self.total += outro.total
+        self.analises += outro.analises
+        self.linhas_com_matches += outro.linhas_com_matches
+        self.linhas_degradadas += outro.linhas_degradadas
+        self.soma_score += outro.soma_score
+        self.score_max = max(self.score_max, outro.score_max)
+        self.status.update(outro.status)
+        self.linhas_por_tipo.update(outro.linhas_por_tipo)
+        self.matches_por_tipo.update(outro.matches_por_tipo)
+        self.motivos.update(outro.motivos)
+        self.histograma_score = [a + b for a, b in zip(self.histograma_score, outro.histograma_score)]
+        return self
+
+    def __add__(self, outro: "ResumoLote") -> "ResumoLote":
+        return ResumoLote().mesclar(self).mesclar(outro)
+
+    def para_estado(self) -> Dict[str, Any]:
+        """Estado completo em JSON (para gravar parciais e mesclar depois)."""
+        return {nome: (dict(v) if isinstance(v, Counter) else v) for nome, v in vars(self).items()}
+
+    @classmethod
+    def de_estado(cls, estado: Dict[str, Any]) -> "ResumoLote":
+        return cls(**{nome: (Counter(v) if isinstance(v, dict) else v) for nome, v in estado.items()})
+
+    def para_dict(self, top_motivos: int = 10) -> Dict[str, Any]:
+        return {
+            "total": self.total,
+            "analises": self.analises,
+            "taxa_deduplicacao": round(1 - self.analises / self.total, 4) if self.total else 0.0,
+            "status": dict(self.status),
+            "linhas_com_matches": self.linhas_com_matches,
+            "linhas_degradadas": self.linhas_degradadas,
+            "linhas_por_tipo": dict(self.linhas_por_tipo.most_common()),
+            "matches_por_tipo": dict(self.matches_por_tipo.most_common()),
+            "score": {
+                "medio": round(self.soma_score / self.total, 4) if self.total else 0.0,
+                "max": self.score_max,
+                "histograma": {_rotulo_faixa(i): n for i, n in enumerate(self.histograma_score)},
+            },
+            "top_motivos": dict(self.motivos.most_common(top_motivos)),
+        }
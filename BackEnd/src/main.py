@@ -1,12 +1,24 @@
 # BackEnd/src/main.py
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware # <--- 1. Importar
+from src.api.execucao import encerrar_executores
+from src.api.observabilidade import admin_router, middleware_rastreio
 from src.api.routes import router
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    encerrar_executores()
+
+
 app = FastAPI(
     title="SafeDoc-DF API",
     description="API de detecção de dados pessoais",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan,
 )
 
 # 2. Configurar o CORS
@@ -23,8 +35,12 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+app.middleware("http")(middleware_rastreio)
+
 app.include_router(router)
+app.include_router(admin_router)
 
+# async: responde direto no event loop, sem depender do threadpool
 @app.get("/health")
-def health():
+async def health():
     return {"status": "ok", "service": "SafeDoc-DF"}
\ No newline at end of file
@@ -51,9 +51,15 @@ _SEQUENCIAS_PROIBIDAS = {
 def _tem_padrao_sequencial(d: str) -> bool:
     return d in _SEQUENCIAS_PROIBIDAS
 
-def _extrair_ddd_e_numero(digits: str) -> Tuple[Optional[int], str]:
+def normalizar_telefone_br(s: str) -> str:
+    """Dígitos sem o DDI 55 (chave do telefone no índice de identificadores; valor_normalizado mantém o DDI)."""
+    digits = apenas_digitos(s)
     if len(digits) in (12, 13) and digits.startswith("55"):
         digits = digits[2:]
+    return digits
+
+def _extrair_ddd_e_numero(digits: str) -> Tuple[Optional[int], str]:
+    digits = normalizar_telefone_br(digits)
     if len(digits) in (10, 11):
         return int(digits[:2]), digits[2:]
     return None, digits
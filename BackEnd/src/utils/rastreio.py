@@ -0,0 +1,148 @@
+# BackEnd/src/utils/rastreio.py
+"""
+Rastreio por etapas (tempo de normalização, regex por regra, validadores...)
+e profiler sob demanda.
+
+O rastreio vive num ContextVar: o middleware da API inicia um por requisição e
+o motor só registra tempos quando há um ativo (fora da API custa ~nada).
+"""
+from __future__ import annotations
+
+import cProfile
+import io
+import pstats
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, Optional
+
+
+@dataclass
+class Rastreio:
+    etapas: Dict[str, float] = field(default_factory=dict)  # segundos acumulados
+    perfilar: bool = False
+
+    def registrar(self, nome: str, segundos: float) -> None:
+        self.etapas[nome] = self.etapas.get(nome, 0.0) + segundos
+
+    def mesclar(self, etapas: Dict[str, float]) -> None:
+        for nome, segundos in etapas.items():
+            self.registrar(nome, segundos)
+
+    def em_ms(self) -> Dict[str, float]:
+        return {nome: round(s * 1000, 3) for nome, s in self.etapas.items()}
+
+    def server_timing(self, total_s: Optional[float] = None) -> str:
+        """Valor do header Server-Timing (nomes de métrica sem espaço)."""
+        partes = [f"{nome};dur={s * 1000:.3f}" for nome, s in self.etapas.items()]
+        if total_s is not None:
+            partes.append(f"total;dur={total_s * 1000:.3f}")
+        return ", ".join(partes)
+
+
+_atual: ContextVar[Optional[Rastreio]] = ContextVar("safedoc_rastreio", default=None)
+
+
+def iniciar_rastreio(perfilar: bool = False) -> Rastreio:
+    rastreio = Rastreio(perfilar=perfilar)
+    _atual.set(rastreio)
+    return rastreio
+
+
+def rastreio_atual() -> Optional[Rastreio]:
+    return _atual.get()
+
+
+@contextmanager
+def etapa(nome: str) -> Iterator[None]:
+    rastreio = _atual.get()
+    if rastreio is None:
+        yield
+        return
+
+    inicio = time.perf_counter()
+    try:
+        yield
+    finally:
+        rastreio.registrar(nome, time.perf_counter() - inicio)
+
+
+# =========================
+# Profiler sob demanda
+# =========================
+
+class _StatsSerializados:
+    """Adapta o dict de `Profile.stats` (picklable) para `pstats.Stats.add`."""
+
+    def __init__(self, stats: Dict[Any, Any]):
+        self.stats = stats
+
+    def create_stats(self) -> None:
+        pass
+
+
+class Profilador:
+    """
+    Perfila as próximas N requisições e acumula um pstats agregado.
+    Cada requisição escolhida roda o trabalho pesado sob cProfile na
+    thread/processo onde ele de fato executa (ver src/api/execucao.py).
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._restantes = 0
+        self._perfiladas = 0
+        self._agregado: Optional[pstats.Stats] = None
+
+    def ativar(self, requisicoes: int) -> None:
+        with self._lock:
+            self._restantes = requisicoes
+            self._perfiladas = 0
+            self._agregado = None
+
+    def reservar(self) -> bool:
+        """Chamado no início de cada requisição: True se ela deve ser perfilada."""
+        with self._lock:
+            if self._restantes <= 0:
+                return False
+            self._restantes -= 1
+            self._perfiladas += 1
+            return True
+
+    def adicionar(self, stats: Dict[Any, Any]) -> None:
+        with self._lock:
+            if self._agregado is None:
+                self._agregado = pstats.Stats(_StatsSerializados(stats))
+            else:
+                self._agregado.add(_StatsSerializados(stats))
+
+    def relatorio(self, ordenar_por: str = "cumulative", limite: int = 50) -> Dict[str, Any]:
+        with self._lock:
+            texto = ""
+            if self._agregado is not None:
+                saida = io.StringIO()
+                self._agregado.stream = saida
+                self._agregado.sort_stats(ordenar_por).print_stats(limite)
+                texto = saida.getvalue()
+            return {
+                "requisicoes_perfiladas": self._perfiladas,
+                "requisicoes_restantes": self._restantes,
+                "perfil": texto,
+            }
+
+
+profilador = Profilador()
+
+
+def executar_perfilado(fn, *args: Any, **kwargs: Any):
+    """Executa fn sob cProfile; retorna (resultado, stats picklable)."""
+    perfil = cProfile.Profile()
+    perfil.enable()
+    try:
+        resultado = fn(*args, **kwargs)
+    finally:
+        perfil.disable()
+    perfil.create_stats()
+    return resultado, perfil.stats
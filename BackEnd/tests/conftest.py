@@ -0,0 +1,5 @@
+# BackEnd/tests/conftest.py
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "vazao: pisos de linhas/s dos caminhos do motor (pytest -m 'not vazao' pula)")
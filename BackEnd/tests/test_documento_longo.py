@@ -0,0 +1,53 @@
+# BackEnd/tests/test_documento_longo.py
+import pytest
+
+from src.core.config import JANELA_DOCUMENTO_LONGO, MAIOR_MATCH_DOCUMENTO_LONGO
+from src.core.detector import RAIO_CONTEXTO_MAX, analisar_texto
+from src.core.documento_longo import analisar_documento_longo
+
+CORTE_PRIMEIRA_JANELA = JANELA_DOCUMENTO_LONGO
+
+
+@pytest.mark.parametrize("deslocamento", range(-30, 31, 3))
+def test_email_na_emenda_da_janela(deslocamento):
+    inicio = CORTE_PRIMEIRA_JANELA + deslocamento
+    texto = "x " * (inicio // 2) + "contato fulano.de.tal@exemplo.com.br ok " + "w " * 6000
+
+    assert analisar_documento_longo(texto) == analisar_texto(texto)
+
+
+def test_email_maior_que_a_janela_nao_passa_como_publicar():
+    texto = "z " * 9000 + "a" * 9000 + "@exemplo.com fim " + "y " * 3000
+
+    resultado = analisar_documento_longo(texto)
+
+    assert resultado["status"] != "PUBLICAR"
+    assert "email" in resultado["regras_degradadas"]
+    assert "@exemplo.com" not in resultado["texto_anonimizado"]
+
+
+def test_email_longo_dentro_da_ampliacao_e_identico():
+    texto = "z " * 9000 + "a" * (MAIOR_MATCH_DOCUMENTO_LONGO + 200) + "@exemplo.com fim " + "y " * 3000
+
+    assert analisar_documento_longo(texto) == analisar_texto(texto)
+
+
+def test_sequencia_de_nomes_sem_fim_e_cortada():
+    texto = "Nome: " + "Deabc " * 20_000
+
+    resultado = analisar_documento_longo(texto, janela=2_000)
+
+    assert resultado["status"] == "REVISAR"
+    assert resultado["regras_degradadas"] == ["nome_completo"]
+    assert len(resultado["texto_anonimizado"]) == len(texto.strip())
+
+
+def test_janela_pequena_equivale_a_varredura_completa():
+    texto = " ".join(
+        f"Pedido {i}: meu CPF é 529.982.247-25, telefone (61) 99999-{i:04d}, "
+        f"e-mail pessoa{i}@exemplo.com.br, CEP 70000-{i % 1000:03d} endereço Quadra {i}."
+        for i in range(300)
+    )
+
+    assert len(texto) > 4 * (MAIOR_MATCH_DOCUMENTO_LONGO + RAIO_CONTEXTO_MAX)
+    assert analisar_documento_longo(texto, janela=64) == analisar_texto(texto)
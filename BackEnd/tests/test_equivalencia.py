@@ -0,0 +1,77 @@
+# BackEnd/tests/test_equivalencia.py
+import os
+
+import pytest
+
+from src.core.indice_identificadores import indice_identificadores
+from tools.corpus import (
+    BACKEND_DIR,
+    DADOS_PADRAO,
+    carregar_referencia,
+    carregar_textos,
+    corpus_congelado,
+    hash_resultado,
+)
+from tools.equivalencia import (
+    CAMINHOS,
+    RAZAO_MIN,
+    VAZAO_MIN,
+    _busca_mesmo_tamanho,
+    _referencia,
+    _vazao,
+)
+
+pytestmark = pytest.mark.skipif(
+    indice_identificadores() is not None, reason="o oráculo é congelado sem SAFEDOC_INDICE_IDENTIFICADORES"
+)
+
+
+@pytest.fixture(scope="module")
+def csv():
+    return carregar_textos(os.path.join(BACKEND_DIR, DADOS_PADRAO))
+
+
+@pytest.fixture(scope="module")
+def corpus(csv):
+    return corpus_congelado(csv)
+
+
+@pytest.fixture(scope="module")
+def referencia():
+    return carregar_referencia()
+
+
+def _divergentes(textos, resultados, referencia):
+    return [t for t, r in zip(textos, resultados) if referencia.get(hash_resultado(t)) != hash_resultado(r)]
+
+
+def test_oraculo_igual_aos_hashes_congelados(corpus, referencia):
+    assert _divergentes(corpus, _referencia(corpus), referencia)[:3] == []
+
+
+@pytest.mark.parametrize("nome", sorted(CAMINHOS))
+def test_caminho_igual_ao_oraculo(nome, corpus, referencia):
+    caminho = CAMINHOS[nome]
+    textos = [t for t in corpus if _busca_mesmo_tamanho(t)] if caminho.exige_busca_mesmo_tamanho else corpus
+
+    resultados = caminho.executar(textos)
+
+    assert len(resultados) == len(textos)
+    assert _divergentes(textos, resultados, referencia)[:3] == []
+
+
+@pytest.fixture(scope="module")
+def vazao_oraculo(csv):
+    return _vazao(_referencia, csv, rodadas=3)
+
+
+@pytest.mark.vazao
+@pytest.mark.parametrize("nome", sorted(CAMINHOS))
+def test_vazao_acima_do_piso(nome, csv, vazao_oraculo):
+    caminho = CAMINHOS[nome]
+
+    vazao = _vazao(caminho.executar, csv, rodadas=3)
+
+    assert vazao >= VAZAO_MIN, f"{nome}: {vazao:.0f} linhas/s"
+    if caminho.otimizacao:
+        assert vazao >= RAZAO_MIN * vazao_oraculo, f"{nome}: {vazao / vazao_oraculo:.2f}x o oráculo"
@@ -0,0 +1,100 @@
+# BackEnd/tests/test_execucao.py
+import asyncio
+import threading
+import time
+
+import pandas as pd
+import pytest
+from fastapi import HTTPException
+from fastapi.testclient import TestClient
+
+from src.api import routes
+from src.api.execucao import ControleAdmissao
+from src.main import app
+
+
+def _csv(linhas: int) -> bytes:
+    textos = [f"Pedido {i}: CPF 529.982.247-25, telefone (61) 99999-{i % 10_000:04d}" for i in range(linhas)]
+    return pd.DataFrame({"descricao": textos}).to_csv(index=False).encode("utf-8")
+
+
+@pytest.fixture
+def cliente(monkeypatch):
+    # semáforo novo a cada teste: o do módulo fica preso ao event loop do primeiro TestClient
+    monkeypatch.setattr(routes, "admissao", ControleAdmissao(max_concorrentes=1, max_fila=0, retry_after=7))
+    with TestClient(app) as c:
+        yield c
+
+
+def test_fila_cheia_responde_429_com_retry_after():
+    async def cenario():
+        controle = ControleAdmissao(max_concorrentes=1, max_fila=1, retry_after=7)
+        liberar = asyncio.Event()
+
+        async def ocupar():
+            async with controle.vaga():
+                await liberar.wait()
+
+        tarefas = [asyncio.create_task(ocupar()) for _ in range(2)]  # uma roda, outra espera
+        await asyncio.sleep(0)
+        assert controle.aguardando == 1
+
+        with pytest.raises(HTTPException) as exc:
+            async with controle.vaga():
+                pass
+        liberar.set()
+        await asyncio.gather(*tarefas)
+        return exc.value
+
+    erro = asyncio.run(cenario())
+    assert erro.status_code == 429
+    assert erro.headers == {"Retry-After": "7"}
+
+
+def test_lote_acima_da_capacidade_recebe_429(cliente, monkeypatch):
+    iniciado = threading.Event()
+
+    async def em_processo_lento(fn, *args):
+        iniciado.set()
+        await asyncio.sleep(1)
+        return fn(*args)
+
+    monkeypatch.setattr(routes, "em_processo", em_processo_lento)
+    primeira = {}
+    t = threading.Thread(
+        target=lambda: primeira.update(r=cliente.post("/validate/csv", files={"file": ("a.csv", _csv(5), "text/csv")}))
+    )
+    t.start()
+    assert iniciado.wait(10)
+
+    r = cliente.post("/validate/csv", files={"file": ("b.csv", _csv(5), "text/csv")})
+    t.join()
+
+    assert r.status_code == 429
+    assert r.headers["retry-after"] == "7"
+    assert primeira["r"].status_code == 200
+
+
+def test_health_responde_durante_job_pesado(cliente):
+    cliente.post("/validate/csv", files={"file": ("aquecer.csv", _csv(5), "text/csv")})  # sobe o pool
+    latencias = []
+    fim = threading.Event()
+
+    def sondar():
+        while not fim.is_set():
+            inicio = time.perf_counter()
+            assert cliente.get("/health").status_code == 200
+            latencias.append(time.perf_counter() - inicio)
+            time.sleep(0.02)
+
+    t = threading.Thread(target=sondar)
+    t.start()
+    inicio = time.perf_counter()
+    r = cliente.post("/validate/csv", files={"file": ("a.csv", _csv(5_000), "text/csv")})
+    duracao = time.perf_counter() - inicio
+    fim.set()
+    t.join()
+
+    assert r.status_code == 200 and r.json()["total"] == 5_000
+    assert len(latencias) > 5
+    assert max(latencias) < min(0.5, duracao / 2)
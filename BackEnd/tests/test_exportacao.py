@@ -0,0 +1,79 @@
+# BackEnd/tests/test_exportacao.py
+import gzip
+import io
+
+import pandas as pd
+import pytest
+from fastapi.testclient import TestClient
+
+from src.core.detector import anonimizar_lote
+from src.main import app
+
+TEXTOS = [
+    "Meu CPF é 529.982.247-25",
+    "Solicito cópia do contrato de 2023.",
+    "Telefone para contato: (61) 99999-1234, falar com Maria Silva.",
+    "Meu CPF é 529.982.247-25",
+    "",
+]
+
+
+@pytest.fixture
+def cliente():
+    with TestClient(app) as c:
+        yield c
+
+
+def _csv(df):
+    return df.to_csv(index=False).encode("utf-8")
+
+
+def _exportar(cliente, corpo, **params):
+    return cliente.post("/export/csv", params=params, files={"file": ("pedidos.csv", corpo, "text/csv")})
+
+
+def _ler(conteudo):
+    return pd.read_csv(io.BytesIO(conteudo), dtype=str, keep_default_na=False)
+
+
+@pytest.mark.parametrize("comprimir", [False, True])
+def test_exporta_csv_igual_ao_anonimizar_lote(cliente, comprimir):
+    entrada = pd.DataFrame({"ID": [str(i) for i in range(len(TEXTOS))], "descricao": TEXTOS, "canal": "web"})
+
+    r = _exportar(cliente, _csv(entrada), gzip=comprimir)
+
+    assert r.status_code == 200
+    assert r.headers["content-disposition"] == f'attachment; filename="pedidos_anonimizado.csv{".gz" if comprimir else ""}"'
+    saida = _ler(gzip.decompress(r.content) if comprimir else r.content)
+    esperado = anonimizar_lote(TEXTOS)
+    assert list(saida.columns) == ["ID", "descricao", "canal", "status", "score"]
+    assert saida["descricao"].tolist() == [texto for texto, _, _ in esperado]
+    assert saida["status"].tolist() == [status for _, status, _ in esperado]
+    assert saida["score"].tolist() == [str(score) for _, _, score in esperado]
+    assert saida[["ID", "canal"]].equals(entrada[["ID", "canal"]])
+
+
+def test_csv_so_com_cabecalho_devolve_so_o_cabecalho(cliente):
+    r = _exportar(cliente, b"ID,descricao\n")
+
+    assert r.status_code == 200
+    assert r.content.decode("utf-8").splitlines() == ["ID,descricao,status,score"]
+
+
+def test_csv_sem_coluna_de_texto_e_400(cliente):
+    r = _exportar(cliente, b"ID,observacao\n1,Meu CPF e 529.982.247-25\n")
+
+    assert r.status_code == 400
+    assert r.json() == {"detail": "Nenhuma coluna de texto encontrada"}
+
+
+def test_csv_vazio_e_400(cliente):
+    assert _exportar(cliente, b"").status_code == 400
+
+
+@pytest.mark.parametrize("coluna", ["status", "score"])
+def test_coluna_de_saida_ja_existente_e_400(cliente, coluna):
+    r = _exportar(cliente, f"descricao,{coluna}\nMeu CPF é 529.982.247-25,original\n".encode("utf-8"))
+
+    assert r.status_code == 400
+    assert coluna in r.json()["detail"]
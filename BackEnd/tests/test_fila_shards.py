@@ -0,0 +1,155 @@
+# BackEnd/tests/test_fila_shards.py
+import json
+import os
+import time
+
+import pandas as pd
+import pytest
+
+from src.core import fila_shards
+from src.core.fila_shards import _Heartbeat, _liberar, _token, reivindicar
+
+
+@pytest.fixture
+def raiz(tmp_path):
+    csv = tmp_path / "acervo.csv"
+    textos = [f"Pedido {i}: CPF 529.982.247-25, telefone (61) 99999-{i:04d}" for i in range(30)] + ["nada"] * 10
+    pd.DataFrame({"descricao": textos}).to_csv(csv, index=False)
+    destino = str(tmp_path / "exec")
+    assert fila_shards.dividir([str(csv)], destino, linhas_por_shard=10, lease_s=60) == 4
+    return destino
+
+
+def _lease(raiz, shard):
+    return os.path.join(raiz, "leases", shard + ".lease")
+
+
+def _envelhecer(caminho, segundos):
+    antigo = time.time() - segundos
+    os.utime(caminho, (antigo, antigo))
+
+
+def test_execucao_completa_e_mescla(raiz, tmp_path):
+    assert fila_shards.trabalhar(raiz, "w1", espera_s=0) == 4
+    saida = str(tmp_path / "resultados.jsonl")
+
+    resumo = fila_shards.mesclar(raiz, saida)
+
+    assert resumo.total == 40
+    assert resumo.analises == 31  # "nada" é analisado uma vez por shard: só no último
+    with open(saida, encoding="utf-8") as f:
+        assert [json.loads(linha)["index"] for linha in f] == list(range(40))
+    assert os.listdir(os.path.join(raiz, "leases")) == []
+
+
+def test_lease_expirado_e_recuperado_com_token_novo(raiz):
+    manifesto, antigo = reivindicar(raiz, "lento")
+    _envelhecer(_lease(raiz, manifesto["id"]), 120)
+
+    recuperado, novo = reivindicar(raiz, "novo")
+
+    assert recuperado["id"] == manifesto["id"]
+    assert novo != antigo
+    assert _token(_lease(raiz, manifesto["id"])) == novo
+
+
+def test_worker_lento_nao_remove_nem_renova_lease_do_novo_dono(raiz):
+    manifesto, antigo = reivindicar(raiz, "lento")
+    lease = _lease(raiz, manifesto["id"])
+    _envelhecer(lease, 120)
+    _, novo = reivindicar(raiz, "novo")
+    _envelhecer(lease, 30)
+
+    with _Heartbeat(lease, antigo, intervalo=0.01) as heartbeat:
+        time.sleep(0.1)
+    assert fila_shards.processar_shard(raiz, manifesto, antigo) is None
+    _liberar(lease, antigo)
+
+    assert heartbeat.perdido
+    assert _token(lease) == novo
+    assert time.time() - os.stat(lease).st_mtime > 25  # heartbeat do worker lento não tocou o lease
+    assert not fila_shards.concluido(raiz, manifesto["id"])
+
+
+def test_lease_renovado_entre_stat_e_rename_e_devolvido(raiz, monkeypatch):
+    manifesto, token = reivindicar(raiz, "dono")
+    lease = _lease(raiz, manifesto["id"])
+    _envelhecer(lease, 120)
+
+    renomear = os.rename
+
+    def renomear_apos_heartbeat(origem, destino):
+        if origem == lease:
+            os.utime(lease)  # o dono renova logo depois do stat do outro worker
+        renomear(origem, destino)
+
+    monkeypatch.setattr(fila_shards.os, "rename", renomear_apos_heartbeat)
+    outro = reivindicar(raiz, "outro")
+
+    assert outro is not None and outro[0]["id"] != manifesto["id"]
+    assert _token(lease) == token
+    assert sorted(os.listdir(os.path.join(raiz, "leases"))) == sorted(
+        [manifesto["id"] + ".lease", outro[0]["id"] + ".lease"]
+    )
+
+
+def test_heartbeat_tolera_lease_fora_do_lugar_por_um_instante(raiz):
+    manifesto, token = reivindicar(raiz, "dono")
+    lease = _lease(raiz, manifesto["id"])
+    conferindo = lease + ".expirado.outro"
+
+    with _Heartbeat(lease, token, intervalo=0.05) as heartbeat:
+        os.rename(lease, conferindo)  # outro worker conferindo a idade
+        time.sleep(0.08)
+        os.rename(conferindo, lease)
+        _envelhecer(lease, 30)
+        time.sleep(0.5)
+
+    assert not heartbeat.perdido
+    assert time.time() - os.stat(lease).st_mtime < 5
+
+
+def test_shard_abandonado_no_bloco_seguinte_ao_perder_o_lease(raiz, monkeypatch):
+    manifesto, token = reivindicar(raiz, "lento")
+    heartbeat = _Heartbeat(_lease(raiz, manifesto["id"]), token, intervalo=60)
+    blocos = []
+
+    def analisar_e_perder_lease(df, *args, **kwargs):
+        blocos.append(len(df))
+        heartbeat.perdido = True
+        return analisar_dataframe(df, *args, **kwargs)
+
+    analisar_dataframe = fila_shards.analisar_dataframe
+    monkeypatch.setattr(fila_shards, "BLOCO_SHARD", 3)
+    monkeypatch.setattr(fila_shards, "analisar_dataframe", analisar_e_perder_lease)
+
+    assert fila_shards.processar_shard(raiz, manifesto, token, heartbeat) is None
+    assert blocos == [3]
+    assert os.listdir(os.path.join(raiz, "resultados")) == []
+
+
+def test_blocos_do_shard_nao_mudam_o_resultado(raiz, monkeypatch, tmp_path):
+    monkeypatch.setattr(fila_shards, "BLOCO_SHARD", 3)
+    assert fila_shards.trabalhar(raiz, "w1", espera_s=0) == 4
+
+    resumo = fila_shards.mesclar(raiz, str(tmp_path / "resultados.jsonl"))
+
+    assert resumo.total == 40
+    with open(tmp_path / "resultados.jsonl", encoding="utf-8") as f:
+        assert [json.loads(linha)["index"] for linha in f] == list(range(40))
+
+
+def test_reivindicar_confere_cada_shard_concluido_uma_vez(raiz, monkeypatch):
+    pendentes = list(fila_shards.manifestos(raiz))
+    for manifesto in pendentes[:2]:
+        fila_shards.processar_shard(raiz, manifesto)
+    conferidos = []
+    concluido = fila_shards.concluido
+    monkeypatch.setattr(fila_shards, "concluido", lambda r, shard: conferidos.append(shard) or concluido(r, shard))
+
+    primeiro, _ = reivindicar(raiz, "w1", pendentes)
+    segundo, _ = reivindicar(raiz, "w1", pendentes)
+
+    assert [m["id"] for m in pendentes] == ["shard-000002", "shard-000003"]
+    assert (primeiro["id"], segundo["id"]) == ("shard-000002", "shard-000003")
+    assert conferidos.count("shard-000000") == 1
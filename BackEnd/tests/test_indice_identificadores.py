@@ -0,0 +1,49 @@
+# BackEnd/tests/test_indice_identificadores.py
+import pytest
+
+from src.core import detector
+from src.core.detector import analisar_texto
+from src.core.indice_identificadores import PESSOAL, PUBLICO, IndiceIdentificadores, construir_indice
+
+TELEFONE = "(61) 99876-5432"
+
+
+@pytest.fixture
+def usar_indice(tmp_path, monkeypatch):
+    abertos = []
+
+    def _usar(entradas):
+        caminho = str(tmp_path / f"indice{len(abertos)}.bin")
+        construir_indice(entradas, caminho)
+        idx = IndiceIdentificadores(caminho)
+        abertos.append(idx)
+        monkeypatch.setattr(detector, "indice_identificadores", lambda: idx)
+        return idx
+
+    yield _usar
+    for idx in abertos:
+        idx.fechar()
+
+
+def _telefones(texto):
+    return [(m["valor_normalizado"], m["motivo"]) for m in analisar_texto(texto)["matches"] if m["tipo"] == "telefone"]
+
+
+@pytest.mark.parametrize("valor", [TELEFONE, "+55 " + TELEFONE, "55 61 998765432", "61998765432"])
+def test_chave_do_indice_ignora_o_ddi(valor, usar_indice):
+    indice = usar_indice([(PUBLICO, "telefone", "+55 " + TELEFONE)])
+
+    assert indice.consultar("telefone", valor) == PUBLICO
+    assert _telefones(f"Meu telefone é {valor}, obrigado.") == []
+
+
+@pytest.mark.parametrize("valor, esperado", [(TELEFONE, "61998765432"), ("+55 " + TELEFONE, "5561998765432")])
+def test_valor_normalizado_nao_depende_do_indice(valor, esperado, usar_indice):
+    texto = f"Meu telefone é {valor}, obrigado."
+    [(sem_indice, _)] = _telefones(texto)
+
+    usar_indice([(PESSOAL, "telefone", TELEFONE)])
+    [(com_indice, motivo)] = _telefones(texto)
+
+    assert sem_indice == com_indice == esperado
+    assert motivo == "identificador_conhecido"
@@ -0,0 +1,28 @@
+# BackEnd/tests/test_lote.py
+import logging
+
+import pandas as pd
+
+from src.core.detector import analisar_dataframe, analisar_lote, analisar_texto
+
+TEXTO = "Meu CPF é 529.982.247-25 e o e-mail fulano@exemplo.com.br"
+
+
+def test_linhas_repetidas_recebem_resultados_independentes():
+    resultados, resumo = analisar_lote([TEXTO, "  " + TEXTO, TEXTO + "\n"])
+
+    resultados[0]["matches"][0]["tipo"] = "alterado"
+    resultados[0]["matches"].clear()
+
+    assert resumo["textos_distintos"] == 1
+    assert resultados[1] == resultados[2] == analisar_texto(TEXTO)
+
+
+def test_analisar_dataframe_registra_a_deduplicacao(caplog):
+    df = pd.DataFrame({"descricao": [TEXTO, TEXTO, "outro texto", None]})
+
+    with caplog.at_level(logging.INFO, logger="src.core.detector"):
+        resultados = analisar_dataframe(df, "descricao")
+
+    assert [r["index"] for r in resultados] == [0, 1, 2, 3]
+    assert "4 linhas, 3 textos distintos (taxa de deduplicação 25.0%)" in caplog.text
@@ -0,0 +1,78 @@
+# BackEnd/tests/test_observabilidade.py
+import logging
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.api import observabilidade
+from src.main import app
+from src.utils.rastreio import profilador
+
+TOKEN = "segredo-de-teste"
+
+
+@pytest.fixture
+def cliente():
+    with TestClient(app) as c:
+        yield c
+
+
+@pytest.fixture
+def admin(monkeypatch, cliente):
+    monkeypatch.setattr(observabilidade, "ADMIN_TOKEN", TOKEN)
+    yield cliente
+    profilador.ativar(0)
+
+
+def _etapas(response):
+    return {parte.split(";")[0] for parte in response.headers["server-timing"].split(", ")}
+
+
+def test_server_timing_traz_as_etapas_do_motor(cliente):
+    r = cliente.post("/validate/text", json={"texto": "Meu CPF é 529.982.247-25"})
+
+    assert r.status_code == 200
+    assert {"normalizar_raw", "normalizar_busca", "regex.cpf", "validadores", "overlaps", "anonimizacao", "resposta", "total"} <= _etapas(r)
+
+
+def test_resposta_em_fluxo_sem_server_timing_e_medida_ate_o_fim(cliente, monkeypatch, caplog):
+    monkeypatch.setattr(observabilidade, "LIMIAR_REQUISICAO_LENTA_MS", 0)
+    csv = "descricao\nMeu CPF é 529.982.247-25\n".encode("utf-8")
+
+    with caplog.at_level(logging.WARNING, logger="src.api.observabilidade"):
+        r = cliente.post("/export/csv", files={"file": ("a.csv", csv, "text/csv")})
+
+    assert r.status_code == 200
+    assert "server-timing" not in r.headers
+    assert "Requisição lenta POST /export/csv" in caplog.text
+
+
+def test_rotas_admin_desligadas_sem_token_configurado(cliente, monkeypatch):
+    monkeypatch.setattr(observabilidade, "ADMIN_TOKEN", None)
+
+    assert cliente.get("/admin/profiler", headers={"X-Admin-Token": TOKEN}).status_code == 404
+
+
+@pytest.mark.parametrize("cabecalhos", [{}, {"X-Admin-Token": "errado"}])
+def test_rotas_admin_exigem_o_token(admin, cabecalhos):
+    assert admin.post("/admin/profiler", headers=cabecalhos).status_code == 403
+    assert admin.get("/admin/profiler", headers=cabecalhos).status_code == 403
+
+
+def test_profiler_perfila_as_proximas_requisicoes(admin):
+    cabecalhos = {"X-Admin-Token": TOKEN}
+    assert admin.post("/admin/profiler?requisicoes=2", headers=cabecalhos).json() == {"status": "ativo", "requisicoes": 2}
+
+    for _ in range(3):
+        admin.post("/validate/text", json={"texto": "Meu CPF é 529.982.247-25"})
+    relatorio = admin.get("/admin/profiler?ordenar_por=cumulative&limite=50", headers=cabecalhos).json()
+
+    assert relatorio["requisicoes_perfiladas"] == 2
+    assert relatorio["requisicoes_restantes"] == 0
+    assert "analisar_texto" in relatorio["perfil"]
+
+
+def test_ordenacao_invalida_do_profiler_responde_422(admin):
+    r = admin.get("/admin/profiler?ordenar_por=xx", headers={"X-Admin-Token": TOKEN})
+
+    assert r.status_code == 422
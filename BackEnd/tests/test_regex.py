@@ -0,0 +1,70 @@
+# BackEnd/tests/test_regex.py
+import random
+
+import pytest
+
+from src.core.config import PoliticaRisco
+from src.core.detector import REGRAS, analisar_texto
+from src.core.documento_longo import analisar_documento_longo
+from tools.bench_regex import PADROES_LEGADOS, SEPARADORES, TOKENS_EQUIVALENCIA
+
+PADROES = {r.nome: r.padrao for r in REGRAS}
+
+
+@pytest.mark.parametrize("nome", sorted(PADROES_LEGADOS))
+def test_padrao_reescrito_casa_os_mesmos_trechos(nome):
+    rng = random.Random(0)
+    legado, novo = PADROES_LEGADOS[nome], PADROES[nome]
+    tokens = TOKENS_EQUIVALENCIA[nome]
+
+    for _ in range(5_000):
+        texto = "".join(rng.choice(tokens) + rng.choice(SEPARADORES) for _ in range(rng.randint(1, 10)))
+        pos = rng.randint(0, len(texto))
+        assert [m.span() for m in novo.finditer(texto, pos)] == [m.span() for m in legado.finditer(texto, pos)], (texto, pos)
+
+
+@pytest.mark.parametrize(
+    "nome, texto",
+    [
+        ("nome_completo", "Requerente: Maria da Silva e Souza dos Santos"),
+        ("nome_completo", "Nome: Ana Maria de Oliveira Dasilva"),
+        ("nome_completo", "Esther E Ana de"),
+        ("email", "escreva para joao.silva+sic@exemplo.gov.br."),
+        ("email", "a.b@c@d.com e x@y"),
+    ],
+)
+def test_padrao_reescrito_casos_fixos(nome, texto):
+    assert [m.span() for m in PADROES[nome].finditer(texto)] == [m.span() for m in PADROES_LEGADOS[nome].finditer(texto)]
+
+
+def test_varredura_degradada_vai_para_revisar():
+    resultado = analisar_texto("Solicito informações sobre o contrato.", tempo_max_ms=0)
+
+    assert resultado["regras_degradadas"] == [r.nome for r in REGRAS]
+    assert resultado["status"] == "REVISAR"
+
+
+def test_varredura_degradada_respeita_politica():
+    politica = PoliticaRisco(revisar_se_varredura_incompleta=False)
+
+    resultado = analisar_texto("Solicito informações sobre o contrato.", politica=politica, tempo_max_ms=0)
+
+    assert resultado["regras_degradadas"]
+    assert resultado["status"] == "PUBLICAR"
+
+
+def test_varredura_sem_estouro_nao_degrada():
+    resultado = analisar_texto("Solicito informações sobre o contrato.")
+
+    assert "regras_degradadas" not in resultado
+    assert resultado["status"] == "PUBLICAR"
+
+
+def test_documento_longo_respeita_orcamento():
+    texto = "Solicito informações sobre o contrato. " * 2_000
+
+    resultado = analisar_documento_longo(texto, tempo_max_ms=0)
+
+    assert resultado["regras_degradadas"] == [r.nome for r in REGRAS]
+    assert resultado["status"] == "REVISAR"
+    assert "regras_degradadas" not in analisar_documento_longo(texto)
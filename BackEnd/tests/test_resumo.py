@@ -0,0 +1,35 @@
+# BackEnd/tests/test_resumo.py
+import pandas as pd
+
+from src.core.detector import analisar_dataframe, analisar_lote, analisar_texto, resumir_lote
+from src.core.resumo import ResumoLote
+from tools.corpus import gerar_textos
+
+TEXTOS = gerar_textos(400, semente=3) * 3 + ["", "CPF 529.982.247-25"]
+
+
+def test_resumir_lote_igual_ao_resumo_dos_resultados_completos():
+    esperado = ResumoLote()
+    for texto in dict.fromkeys(TEXTOS):
+        esperado.adicionar(analisar_texto(texto), TEXTOS.count(texto))
+
+    assert resumir_lote(TEXTOS) == esperado
+
+
+def test_analises_conta_textos_distintos_em_todos_os_caminhos():
+    _, dedup = analisar_lote(TEXTOS)
+    pelo_dataframe = ResumoLote()
+    analisar_dataframe(pd.DataFrame({"descricao": TEXTOS}), "descricao", resumo_lote=pelo_dataframe)
+
+    assert resumir_lote(TEXTOS).analises == pelo_dataframe.analises == dedup["textos_distintos"]
+    assert pelo_dataframe == resumir_lote(TEXTOS)
+
+
+def test_analise_sem_detalhe_nao_guarda_valores_nem_texto():
+    texto = "Meu CPF é 529.982.247-25"
+    completo = analisar_texto(texto)
+    resultado = analisar_texto(texto, detalhado=False)
+
+    assert "texto_anonimizado" not in resultado
+    assert resultado["matches"] == [{k: m[k] for k in ("tipo", "motivo", "score")} for m in completo["matches"]]
+    assert (resultado["status"], resultado["score"]) == (completo["status"], completo["score"])
@@ -0,0 +1,72 @@
+# BackEnd/tools/bench_lote.py
+"""
+Compara a análise texto a texto (`analisar_texto`) com a varredura concatenada
+(`analisar_textos_concatenados`) em linhas/s, conferindo que os resultados
+são idênticos.
+
+Os textos de data/input/*.csv são cortados em pedaços de `--tamanhos`
+caracteres para simular cargas de textos curtos.
+
+Uso (a partir de BackEnd/):
+    python -m tools.bench_lote
+    python -m tools.bench_lote --tamanhos 80 300 --repeticoes 10
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+from typing import List
+
+from src.core.detector import analisar_texto, analisar_textos_concatenados, normalizar_raw
+from tools.corpus import BACKEND_DIR, DADOS_PADRAO, carregar_textos
+
+
+def _pedacos(textos: List[str], tamanho: int) -> List[str]:
+    saida = []
+    for texto in textos:
+        for i in range(0, len(texto), tamanho):
+            pedaco = normalizar_raw(texto[i:i + tamanho])
+            if pedaco:
+                saida.append(pedaco)
+    return saida
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--dados", default=DADOS_PADRAO, help="glob relativo a BackEnd/")
+    parser.add_argument("--tamanhos", type=int, nargs="+", default=[80, 300, 1_000])
+    parser.add_argument("--repeticoes", type=int, default=5, help="multiplica o corpus")
+    parser.add_argument("--rodadas", type=int, default=3, help="melhor tempo de N rodadas alternadas")
+    args = parser.parse_args()
+
+    base = [normalizar_raw(t) for t in carregar_textos(os.path.join(BACKEND_DIR, args.dados))]
+    ok = True
+
+    print(f"{'tamanho':>8} {'linhas':>8} {'individual/s':>13} {'concatenado/s':>14} {'ganho':>7}  idêntico")
+    for tamanho in args.tamanhos:
+        textos = _pedacos(base, tamanho) * args.repeticoes
+
+        t_individual = t_concatenado = float("inf")
+        for _ in range(args.rodadas):
+            inicio = time.perf_counter()
+            individuais = [analisar_texto(t) for t in textos]
+            t_individual = min(t_individual, time.perf_counter() - inicio)
+
+            inicio = time.perf_counter()
+            concatenados = analisar_textos_concatenados(textos)
+            t_concatenado = min(t_concatenado, time.perf_counter() - inicio)
+
+        igual = individuais == concatenados
+        ok = ok and igual
+        print(
+            f"{tamanho:>8} {len(textos):>8} {len(textos) / t_individual:>13.0f} "
+            f"{len(textos) / t_concatenado:>14.0f} {t_individual / t_concatenado:>6.2f}x  {'sim' if igual else 'NÃO'}"
+        )
+
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
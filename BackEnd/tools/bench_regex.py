@@ -0,0 +1,157 @@
+# BackEnd/tools/bench_regex.py
+"""
+Benchmark de entradas patológicas para as regras de `REGRAS`.
+
+Para cada regra, mede o tempo de `finditer` sobre famílias de entradas
+adversariais em tamanhos crescentes e estima o expoente de crescimento
+(inclinação log-log). Regras acima de `--expoente-max` fazem o comando falhar.
+
+Com `--equivalencia`, compara os padrões reescritos (nome_completo, email) com
+as versões originais em entradas aleatórias curtas (onde o original ainda é rápido).
+
+Uso (a partir de BackEnd/):
+    python -m tools.bench_regex
+    python -m tools.bench_regex --equivalencia 200000
+"""
+from __future__ import annotations
+
+import argparse
+import math
+import random
+import re
+import sys
+import time
+from typing import Callable, Dict, List
+
+from src.core.detector import REGRAS, analisar_texto
+
+# versões originais (backtracking) dos padrões reescritos
+_F = re.IGNORECASE | re.UNICODE
+PADROES_LEGADOS: Dict[str, re.Pattern] = {
+    "nome_completo": re.compile(
+        r"\b(?:[A-ZÁÀÂÃÉÈÊÍÌÎÓÒÔÕÚÙÛÇ][a-záàâãéèêíìîóòôõúùûç]{2,}"
+        r"(?:\s+(?:de|da|do|dos|das|e))?){1,}"
+        r"\s+[A-ZÁÀÂÃÉÈÊÍÌÎÓÒÔÕÚÙÛÇ][a-záàâãéèêíìîóòôõúùûç]{2,}"
+        r"(?:\s+[A-ZÁÀÂÃÉÈÊÍÌÎÓÒÔÕÚÙÛÇ][a-záàâãéèêíìîóòôõúùûç]{2,}){0,3}\b",
+        _F,
+    ),
+    "email": re.compile(r"\b[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+(?:\.[a-zA-Z0-9-]+)+\b", _F),
+}
+
+# tokens usados para gerar entradas aleatórias de equivalência
+TOKENS_EQUIVALENCIA: Dict[str, List[str]] = {
+    "nome_completo": [
+        "Maria", "de", "dos", "do", "das", "da", "e", "E", "Esther", "Ana", "dasilva",
+        "Dosantos", "x", "Sa", "1", "ñu", "Silvañ", ",", "Abc-", "é", "ção", "DE", "edu", "aé",
+    ],
+    "email": list("ab1._+-@@ é,ſ") + ["com", ".br", "x@y.com", "gov"],
+}
+SEPARADORES = [" ", " ", " ", "  ", "\n", ", ", "-", ""]
+
+
+def _familias() -> Dict[str, Callable[[int], str]]:
+    """Entradas adversariais de tamanho ~n (sequências longas sem separação útil)."""
+    def rep(unidade: str) -> Callable[[int], str]:
+        return lambda n: unidade * max(1, n // len(unidade))
+
+    return {
+        "digitos": rep("1"),
+        "digitos_espaco": rep("12 "),
+        "digitos_ponto": rep("1."),
+        "digitos_hifen": rep("1-"),
+        "digitos_barra": rep("1/"),
+        "telefone_prefixos": rep("+55 (61) "),
+        "letras": rep("a"),
+        "maiusculas": rep("Abc "),
+        "conectores": lambda n: "Nome: " + rep("Maria de da dos e ")(n),
+        "email_sem_arroba": rep("a."),
+        "email_arrobas": rep("a.b@"),
+        "rotulos": rep("CDA PROTOCOLO NIRE "),
+    }
+
+
+def _medir(padrao, texto: str, repeticoes: int = 3) -> float:
+    melhor = math.inf
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        for _m in padrao.finditer(texto):
+            pass
+        melhor = min(melhor, time.perf_counter() - inicio)
+    return melhor
+
+
+def _expoente(tamanhos: List[int], tempos: List[float]) -> float:
+    # tempos muito pequenos são ruído de medição; trata como constante
+    t0 = max(tempos[0], 1e-4)
+    t1 = max(tempos[-1], 1e-4)
+    return math.log(t1 / t0) / math.log(tamanhos[-1] / tamanhos[0])
+
+
+def benchmark(tamanhos: List[int], expoente_max: float) -> bool:
+    ok = True
+    familias = _familias()
+
+    print(f"{'regra':<24} {'pior familia':<20} {'tempo max (ms)':>14} {'expoente':>9}")
+    for regra in REGRAS:
+        pior = ("", 0.0, -math.inf)
+        for nome_fam, gerar in familias.items():
+            tempos = [_medir(regra.padrao, gerar(n)) for n in tamanhos]
+            exp = _expoente(tamanhos, tempos)
+            if exp > pior[2]:
+                pior = (nome_fam, tempos[-1], exp)
+
+        marca = "" if pior[2] <= expoente_max else "  <-- NAO LINEAR"
+        ok = ok and pior[2] <= expoente_max
+        print(f"{regra.nome:<24} {pior[0]:<20} {pior[1] * 1000:>14.2f} {pior[2]:>9.2f}{marca}")
+
+    # pipeline completo (validadores + contexto) no maior tamanho
+    print()
+    for nome_fam, gerar in familias.items():
+        texto = gerar(tamanhos[-1])
+        inicio = time.perf_counter()
+        r = analisar_texto(texto, tempo_max_ms=None)
+        print(f"analisar_texto[{nome_fam}]: {(time.perf_counter() - inicio) * 1000:.1f} ms, {r['total_matches']} matches")
+
+    return ok
+
+
+def equivalencia(n: int, semente: int) -> bool:
+    rng = random.Random(semente)
+    padroes = {r.nome: r.padrao for r in REGRAS}
+    ok = True
+
+    for nome, legado in PADROES_LEGADOS.items():
+        novo = padroes[nome]
+        tokens = TOKENS_EQUIVALENCIA[nome]
+        for _ in range(n):
+            texto = "".join(
+                rng.choice(tokens) + rng.choice(SEPARADORES) for _ in range(rng.randint(1, 10))
+            )
+            pos = rng.randint(0, len(texto))
+            a = [m.span() for m in legado.finditer(texto, pos)]
+            b = [m.span() for m in novo.finditer(texto, pos)]
+            if a != b:
+                print(f"[{nome}] DIVERGENCIA em {texto!r} (pos={pos}): legado={a} novo={b}")
+                ok = False
+                break
+        else:
+            print(f"[{nome}] {n} entradas equivalentes")
+
+    return ok
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tamanhos", type=int, nargs="+", default=[10_000, 40_000, 160_000])
+    parser.add_argument("--expoente-max", type=float, default=1.3)
+    parser.add_argument("--equivalencia", type=int, metavar="N", help="compara padrões reescritos em N entradas")
+    parser.add_argument("--semente", type=int, default=0)
+    args = parser.parse_args()
+
+    if args.equivalencia:
+        return 0 if equivalencia(args.equivalencia, args.semente) else 1
+    return 0 if benchmark(sorted(args.tamanhos), args.expoente_max) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,82 @@
+# BackEnd/tools/construir_indice.py
+"""
+Gera o índice de identificadores conhecidos (src/core/indice_identificadores.py)
+a partir de CSVs.
+
+Cada CSV tem as colunas `lista` (publico|pessoal), `categoria`
+(cpf|cnpj|telefone|processo) e `valor`; com --lista/--categoria o valor fixo é
+usado para arquivos que não têm a coluna. Os valores podem vir formatados
+("(61) 3333-4444", "00.394.460/0001-41"): a normalização é a mesma da consulta.
+
+Uso (a partir de BackEnd/):
+    python -m tools.construir_indice identificadores.csv --saida indice.bin
+    python -m tools.construir_indice telefones_orgaos.csv --lista publico --categoria telefone --saida indice.bin
+    SAFEDOC_INDICE_IDENTIFICADORES=indice.bin uvicorn src.main:app
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from typing import Iterator, List, Optional, Tuple
+
+import pandas as pd
+
+from src.core.indice_identificadores import IndiceIdentificadores, construir_indice
+
+
+def ler_entradas(
+    arquivos: List[str],
+    lista: Optional[str],
+    categoria: Optional[str],
+    coluna_valor: str,
+    tamanho_bloco: int,
+) -> Iterator[Tuple[str, str, str]]:
+    for caminho in arquivos:
+        for bloco in pd.read_csv(caminho, dtype=str, chunksize=tamanho_bloco, keep_default_na=False):
+            if coluna_valor not in bloco.columns:
+                raise SystemExit(f"{caminho}: coluna {coluna_valor!r} não encontrada")
+            for nome, fixo in (("lista", lista), ("categoria", categoria)):
+                if fixo is None and nome not in bloco.columns:
+                    raise SystemExit(f"{caminho}: sem coluna {nome!r}; use --{nome}")
+
+            listas = [lista] * len(bloco) if lista else bloco["lista"].str.strip().str.lower()
+            categorias = [categoria] * len(bloco) if categoria else bloco["categoria"].str.strip().str.lower()
+            yield from zip(listas, categorias, bloco[coluna_valor])
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("arquivos", nargs="+", help="CSVs de entrada")
+    parser.add_argument("--saida", required=True, help="arquivo do índice (substituído atomicamente)")
+    parser.add_argument("--lista", choices=["publico", "pessoal"], help="lista fixa para todos os arquivos")
+    parser.add_argument("--categoria", help="categoria fixa para todos os arquivos")
+    parser.add_argument("--coluna-valor", default="valor")
+    parser.add_argument("--tamanho-bloco", type=int, default=1_000_000, help="linhas lidas por vez")
+    args = parser.parse_args()
+
+    inicio = time.perf_counter()
+    try:
+        contagens = construir_indice(
+            ler_entradas(args.arquivos, args.lista, args.categoria, args.coluna_valor, args.tamanho_bloco),
+            args.saida,
+        )
+    except ValueError as exc:
+        raise SystemExit(str(exc))
+    duracao = time.perf_counter() - inicio
+
+    indice = IndiceIdentificadores(args.saida)
+    print(json.dumps({
+        "saida": args.saida,
+        "assinatura": indice.assinatura,
+        "entradas": len(indice),
+        "secoes": contagens,
+        "segundos": round(duracao, 2),
+    }, ensure_ascii=False, indent=2))
+    indice.fechar()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
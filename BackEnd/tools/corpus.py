@@ -0,0 +1,189 @@
+# BackEnd/tools/corpus.py
+"""
+Utilitários de corpus compartilhados pelas ferramentas e pelos testes:
+- `carregar_textos`: textos da coluna de texto de CSVs (data/input/*.csv);
+- `gerar_textos`: textos gerados com semente (CPFs/CNPJs válidos e não,
+  telefones, CEPs, nomes, e-mails, processos, palavras-chave e ruído);
+- `corpus_congelado` e `hash_resultado`: o corpus fixo e o hash usados no
+  oráculo congelado em tools/referencia_detector.json.
+"""
+from __future__ import annotations
+
+import glob
+import hashlib
+import json
+import os
+import random
+from typing import Any, Callable, Dict, List
+
+import pandas as pd
+
+from src.core.config import TEXT_COLUMN_CANDIDATES
+from src.core.detector import (
+    GATILHOS_NOME,
+    KW_ORGAO_ENTIDADE,
+    PALAVRAS_CHAVE_RISCO,
+    PALAVRAS_NEGATIVAS_TELEFONE,
+    STOP_PHRASES_NOME,
+)
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DADOS_PADRAO = "data/input/*.csv"  # relativo a BackEnd/
+ARQUIVO_REFERENCIA = os.path.join(os.path.dirname(os.path.abspath(__file__)), "referencia_detector.json")
+CASOS_CONGELADOS = 300
+
+
+# =========================
+# CSVs
+# =========================
+
+def carregar_textos(padrao: str) -> List[str]:
+    textos: List[str] = []
+    for caminho in sorted(glob.glob(padrao)):
+        df = pd.read_csv(caminho)
+        coluna = next((c for c in df.columns if c.lower() in TEXT_COLUMN_CANDIDATES), None)
+        if coluna:
+            textos.extend(str(x) for x in df[coluna].fillna(""))
+    if not textos:
+        raise SystemExit(f"Nenhum texto encontrado em {padrao}")
+    return textos
+
+
+# =========================
+# Geração com semente
+# =========================
+
+def dv_cpf(base: str) -> str:
+    """Completa os 9 dígitos de `base` com os dois dígitos verificadores do CPF."""
+    for _ in range(2):
+        soma = sum(int(d) * p for d, p in zip(base, range(len(base) + 1, 1, -1)))
+        resto = soma % 11
+        base += "0" if resto < 2 else str(11 - resto)
+    return base
+
+
+def dv_cnpj(base: str) -> str:
+    """Completa os 12 dígitos de `base` com os dois dígitos verificadores do CNPJ."""
+    for pesos in ([5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2], [6, 5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2]):
+        resto = sum(int(d) * p for d, p in zip(base, pesos)) % 11
+        base += "0" if resto < 2 else str(11 - resto)
+    return base
+
+
+def _digitos(rng: random.Random, n: int) -> str:
+    return "".join(rng.choice("0123456789") for _ in range(n))
+
+
+def _cpf(rng: random.Random) -> str:
+    d = dv_cpf(_digitos(rng, 9)) if rng.random() < 0.7 else _digitos(rng, 11)
+    return rng.choice([d, f"{d[:3]}.{d[3:6]}.{d[6:9]}-{d[9:]}", f"{d[:3]}{d[3:6]}.{d[6:9]}-{d[9:]}"])
+
+
+def _cnpj(rng: random.Random) -> str:
+    d = dv_cnpj(_digitos(rng, 12)) if rng.random() < 0.7 else _digitos(rng, 14)
+    return rng.choice([d, f"{d[:2]}.{d[2:5]}.{d[5:8]}/{d[8:12]}-{d[12:]}"])
+
+
+def _telefone(rng: random.Random) -> str:
+    ddd = rng.choice(["61", "11", "21", "09", "99"])
+    numero = rng.choice(["9" + _digitos(rng, 8), rng.choice("2345") + _digitos(rng, 7)])
+    meio = len(numero) - 4
+    return rng.choice([
+        f"({ddd}) {numero[:meio]}-{numero[meio:]}",
+        f"+55 {ddd} {numero}",
+        f"{ddd}{numero}",
+        f"{numero[:meio]}-{numero[meio:]}",
+    ])
+
+
+def _cep(rng: random.Random) -> str:
+    d = _digitos(rng, 8)
+    return rng.choice([f"{d[:5]}-{d[5:]}", d])
+
+
+def _nome(rng: random.Random) -> str:
+    nomes = ["Maria", "José", "Ana", "João", "Antônio", "Francisca", "Conceição", "Luíza"]
+    sobrenomes = ["Silva", "Santos", "Oliveira", "Souza", "Araújo", "Gonçalves", "Pereira"]
+    partes = [rng.choice(nomes)]
+    for _ in range(rng.randint(1, 4)):
+        if rng.random() < 0.3:
+            partes.append(rng.choice(["da", "de", "dos", "do", "e"]))
+        partes.append(rng.choice(sobrenomes))
+    return " ".join(partes)
+
+
+def _email(rng: random.Random) -> str:
+    local = rng.choice(["joao.silva", "maria_2020", "a", "contato+sic", "x.y.z"])
+    dominio = rng.choice(["gmail.com", "df.gov.br", "empresa.com.br", "mail.xyz", "a.b"])
+    return f"{local}@{dominio}"
+
+
+def _processo(rng: random.Random) -> str:
+    return rng.choice([
+        f"{_digitos(rng, 5)}.{_digitos(rng, 6)}/{rng.choice(['2019', '2023'])}-{_digitos(rng, 2)}",
+        f"{_digitos(rng, 7)}-{_digitos(rng, 2)}.{_digitos(rng, 4)}.{_digitos(rng, 1)}.{_digitos(rng, 2)}.{_digitos(rng, 4)}",
+        f"{_digitos(rng, 5)}-{_digitos(rng, 8)}/{_digitos(rng, 4)}-{_digitos(rng, 2)}",
+    ])
+
+
+def _data(rng: random.Random) -> str:
+    return f"{rng.randint(1, 31):02d}/{rng.randint(1, 12):02d}/{rng.choice(['1987', '2023', '2101'])}"
+
+
+def _id_rotulado(rng: random.Random) -> str:
+    rotulo = rng.choice(["matrícula", "SIAPE", "NIRE", "PROTOCOLO", "inscrição", "RG", "CNH", "título de eleitor"])
+    return f"{rotulo}{rng.choice([' ', ': ', ' nº '])}{_digitos(rng, rng.randint(4, 12))}"
+
+
+def _ruido(rng: random.Random) -> str:
+    return rng.choice([
+        _digitos(rng, rng.randint(1, 16)),
+        "".join(rng.choice("abcdefghijklmnopqrstuvwxyzçãéí") for _ in range(rng.randint(1, 12))),
+        rng.choice(["-", "/", ".", ",", ":", "(", ")", "@", "#", "º", "°", "+"]),
+        rng.choice(["ß", "ﬁ", "İ", "ǅ", "😀", " ", "\t", "\n", "́", "¨", "ｱ"]),
+        rng.choice(["Secretaria", "ministério", "rua", "Avenida", "lote", "Quadra", "Bairro"]),
+    ])
+
+
+_FRAGMENTOS: List[Callable[[random.Random], str]] = [
+    _cpf, _cnpj, _telefone, _cep, _nome, _email, _processo, _data, _id_rotulado, _ruido, _ruido,
+    lambda rng: rng.choice(PALAVRAS_CHAVE_RISCO),
+    lambda rng: rng.choice(PALAVRAS_NEGATIVAS_TELEFONE),
+    lambda rng: rng.choice(GATILHOS_NOME) + " " + _nome(rng),
+    lambda rng: rng.choice(STOP_PHRASES_NOME),
+    lambda rng: rng.choice(KW_ORGAO_ENTIDADE).capitalize() + " de " + _nome(rng),
+]
+_SEPARADORES = [" ", " ", " ", ", ", "; ", ": ", "\n", "  ", "-", "", "."]
+
+
+def gerar_texto(rng: random.Random) -> str:
+    partes = []
+    for _ in range(rng.randint(0, 14)):
+        partes.append(rng.choice(_FRAGMENTOS)(rng))
+        partes.append(rng.choice(_SEPARADORES))
+    return "".join(partes)
+
+
+def gerar_textos(n: int, semente: int) -> List[str]:
+    rng = random.Random(semente)
+    return [gerar_texto(rng) for _ in range(n)]
+
+
+# =========================
+# Oráculo congelado
+# =========================
+
+def hash_resultado(valor: Any) -> str:
+    return hashlib.blake2b(
+        json.dumps(valor, ensure_ascii=False, sort_keys=True, default=str).encode("utf-8"), digest_size=12
+    ).hexdigest()
+
+
+def corpus_congelado(csv: List[str]) -> List[str]:
+    return csv + gerar_textos(CASOS_CONGELADOS, semente=0)
+
+
+def carregar_referencia() -> Dict[str, str]:
+    """hash do texto -> hash do resultado de `analisar_texto` (gravado por `equivalencia --congelar`)."""
+    with open(ARQUIVO_REFERENCIA, encoding="utf-8") as f:
+        return json.load(f)["resultados"]
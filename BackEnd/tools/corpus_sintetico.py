@@ -0,0 +1,431 @@
+# BackEnd/tools/corpus_sintetico.py
+"""
+Corpus sintético rotulado no estilo dos pedidos e-SIC, para medir vazão,
+memória e acurácia em escala.
+
+`gerar` escreve N pedidos em CSV (opcionalmente .gz) ou Parquet, em blocos
+(memória limitada). Cada linha tem:
+- "Texto Mascarado": o pedido (já normalizado: espaços simples, então os
+  offsets coincidem com os de `texto_anonimizado`);
+- "y_true": 1 se algum dado plantado identifica uma pessoa;
+- "entidades": JSON com [inicio, fim, tipo, pessoal] de cada dado plantado.
+
+São plantados CPFs/CNPJs com DV válido e inválido, telefones com e sem DDD,
+CEPs com e sem contexto de endereço, nomes com e sem gatilho, razões sociais
+(rotuladas como não pessoais), matrículas, e-mails (parte local em ASCII),
+datas de nascimento, processos SEI/CNJ e iscas (números em torno de palavras
+negativas como protocolo, NIRE, empenho). A linha i depende só de
+(semente, i): o mesmo comando gera o mesmo arquivo, e `--inicio` gera um trecho.
+
+`avaliar` lê o arquivo em blocos, roda `analisar_lote` e reporta
+`gerar_relatorio_metricas` (y_pred = status diferente de PUBLICAR), a taxa de
+detecção por tipo de entidade (span inteiro mascarado), linhas/s e RSS máximo.
+
+Uso (a partir de BackEnd/):
+    python -m tools.corpus_sintetico gerar --linhas 1000000 --saida corpus.csv.gz
+    python -m tools.corpus_sintetico gerar --linhas 5000000 --saida corpus.parquet   # requer pyarrow
+    python -m tools.corpus_sintetico avaliar corpus.csv.gz
+"""
+from __future__ import annotations
+
+import argparse
+import csv
+import gzip
+import json
+import random
+import re
+import resource
+import sys
+import time
+import unicodedata
+from array import array
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+import pandas as pd
+
+from src.core.detector import analisar_lote
+from src.utils.metrics import gerar_relatorio_metricas
+from tools.corpus import dv_cnpj, dv_cpf
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # opcional: só para --saida .parquet
+    pa = pq = None
+
+COLUNA_TEXTO = "Texto Mascarado"
+COLUNAS = ["ID", COLUNA_TEXTO, "y_true", "entidades"]
+
+
+# =========================
+# Valores
+# =========================
+
+NOMES = [
+    "Maria", "José", "Ana", "João", "Antônio", "Francisca", "Carlos", "Paulo", "Adriana", "Lúcia",
+    "Marcos", "Juliana", "Raimundo", "Conceição", "Luíza", "Pedro", "Fernanda", "Sebastião", "Aparecida", "Rafael",
+]
+SOBRENOMES = [
+    "Silva", "Santos", "Oliveira", "Souza", "Rodrigues", "Ferreira", "Alves", "Pereira", "Lima", "Gomes",
+    "Costa", "Ribeiro", "Martins", "Carvalho", "Araújo", "Gonçalves", "Rocha", "Barbosa", "Cardoso", "Nascimento",
+]
+CONECTORES = ["da", "de", "dos", "do"]
+LOGRADOUROS = [
+    "QNM {n} Conjunto {l} Casa {n2}", "SQS {n}{n2} Bloco {l} apartamento {n}0{n2}", "Rua {n} Lote {n2}",
+    "Quadra {n} Conjunto {l} Lote {n2}", "Avenida Central Lote {n}{n2}", "QI {n} Conjunto {l} Casa {n2}",
+]
+BAIRROS = ["Asa Sul", "Asa Norte", "Taguatinga", "Ceilândia", "Sobradinho", "Guará", "Samambaia", "Planaltina", "Gama"]
+DOMINIOS = ["gmail.com", "hotmail.com", "yahoo.com.br", "outlook.com", "uol.com.br", "bol.com.br"]
+ORGAOS = [
+    "Secretaria de Saúde", "Caesb", "Detran", "Secretaria de Educação", "Administração Regional",
+    "Neoenergia", "Defensoria Pública", "Polícia Civil", "Secretaria de Economia", "Agência de Fiscalização",
+]
+
+
+def _d(rng: random.Random, n: int) -> str:
+    return "".join(rng.choice("0123456789") for _ in range(n))
+
+
+def _dv_errado(certo: str) -> str:
+    return certo[:-1] + str((int(certo[-1]) + 1) % 10)
+
+
+def _cpf(rng: random.Random, valido: bool = True) -> str:
+    d = dv_cpf(_d(rng, 9))
+    if not valido:
+        d = _dv_errado(d)
+    return rng.choice([f"{d[:3]}.{d[3:6]}.{d[6:9]}-{d[9:]}", f"{d[:9]}-{d[9:]}", d])
+
+
+def _cnpj(rng: random.Random, valido: bool = True) -> str:
+    d = dv_cnpj(_d(rng, 8) + "0001")
+    if not valido:
+        d = _dv_errado(d)
+    return rng.choice([f"{d[:2]}.{d[2:5]}.{d[5:8]}/{d[8:12]}-{d[12:]}", d])
+
+
+def _telefone(rng: random.Random, com_ddd: bool = True) -> str:
+    numero = rng.choice(["9" + _d(rng, 8), rng.choice("2345") + _d(rng, 7)])
+    corpo = rng.choice([f"{numero[:-4]}-{numero[-4:]}", numero])
+    if not com_ddd:
+        return corpo
+    ddd = rng.choice(["61", "61", "61", "11", "62", "21"])
+    return rng.choice([f"({ddd}) {corpo}", f"{ddd} {corpo}", f"+55 {ddd} {corpo}"])
+
+
+def _cep(rng: random.Random) -> str:
+    d = "7" + _d(rng, 7)
+    return rng.choice([f"{d[:5]}-{d[5:]}", d])
+
+
+def _nome(rng: random.Random) -> str:
+    partes = [rng.choice(NOMES)]
+    for _ in range(rng.randint(1, 3)):
+        if rng.random() < 0.3:
+            partes.append(rng.choice(CONECTORES))
+        partes.append(rng.choice(SOBRENOMES))
+    return " ".join(partes)
+
+
+def _ascii(s: str) -> str:
+    return unicodedata.normalize("NFKD", s).encode("ascii", "ignore").decode("ascii")
+
+
+def _email(rng: random.Random) -> str:
+    nome = rng.choice(NOMES).lower()
+    sobrenome = rng.choice(SOBRENOMES).lower()
+    local = rng.choice([f"{nome}.{sobrenome}", f"{nome}{rng.randint(1, 99)}", f"{nome}_{sobrenome}{rng.randint(1970, 2005)}"])
+    return f"{_ascii(local)}@{rng.choice(DOMINIOS)}"
+
+
+def _matricula(rng: random.Random) -> str:
+    return rng.choice([f"{_d(rng, 2)}.{_d(rng, 3)}-{_d(rng, 1)}", _d(rng, 7), f"{_d(rng, 3)}.{_d(rng, 3)}-{_d(rng, 1)}"])
+
+
+def _sei(rng: random.Random) -> str:
+    return rng.choice([
+        f"{_d(rng, 5)}-{_d(rng, 8)}/{rng.randint(2010, 2025)}-{_d(rng, 2)}",
+        f"{_d(rng, 5)}.{_d(rng, 6)}/{rng.randint(2010, 2025)}-{_d(rng, 2)}",
+    ])
+
+
+def _cnj(rng: random.Random) -> str:
+    return f"{_d(rng, 7)}-{_d(rng, 2)}.{rng.randint(2010, 2025)}.8.07.{_d(rng, 4)}"
+
+
+def _data(rng: random.Random) -> str:
+    return f"{rng.randint(1, 28):02d}/{rng.randint(1, 12):02d}/{rng.randint(1940, 2006)}"
+
+
+def _endereco(rng: random.Random) -> str:
+    modelo = rng.choice(LOGRADOUROS)
+    return modelo.format(n=rng.randint(1, 30), n2=rng.randint(1, 9), l=rng.choice("ABCDEFGH"))
+
+
+# slot -> gerador; entidades devolvem (valor, tipo, pessoal), o resto só texto
+SLOTS: Dict[str, Callable[[random.Random], Any]] = {
+    "cpf": lambda rng: (_cpf(rng), "cpf", 1),
+    "cpf_dv_invalido": lambda rng: (_cpf(rng, valido=False), "cpf_dv_invalido", 1),
+    "cnpj": lambda rng: (_cnpj(rng), "cnpj", 0),
+    "cnpj_dv_invalido": lambda rng: (_cnpj(rng, valido=False), "cnpj_dv_invalido", 0),
+    "telefone": lambda rng: (_telefone(rng), "telefone", 1),
+    "telefone_sem_ddd": lambda rng: (_telefone(rng, com_ddd=False), "telefone_sem_ddd", 1),
+    "cep": lambda rng: (_cep(rng), "cep", 1),
+    "cep_sem_contexto": lambda rng: (_cep(rng), "cep_sem_contexto", 0),
+    "nome": lambda rng: (_nome(rng), "nome", 1),
+    "nome_sem_gatilho": lambda rng: (_nome(rng), "nome_sem_gatilho", 1),
+    "razao_social": lambda rng: (f"{_nome(rng)} LTDA", "razao_social", 0),
+    "matricula": lambda rng: (_matricula(rng), "matricula", 1),
+    "email": lambda rng: (_email(rng), "email", 1),
+    "data_nascimento": lambda rng: (_data(rng), "data_nascimento", 1),
+    "sei": lambda rng: (_sei(rng), "processo_sei", 0),
+    "cnj": lambda rng: (_cnj(rng), "processo_cnj", 0),
+    "isca": lambda rng: (_d(rng, rng.choice([8, 10, 11, 12])), "isca", 0),
+    "endereco": _endereco,
+    "bairro": lambda rng: rng.choice(BAIRROS),
+    "orgao": lambda rng: rng.choice(ORGAOS),
+    "ano": lambda rng: str(rng.randint(2005, 2025)),
+    "mes": lambda rng: rng.choice(["janeiro", "março", "maio", "julho", "setembro", "novembro"]),
+    "numero": lambda rng: str(rng.randint(2, 400)),
+}
+
+
+# =========================
+# Modelos de frase
+# =========================
+
+ABERTURAS = [
+    "Prezados, boa tarde.", "Bom dia!", "Prezados senhores,", "Boa tarde!", "Olá.",
+    "Ilustríssimo Senhor Ouvidor,", "Prezados, bom dia.", "Senhores,",
+]
+FECHAMENTOS = [
+    "Atenciosamente.", "Obrigado.", "Grato pela atenção.", "Aguardo retorno.", "Desde já agradeço.",
+    "Obrigada pela atenção.", "Fico no aguardo.",
+]
+NEUTRAS = [
+    "Solicito cópia do contrato firmado pela {orgao} em {ano} para manutenção da frota.",
+    "Gostaria de saber quantos servidores estão lotados na {orgao} atualmente.",
+    "Venho solicitar informações sobre o cronograma de obras previsto para {mes} de {ano}.",
+    "Solicito a relação de despesas com diárias e passagens do exercício de {ano}.",
+    "Qual o valor total gasto com publicidade institucional em {ano}?",
+    "Peço acesso às atas das reuniões do conselho realizadas em {mes} de {ano}.",
+    "Gostaria de informações sobre a fila de espera para cirurgias eletivas.",
+    "Solicito o quantitativo de vagas ofertadas nas escolas da região em {ano}.",
+    "Quais critérios foram usados na licitação de {ano} para a compra de medicamentos?",
+    "Solicito informação sobre a existência de bens tombados no {bairro}.",
+    "Gostaria de saber por que a linha de ônibus {numero} deixou de circular no {bairro}.",
+    "Peço a lista de imóveis públicos desocupados no {bairro}.",
+    "A {orgao} possui plano de contingência para o período de chuvas?",
+    "Solicito o relatório de fiscalização das obras da {orgao} referente a {ano}.",
+    "Gostaria de obter os dados de atendimento do posto de saúde do {bairro} em {ano}.",
+]
+COM_PII = [
+    "Nome: {nome}, CPF {cpf}.",
+    "Requerente: {nome}, portador do CPF {cpf}.",
+    "Solicito o histórico de consumo sob o CPF: {cpf_dv_invalido}.",
+    "Meu CPF é {cpf} e preciso da segunda via do boleto.",
+    "Telefone para contato: {telefone}.",
+    "Podem me ligar no {telefone} ou pelo e-mail {email}.",
+    "Meu celular é {telefone_sem_ddd}.",
+    "Resido na {endereco}, {bairro}, CEP {cep}.",
+    "Endereço: {endereco}, {bairro}, CEP: {cep}.",
+    "Solicito a declaração de exercício findo da servidora {nome_sem_gatilho} (matrícula {matricula}).",
+    "Servidor: {nome}, matrícula {matricula}, lotado na {orgao}.",
+    "Interessada: {nome}, nascida em {data_nascimento}.",
+    "Meu e-mail para resposta é {email}.",
+    "Conversei por telefone com {nome_sem_gatilho} e não obtive resposta.",
+    "Paciente: {nome}, data de nascimento {data_nascimento}.",
+    "A empresa {razao_social}, CNPJ {cnpj}, prestou o serviço.",
+    "O fornecedor de CNPJ {cnpj_dv_invalido} não entregou o material.",
+    "Solicito acesso ao processo SEI {sei}, do qual sou parte.",
+    "Peço informações sobre o processo judicial {cnj}.",
+]
+ISCAS = [
+    "O protocolo do atendimento anterior é {isca}.",
+    "Consta no sistema o NIRE {isca} da empresa.",
+    "A nota fiscal {isca} não foi paga.",
+    "O empenho {isca} foi cancelado?",
+    "Protocolo nº {isca}, aberto em {mes} de {ano}.",
+    "O código do formulário é {cep_sem_contexto}.",
+    "Referência {cep_sem_contexto} do edital.",
+    "Solicito acesso integral aos autos do processo SEI {sei}.",
+]
+
+_SLOT = re.compile(r"\{(\w+)\}")
+
+
+def _preencher(modelo: str, rng: random.Random, inicio: int, entidades: List[List[Any]]) -> str:
+    partes: List[str] = []
+    pos = inicio
+    for i, trecho in enumerate(_SLOT.split(modelo)):
+        if i % 2 == 1:
+            valor = SLOTS[trecho](rng)
+            if isinstance(valor, tuple):
+                valor, tipo, pessoal = valor
+                entidades.append([pos, pos + len(valor), tipo, pessoal])
+            trecho = valor
+        partes.append(trecho)
+        pos += len(trecho)
+    return "".join(partes)
+
+
+def gerar_linha(semente: int, i: int, prob_pii: float = 0.4, prob_isca: float = 0.3) -> Dict[str, Any]:
+    """Linha i do corpus (determinística em função de semente e i)."""
+    rng = random.Random(semente * 2**40 + i)
+
+    corpo = [rng.choice(NEUTRAS) for _ in range(rng.randint(1, 3))]
+    if rng.random() < prob_pii:
+        corpo += [rng.choice(COM_PII) for _ in range(rng.randint(1, 3))]
+    if rng.random() < prob_isca:
+        corpo.append(rng.choice(ISCAS))
+    rng.shuffle(corpo)
+
+    modelos = ([rng.choice(ABERTURAS)] if rng.random() < 0.8 else []) + corpo
+    if rng.random() < 0.7:
+        modelos.append(rng.choice(FECHAMENTOS))
+
+    entidades: List[List[Any]] = []
+    frases: List[str] = []
+    pos = 0
+    for modelo in modelos:
+        frase = _preencher(modelo, rng, pos, entidades)
+        frases.append(frase)
+        pos += len(frase) + 1
+
+    return {
+        "ID": i + 1,
+        COLUNA_TEXTO: " ".join(frases),
+        "y_true": int(any(e[3] for e in entidades)),
+        "entidades": json.dumps(entidades, ensure_ascii=False),
+    }
+
+
+def gerar_blocos(linhas: int, semente: int, inicio: int, bloco: int, **probs: float) -> Iterator[List[Dict[str, Any]]]:
+    for base in range(inicio, inicio + linhas, bloco):
+        yield [gerar_linha(semente, i, **probs) for i in range(base, min(base + bloco, inicio + linhas))]
+
+
+# =========================
+# Escrita / leitura em blocos
+# =========================
+
+def escrever(caminho: str, blocos: Iterator[List[Dict[str, Any]]]) -> int:
+    total = 0
+    if caminho.endswith(".parquet"):
+        if pq is None:
+            raise SystemExit("Saída Parquet requer pyarrow (pip install pyarrow)")
+        esquema = pa.schema([("ID", pa.int64()), (COLUNA_TEXTO, pa.string()), ("y_true", pa.int8()), ("entidades", pa.string())])
+        with pq.ParquetWriter(caminho, esquema, compression="zstd") as escritor:
+            for linhas in blocos:
+                escritor.write_table(pa.Table.from_pylist(linhas, schema=esquema))
+                total += len(linhas)
+        return total
+
+    abrir = gzip.open if caminho.endswith(".gz") else open
+    with abrir(caminho, "wt", encoding="utf-8", newline="") as f:
+        escritor = csv.DictWriter(f, fieldnames=COLUNAS)
+        escritor.writeheader()
+        for linhas in blocos:
+            escritor.writerows(linhas)
+            total += len(linhas)
+    return total
+
+
+def ler_blocos(caminho: str, bloco: int) -> Iterator[pd.DataFrame]:
+    if caminho.endswith(".parquet"):
+        if pq is None:
+            raise SystemExit("Leitura Parquet requer pyarrow (pip install pyarrow)")
+        for lote in pq.ParquetFile(caminho).iter_batches(batch_size=bloco):
+            yield lote.to_pandas()
+        return
+    yield from pd.read_csv(caminho, chunksize=bloco, dtype={COLUNA_TEXTO: str}, keep_default_na=False)
+
+
+# =========================
+# Avaliação
+# =========================
+
+def avaliar(caminho: str, bloco: int, limite: Optional[int]) -> Dict[str, Any]:
+    y_true = array("b")
+    y_pred = array("b")
+    por_tipo: Dict[str, Dict[str, int]] = {}
+    inicio = time.perf_counter()
+
+    for df in ler_blocos(caminho, bloco):
+        if limite is not None:
+            df = df.iloc[: max(0, limite - len(y_true))]
+            if df.empty:
+                break
+
+        resultados, _ = analisar_lote(df[COLUNA_TEXTO])
+        for verdade, entidades, r in zip(df["y_true"], df["entidades"], resultados):
+            y_true.append(int(verdade))
+            y_pred.append(int(r["status"] != "PUBLICAR"))
+
+            anon = r["texto_anonimizado"]
+            for ini, fim, tipo, pessoal in json.loads(entidades):
+                c = por_tipo.setdefault(tipo, {"pessoal": pessoal, "total": 0, "mascarado": 0, "parcial": 0})
+                c["total"] += 1
+                mascarados = anon.count("*", ini, fim)
+                if mascarados == fim - ini:
+                    c["mascarado"] += 1
+                elif mascarados:
+                    c["parcial"] += 1
+
+    duracao = time.perf_counter() - inicio
+    metricas = gerar_relatorio_metricas(pd.DataFrame({"y_true": y_true, "y_pred": y_pred}))
+
+    return {
+        "linhas": len(y_true),
+        "segundos": round(duracao, 2),
+        "linhas_por_s": round(len(y_true) / duracao, 1) if duracao else 0.0,
+        "rss_max_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+        "metricas": metricas,
+        # pessoal=1: taxa = recall do tipo; pessoal=0: taxa = falsos positivos do tipo
+        "entidades": {
+            tipo: {**c, "taxa_mascarado": round(c["mascarado"] / c["total"], 4)}
+            for tipo, c in sorted(por_tipo.items())
+        },
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    sub = parser.add_subparsers(dest="comando", required=True)
+
+    p_gerar = sub.add_parser("gerar", help="gera o corpus")
+    p_gerar.add_argument("--linhas", type=int, required=True)
+    p_gerar.add_argument("--saida", required=True, help=".csv, .csv.gz ou .parquet")
+    p_gerar.add_argument("--semente", type=int, default=0)
+    p_gerar.add_argument("--inicio", type=int, default=0, help="índice da primeira linha (gera um trecho)")
+    p_gerar.add_argument("--bloco", type=int, default=50_000, help="linhas por bloco escrito")
+    p_gerar.add_argument("--prob-pii", type=float, default=0.4, help="chance de um pedido conter dados pessoais")
+    p_gerar.add_argument("--prob-isca", type=float, default=0.3, help="chance de um pedido conter iscas")
+
+    p_avaliar = sub.add_parser("avaliar", help="roda o detector sobre o corpus e mede acurácia/vazão")
+    p_avaliar.add_argument("arquivo")
+    p_avaliar.add_argument("--bloco", type=int, default=20_000, help="linhas lidas por vez")
+    p_avaliar.add_argument("--limite", type=int, help="avalia só as primeiras N linhas")
+
+    args = parser.parse_args()
+
+    if args.comando == "gerar":
+        inicio = time.perf_counter()
+        blocos = gerar_blocos(
+            args.linhas, args.semente, args.inicio, args.bloco, prob_pii=args.prob_pii, prob_isca=args.prob_isca
+        )
+        total = escrever(args.saida, blocos)
+        duracao = time.perf_counter() - inicio
+        print(json.dumps({
+            "saida": args.saida,
+            "linhas": total,
+            "segundos": round(duracao, 2),
+            "linhas_por_s": round(total / duracao, 1) if duracao else 0.0,
+        }, ensure_ascii=False, indent=2))
+    else:
+        print(json.dumps(avaliar(args.arquivo, args.bloco, args.limite), ensure_ascii=False, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,337 @@
+# BackEnd/tools/equivalencia.py
+"""
+Teste diferencial: o oráculo é `tools.oraculo.analisar_texto`, uma cópia
+congelada do detector anterior às otimizações, e cada caminho do motor atual
+(inclusive o próprio `analisar_texto`) precisa devolver exatamente o mesmo
+resultado (status, score, matches e texto_anonimizado).
+
+Entradas:
+- os textos de data/input/*.csv;
+- textos gerados com semente: misturas de CPFs/CNPJs (válidos e não),
+  telefones, CEPs, nomes, e-mails, processos, palavras-chave e ruído.
+
+`--congelar` grava em tools/referencia_detector.json o hash do resultado do
+oráculo para cada texto do corpus fixo (CSVs + geração com semente 0); se a
+cópia em tools/oraculo/ for editada sem um novo `--congelar`, o comando falha.
+
+Na primeira divergência o comando minimiza a entrada (menor lista de textos,
+depois menor texto) e imprime um reprodutor. `--vazao` imprime linhas/s de cada
+caminho nos CSVs; os pisos de vazão (VAZAO_MIN, RAZAO_MIN) são conferidos no
+pytest (tests/test_equivalencia.py, marcador `vazao`).
+
+Uso (a partir de BackEnd/):
+    python -m tools.equivalencia
+    python -m tools.equivalencia --casos 5000 --semente 7 --caminhos lote armazem_reuso
+    python -m tools.equivalencia --vazao
+    python -m tools.equivalencia --congelar     # após atualizar tools/oraculo/
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import re
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from src.core import detector
+from src.core.armazem import ArmazemAnalises
+from src.core.detector import (
+    analisar_lote,
+    analisar_texto,
+    analisar_textos_concatenados,
+    normalizar_busca,
+    normalizar_raw,
+)
+from src.core.documento_longo import analisar_documento_longo
+from src.core.indice_identificadores import indice_identificadores
+from tools import oraculo
+from tools.corpus import (
+    ARQUIVO_REFERENCIA,
+    BACKEND_DIR,
+    DADOS_PADRAO,
+    carregar_referencia,
+    carregar_textos,
+    corpus_congelado,
+    gerar_textos,
+    hash_resultado,
+)
+
+Resultados = List[Dict[str, Any]]
+
+VAZAO_MIN = 200.0  # piso absoluto (linhas/s) de qualquer caminho
+RAZAO_MIN = 0.7    # piso das otimizações em relação ao oráculo
+
+
+# =========================
+# Caminhos alternativos
+# =========================
+
+@dataclass
+class Caminho:
+    nome: str
+    executar: Callable[[List[str]], Resultados]
+    otimizacao: bool = True                 # sujeito a RAZAO_MIN
+    exige_busca_mesmo_tamanho: bool = False  # limitação documentada do caminho
+
+
+def _referencia(textos: List[str]) -> Resultados:
+    return [oraculo.analisar_texto(t) for t in textos]
+
+
+def _texto_a_texto(textos: List[str]) -> Resultados:
+    return [analisar_texto(t) for t in textos]
+
+
+def _lote(textos: List[str]) -> Resultados:
+    return analisar_lote(textos)[0]
+
+
+def _concatenado_buffer_pequeno(textos: List[str]) -> Resultados:
+    # buffers de poucos textos: exercita as emendas e a tabela de offsets
+    original = detector.LOTE_CONCATENADO_MAX_CHARS
+    detector.LOTE_CONCATENADO_MAX_CHARS = 64
+    try:
+        return analisar_textos_concatenados([normalizar_raw(t) for t in textos])
+    finally:
+        detector.LOTE_CONCATENADO_MAX_CHARS = original
+
+
+def _documento_longo(textos: List[str]) -> Resultados:
+    # janela pequena: quase todo match atravessa alguma emenda
+    return [analisar_documento_longo(t, janela=64) for t in textos]
+
+
+def _armazem(reprocessar: bool) -> Callable[[List[str]], Resultados]:
+    def _executar(textos: List[str]) -> Resultados:
+        with tempfile.TemporaryDirectory() as pasta:
+            caminho = os.path.join(pasta, "armazem.sqlite")
+            with ArmazemAnalises(caminho) as armazem:
+                resultados = analisar_lote(textos, armazem=armazem)[0]
+            if reprocessar:
+                with ArmazemAnalises(caminho) as armazem:
+                    resultados = analisar_lote(textos, armazem=armazem)[0]
+            return resultados
+
+    return _executar
+
+
+def _processos(textos: List[str]) -> Resultados:
+    blocos = [textos[i:i + 64] for i in range(0, len(textos), 64)]
+    with ProcessPoolExecutor(max_workers=2) as pool:
+        return [r for parcial in pool.map(_lote, blocos) for r in parcial]
+
+
+CAMINHOS: Dict[str, Caminho] = {
+    c.nome: c
+    for c in [
+        Caminho("texto_a_texto", _texto_a_texto, otimizacao=False),
+        Caminho("lote", _lote),
+        Caminho("concatenado_buffer_pequeno", _concatenado_buffer_pequeno, otimizacao=False),
+        Caminho("documento_longo", _documento_longo, otimizacao=False, exige_busca_mesmo_tamanho=True),
+        Caminho("armazem_novo", _armazem(False), otimizacao=False),
+        Caminho("armazem_reuso", _armazem(True), otimizacao=False),  # tempo inclui a 1ª passada
+        Caminho("processos", _processos, otimizacao=False),
+    ]
+}
+
+
+# =========================
+# Comparação e minimização
+# =========================
+
+def _primeira_diferenca(ref: Dict[str, Any], alt: Dict[str, Any]) -> Optional[Tuple[str, Any, Any]]:
+    campos = ["status", "score", "total_matches", "matches", "texto_anonimizado"]
+    campos += sorted((set(ref) | set(alt)) - set(campos))
+    for campo in campos:
+        a, b = ref.get(campo), alt.get(campo)
+        if a == b:
+            continue
+        if campo == "matches" and isinstance(a, list) and isinstance(b, list):
+            for i in range(max(len(a), len(b))):
+                x = a[i] if i < len(a) else None
+                y = b[i] if i < len(b) else None
+                if x != y:
+                    return f"matches[{i}]", x, y
+        return campo, a, b
+    return None
+
+
+def _divergencia(caminho: Caminho, textos: List[str]) -> Optional[Tuple[int, str, Any, Any]]:
+    try:
+        alternativos = caminho.executar(textos)
+    except Exception as exc:  # erro no caminho também é divergência
+        return 0, "excecao", None, repr(exc)
+    if len(alternativos) != len(textos):
+        return 0, "quantidade_de_resultados", len(textos), len(alternativos)
+
+    for i, (ref, alt) in enumerate(zip(_referencia(textos), alternativos)):
+        dif = _primeira_diferenca(ref, alt)
+        if dif is not None:
+            return (i,) + dif
+    return None
+
+
+def _busca_mesmo_tamanho(texto: str) -> bool:
+    return len(normalizar_busca(texto)) == len(normalizar_raw(texto))
+
+
+def _ddmin(itens: List[Any], falha: Callable[[List[Any]], bool], orcamento: List[int]) -> List[Any]:
+    """Delta debugging: menor sublista (1-mínima) que ainda falha."""
+    n = 2
+    while len(itens) >= 2 and orcamento[0] > 0:
+        tamanho = -(-len(itens) // n)
+        partes = [itens[i:i + tamanho] for i in range(0, len(itens), tamanho)]
+        for k in range(len(partes)):
+            complemento = [x for j, p in enumerate(partes) if j != k for x in p]
+            orcamento[0] -= 1
+            if complemento and falha(complemento):
+                itens = complemento
+                n = max(n - 1, 2)
+                break
+        else:
+            if n >= len(itens):
+                break
+            n = min(2 * n, len(itens))
+    return itens
+
+
+def minimizar(caminho: Caminho, textos: List[str], max_execucoes: int = 2_000) -> List[str]:
+    orcamento = [max_execucoes]
+
+    def falha(lista: List[str]) -> bool:
+        if caminho.exige_busca_mesmo_tamanho and not all(map(_busca_mesmo_tamanho, lista)):
+            return False
+        return _divergencia(caminho, lista) is not None
+
+    textos = _ddmin(textos, falha, orcamento)
+    for i in range(len(textos)):
+        for dividir in (lambda t: re.findall(r"\S+|\s+", t), list):
+            def falha_texto(partes: List[str], i: int = i) -> bool:
+                return falha(textos[:i] + ["".join(partes)] + textos[i + 1:])
+
+            textos[i] = "".join(_ddmin(dividir(textos[i]), falha_texto, orcamento))
+    return textos
+
+
+def reportar(caminho: Caminho, textos: List[str]) -> None:
+    minimos = minimizar(caminho, textos)
+    i, campo, esperado, obtido = _divergencia(caminho, minimos)
+    print(f"\n[{caminho.nome}] DIVERGÊNCIA em {campo} (texto {i} de {len(minimos)} após minimização)")
+    print(f"  referência: {esperado!r}")
+    print(f"  {caminho.nome}: {obtido!r}")
+    print("  reprodutor:")
+    print(f"    from tools.equivalencia import CAMINHOS, _referencia")
+    print(f"    textos = {minimos!r}")
+    print(f"    assert _referencia(textos) == CAMINHOS[{caminho.nome!r}].executar(textos)")
+
+
+# =========================
+# Hashes do oráculo
+# =========================
+
+def congelar(corpus: List[str]) -> None:
+    referencia = {hash_resultado(t): hash_resultado(r) for t, r in zip(corpus, _referencia(corpus))}
+    with open(ARQUIVO_REFERENCIA, "w", encoding="utf-8") as f:
+        json.dump({"textos": len(corpus), "resultados": referencia}, f, indent=0, sort_keys=True)
+    print(f"Referência congelada: {len(referencia)} textos distintos em {ARQUIVO_REFERENCIA}")
+
+
+def conferir_referencia(corpus: List[str]) -> bool:
+    if not os.path.exists(ARQUIVO_REFERENCIA):
+        print(f"Sem {ARQUIVO_REFERENCIA}: rode com --congelar")
+        return False
+    congelado = carregar_referencia()
+
+    for texto, resultado in zip(corpus, _referencia(corpus)):
+        esperado = congelado.get(hash_resultado(texto))
+        if esperado != hash_resultado(resultado):
+            print("[referência] tools/oraculo mudou em relação aos hashes congelados")
+            print(f"  texto: {texto!r}")
+            print(f"  resultado atual: {resultado!r}")
+            print("  se a cópia foi atualizada de propósito: python -m tools.equivalencia --congelar")
+            return False
+    print(f"[referência] {len(corpus)} textos iguais aos hashes congelados")
+    return True
+
+
+# =========================
+# Vazão
+# =========================
+
+def _vazao(executar: Callable[[List[str]], Resultados], textos: List[str], rodadas: int) -> float:
+    melhor = float("inf")
+    for _ in range(rodadas):
+        inicio = time.perf_counter()
+        executar(textos)
+        melhor = min(melhor, time.perf_counter() - inicio)
+    return len(textos) / melhor
+
+
+def medir_vazao(caminhos: Sequence[Caminho], textos: List[str], rodadas: int = 3) -> Dict[str, float]:
+    """Linhas/s (melhor de `rodadas`) do oráculo, em "referencia", e de cada caminho."""
+    vazoes = {"referencia": _vazao(_referencia, textos, rodadas)}
+    for caminho in caminhos:
+        vazoes[caminho.nome] = _vazao(caminho.executar, textos, rodadas)
+    return vazoes
+
+
+def imprimir_vazao(vazoes: Dict[str, float]) -> None:
+    ref = vazoes["referencia"]
+    print(f"\n{'caminho':<28} {'linhas/s':>10} {'x ref':>7}")
+    for nome, vazao in vazoes.items():
+        print(f"{nome:<28} {vazao:>10.0f} {vazao / ref:>7.2f}")
+
+
+# =========================
+# Principal
+# =========================
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--dados", default=DADOS_PADRAO, help="glob relativo a BackEnd/")
+    parser.add_argument("--casos", type=int, default=2_000, help="textos gerados")
+    parser.add_argument("--semente", type=int, default=1)
+    parser.add_argument("--caminhos", nargs="+", choices=sorted(CAMINHOS), default=sorted(CAMINHOS))
+    parser.add_argument("--congelar", action="store_true", help="regrava o oráculo congelado e sai")
+    parser.add_argument("--vazao", action="store_true", help="imprime linhas/s de cada caminho nos CSVs")
+    parser.add_argument("--rodadas", type=int, default=3, help="melhor de N rodadas na medição de vazão")
+    args = parser.parse_args()
+
+    if indice_identificadores() is not None:
+        raise SystemExit("Desative SAFEDOC_INDICE_IDENTIFICADORES: o oráculo é congelado sem índice")
+
+    csv = carregar_textos(os.path.join(BACKEND_DIR, args.dados))
+    if args.congelar:
+        congelar(corpus_congelado(csv))
+        return 0
+
+    ok = conferir_referencia(corpus_congelado(csv))
+
+    textos = csv + gerar_textos(args.casos, args.semente)
+    caminhos = [CAMINHOS[nome] for nome in args.caminhos]
+    for caminho in caminhos:
+        entradas = textos
+        if caminho.exige_busca_mesmo_tamanho:
+            entradas = [t for t in textos if _busca_mesmo_tamanho(t)]
+
+        if _divergencia(caminho, entradas) is not None:
+            reportar(caminho, entradas)
+            ok = False
+        else:
+            ignorados = len(textos) - len(entradas)
+            extra = f" ({ignorados} ignorados: busca muda o comprimento)" if ignorados else ""
+            print(f"[{caminho.nome}] {len(entradas)} textos equivalentes{extra}")
+
+    if args.vazao:
+        imprimir_vazao(medir_vazao(caminhos, csv, args.rodadas))
+
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,349 @@
+# BackEnd/tools/loadtest.py
+"""
+Teste de carga HTTP da API (uvicorn + pydantic + JSON + CORS, não só o motor).
+
+Sobe a aplicação localmente (ou usa --url de uma já rodando), reenvia os textos
+de data/input/*.csv para /validate/text e /validate/csv e mede vazão, latência
+p50/p95/p99, taxa de erro (429 separado) e CPU/RSS do servidor.
+
+Modos:
+- fechado: --concorrencia N clientes, cada um envia a próxima requisição
+  assim que recebe a resposta;
+- aberto: --taxa R requisições/s com chegadas de Poisson, independente de
+  quanto o servidor demora (mostra fila/saturação).
+
+O relatório em JSON (--saida) permite comparar execuções entre números de
+workers e versões.
+
+Uso (a partir de BackEnd/):
+    python -m tools.loadtest --workers 2 --concorrencia 16 --duracao 30 --saida carga.json
+    python -m tools.loadtest --modo aberto --taxa 50 --endpoint csv --linhas-csv 200
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import io
+import json
+import os
+import platform
+import random
+import socket
+import statistics
+import subprocess
+import sys
+import time
+from typing import Any, Dict, List, Optional
+
+import httpx
+import pandas as pd
+
+from tools.corpus import BACKEND_DIR, DADOS_PADRAO, carregar_textos
+
+try:
+    import psutil
+except ImportError:  # opcional: sem psutil, lê /proc (Linux)
+    psutil = None
+
+
+# =========================
+# Dados
+# =========================
+
+def montar_csv(textos: List[str], linhas: int, rng: random.Random) -> bytes:
+    amostra = [rng.choice(textos) for _ in range(linhas)]
+    buf = io.StringIO()
+    pd.DataFrame({"ID": range(1, linhas + 1), "Texto Mascarado": amostra}).to_csv(buf, index=False)
+    return buf.getvalue().encode("utf-8")
+
+
+def montar_cargas(args, textos: List[str], rng: random.Random) -> List[Any]:
+    """
+    Corpos das requisições, prontos antes da carga: montar um CSV com pandas no
+    event loop do cliente entraria na latência medida e atrasaria as outras
+    requisições e as chegadas do modo aberto.
+    """
+    if args.endpoint == "text":
+        return textos
+    return [montar_csv(textos, args.linhas_csv, rng) for _ in range(args.cargas_csv)]
+
+
+# =========================
+# Servidor local
+# =========================
+
+def _porta_livre() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def subir_servidor(workers: int) -> tuple:
+    porta = _porta_livre()
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "src.main:app", "--host", "127.0.0.1",
+         "--port", str(porta), "--workers", str(workers), "--log-level", "warning"],
+        cwd=BACKEND_DIR,
+    )
+    url = f"http://127.0.0.1:{porta}"
+    limite = time.time() + 30
+    while time.time() < limite:
+        try:
+            if httpx.get(url + "/health", timeout=1).status_code == 200:
+                return proc, url
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.2)
+    proc.kill()
+    raise SystemExit("Servidor não respondeu /health em 30s")
+
+
+class MonitorRecursos:
+    """Amostra CPU (s) e RSS (bytes) do processo do servidor e descendentes."""
+
+    def __init__(self, pid: int):
+        self.pid = pid
+        self.rss_max = 0
+        self.cpu_inicio = self._cpu()
+
+    def _pids(self) -> List[int]:
+        if psutil is not None:
+            p = psutil.Process(self.pid)
+            return [self.pid] + [c.pid for c in p.children(recursive=True)]
+        filhos: Dict[int, List[int]] = {}
+        for d in os.listdir("/proc"):
+            if d.isdigit():
+                try:
+                    with open(f"/proc/{d}/stat") as f:
+                        ppid = int(f.read().rsplit(")", 1)[1].split()[1])
+                    filhos.setdefault(ppid, []).append(int(d))
+                except (OSError, IndexError, ValueError):
+                    continue
+        pids, pilha = [], [self.pid]
+        while pilha:
+            pid = pilha.pop()
+            pids.append(pid)
+            pilha.extend(filhos.get(pid, []))
+        return pids
+
+    def _cpu(self) -> float:
+        total = 0.0
+        for pid in self._pids():
+            try:
+                if psutil is not None:
+                    t = psutil.Process(pid).cpu_times()
+                    total += t.user + t.system
+                else:
+                    with open(f"/proc/{pid}/stat") as f:
+                        campos = f.read().rsplit(")", 1)[1].split()
+                    total += (int(campos[11]) + int(campos[12])) / os.sysconf("SC_CLK_TCK")
+            except (OSError, IndexError, ValueError):
+                continue
+        return total
+
+    def _rss(self) -> int:
+        total = 0
+        for pid in self._pids():
+            try:
+                if psutil is not None:
+                    total += psutil.Process(pid).memory_info().rss
+                else:
+                    with open(f"/proc/{pid}/statm") as f:
+                        total += int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+            except (OSError, IndexError, ValueError):
+                continue
+        return total
+
+    async def amostrar(self, parar: asyncio.Event, intervalo: float = 0.5) -> None:
+        while not parar.is_set():
+            self.rss_max = max(self.rss_max, self._rss())
+            try:
+                await asyncio.wait_for(parar.wait(), intervalo)
+            except asyncio.TimeoutError:
+                pass
+
+    def resumo(self, duracao: float) -> Dict[str, Any]:
+        cpu = self._cpu() - self.cpu_inicio
+        return {
+            "cpu_segundos": round(cpu, 3),
+            "cpu_nucleos_medio": round(cpu / duracao, 3) if duracao else 0.0,
+            "rss_max_mb": round(self.rss_max / 2**20, 1),
+        }
+
+
+# =========================
+# Carga
+# =========================
+
+class Coletor:
+    """
+    Só respostas 2xx entram em `latencias` (p50/p95/p99): um 429 volta em
+    milissegundos e, sob saturação, puxaria os percentis para baixo
+    justamente quando o servidor está pior. Os 429 têm latência própria.
+    """
+
+    def __init__(self) -> None:
+        self.latencias: List[float] = []
+        self.latencias_429: List[float] = []
+        self.status: Dict[str, int] = {}
+        self.erros_rede = 0
+
+    def registrar(self, latencia: float, status: Optional[int]) -> None:
+        if status is None:
+            self.erros_rede += 1
+            chave = "erro_rede"
+        else:
+            if 200 <= status < 300:
+                self.latencias.append(latencia)
+            elif status == 429:
+                self.latencias_429.append(latencia)
+            chave = str(status)
+        self.status[chave] = self.status.get(chave, 0) + 1
+
+
+async def _enviar(cliente: httpx.AsyncClient, args, cargas: List[Any], rng: random.Random, coletor: Coletor) -> None:
+    carga = rng.choice(cargas)
+    inicio = time.perf_counter()
+    try:
+        if args.endpoint == "text":
+            r = await cliente.post("/validate/text", json={"texto": carga})
+        else:
+            r = await cliente.post("/validate/csv", files={"file": ("carga.csv", carga, "text/csv")})
+        coletor.registrar(time.perf_counter() - inicio, r.status_code)
+    except httpx.HTTPError:
+        coletor.registrar(time.perf_counter() - inicio, None)
+
+
+async def executar_carga(url: str, args, textos: List[str], coletor: Coletor) -> float:
+    rng = random.Random(args.semente)
+    cargas = montar_cargas(args, textos, rng)
+    limites = httpx.Limits(max_connections=None, max_keepalive_connections=None)
+    async with httpx.AsyncClient(base_url=url, timeout=args.timeout, limits=limites) as cliente:
+        inicio = time.perf_counter()
+        fim = inicio + args.duracao
+
+        if args.modo == "fechado":
+            async def cliente_fechado() -> None:
+                while time.perf_counter() < fim:
+                    await _enviar(cliente, args, cargas, rng, coletor)
+
+            await asyncio.gather(*(cliente_fechado() for _ in range(args.concorrencia)))
+        else:
+            # chegadas em horários absolutos: um atraso do loop não empurra as
+            # seguintes, e a taxa oferecida não cai justo quando o servidor satura
+            pendentes = set()
+            proxima = inicio
+            while proxima < fim:
+                await asyncio.sleep(max(0.0, proxima - time.perf_counter()))
+                tarefa = asyncio.ensure_future(_enviar(cliente, args, cargas, rng, coletor))
+                pendentes.add(tarefa)
+                tarefa.add_done_callback(pendentes.discard)
+                proxima += rng.expovariate(args.taxa)
+            if pendentes:
+                await asyncio.gather(*pendentes)
+
+        return time.perf_counter() - inicio
+
+
+def _percentil(valores: List[float], p: float) -> float:
+    if not valores:
+        return 0.0
+    ordenados = sorted(valores)
+    k = min(len(ordenados) - 1, max(0, int(round(p / 100 * (len(ordenados) - 1)))))
+    return ordenados[k]
+
+
+def _resumo_latencias(latencias: List[float]) -> Dict[str, float]:
+    lat_ms = [x * 1000 for x in latencias]
+    return {
+        "p50": round(_percentil(lat_ms, 50), 2),
+        "p95": round(_percentil(lat_ms, 95), 2),
+        "p99": round(_percentil(lat_ms, 99), 2),
+        "media": round(statistics.fmean(lat_ms), 2) if lat_ms else 0.0,
+        "max": round(max(lat_ms), 2) if lat_ms else 0.0,
+    }
+
+
+def montar_relatorio(args, coletor: Coletor, duracao: float, recursos: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    total = sum(coletor.status.values())
+    ok = sum(n for s, n in coletor.status.items() if s.startswith("2"))
+    rejeitadas = coletor.status.get("429", 0)
+    return {
+        "config": {
+            "endpoint": args.endpoint,
+            "modo": args.modo,
+            "concorrencia": args.concorrencia if args.modo == "fechado" else None,
+            "taxa": args.taxa if args.modo == "aberto" else None,
+            "duracao_s": args.duracao,
+            "workers": args.workers if not args.url else None,
+            "linhas_csv": args.linhas_csv if args.endpoint == "csv" else None,
+            "rotulo": args.rotulo,
+        },
+        "ambiente": {"python": platform.python_version(), "cpus": os.cpu_count(), "host": platform.node()},
+        "requisicoes": total,
+        "duracao_real_s": round(duracao, 3),
+        "vazao_rps": round(ok / duracao, 2) if duracao else 0.0,
+        "taxa_erro": round((total - ok) / total, 4) if total else 0.0,
+        "rejeitadas_429": rejeitadas,
+        "status": coletor.status,
+        "latencia_ms": _resumo_latencias(coletor.latencias),  # só 2xx
+        "latencia_429_ms": _resumo_latencias(coletor.latencias_429),
+        "servidor": recursos,
+    }
+
+
+async def _principal(args) -> Dict[str, Any]:
+    textos = carregar_textos(os.path.join(BACKEND_DIR, args.dados))
+    proc = None
+    url = args.url
+    if not url:
+        proc, url = subir_servidor(args.workers)
+
+    try:
+        monitor = MonitorRecursos(proc.pid) if proc else None
+        parar = asyncio.Event()
+        amostragem = asyncio.ensure_future(monitor.amostrar(parar)) if monitor else None
+
+        coletor = Coletor()
+        duracao = await executar_carga(url, args, textos, coletor)
+
+        parar.set()
+        if amostragem:
+            await amostragem
+        recursos = monitor.resumo(duracao) if monitor else None
+        return montar_relatorio(args, coletor, duracao, recursos)
+    finally:
+        if proc:
+            proc.terminate()
+            proc.wait(timeout=10)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", help="usar servidor já rodando (não sobe uvicorn; sem CPU/RSS)")
+    parser.add_argument("--workers", type=int, default=1, help="workers do uvicorn local")
+    parser.add_argument("--endpoint", choices=["text", "csv"], default="text")
+    parser.add_argument("--modo", choices=["fechado", "aberto"], default="fechado")
+    parser.add_argument("--concorrencia", type=int, default=8, help="clientes simultâneos (modo fechado)")
+    parser.add_argument("--taxa", type=float, default=20.0, help="requisições/s (modo aberto)")
+    parser.add_argument("--duracao", type=float, default=15.0, help="segundos de carga")
+    parser.add_argument("--linhas-csv", type=int, default=100, help="linhas por upload em /validate/csv")
+    parser.add_argument("--cargas-csv", type=int, default=32, help="CSVs distintos montados antes da carga")
+    parser.add_argument("--dados", default=DADOS_PADRAO, help="glob relativo a BackEnd/")
+    parser.add_argument("--timeout", type=float, default=120.0)
+    parser.add_argument("--semente", type=int, default=0)
+    parser.add_argument("--rotulo", help="identificação livre da execução (ex.: versão)")
+    parser.add_argument("--saida", help="arquivo JSON do relatório")
+    args = parser.parse_args()
+
+    relatorio = asyncio.run(_principal(args))
+    texto = json.dumps(relatorio, ensure_ascii=False, indent=2)
+    if args.saida:
+        with open(args.saida, "w", encoding="utf-8") as f:
+            f.write(texto)
+    print(texto)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
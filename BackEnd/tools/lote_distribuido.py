@@ -0,0 +1,100 @@
+# BackEnd/tools/lote_distribuido.py
+"""
+Processamento distribuído de acervos CSV com fila de shards em diretório
+compartilhado (ver src/core/fila_shards.py).
+
+Uso (a partir de BackEnd/, com /mnt/acervo visível em todos os nós):
+    python -m tools.lote_distribuido dividir data/input/*.csv --raiz /mnt/acervo/exec1
+    python -m tools.lote_distribuido trabalhar --raiz /mnt/acervo/exec1 --processos 8   # em cada nó
+    python -m tools.lote_distribuido situacao --raiz /mnt/acervo/exec1
+    python -m tools.lote_distribuido mesclar --raiz /mnt/acervo/exec1 --saida resultados.jsonl.gz --resumo resumo.json
+
+Workers podem entrar e sair a qualquer momento; shards de um worker que morreu
+voltam para a fila quando o lease expira (--lease-s, definido no `dividir`).
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import multiprocessing
+import sys
+import time
+
+from src.core import fila_shards
+
+
+def _dividir(args: argparse.Namespace) -> int:
+    inicio = time.perf_counter()
+    try:
+        n = fila_shards.dividir(args.arquivos, args.raiz, args.linhas_por_shard, args.lease_s)
+    except ValueError as exc:
+        raise SystemExit(str(exc))
+    print(json.dumps({"shards": n, "segundos": round(time.perf_counter() - inicio, 2)}))
+    return 0
+
+
+def _trabalhar(args: argparse.Namespace) -> int:
+    inicio = time.perf_counter()
+    if args.processos <= 1:
+        processados = fila_shards.trabalhar(args.raiz, args.dono)
+    else:
+        with multiprocessing.Pool(args.processos) as pool:
+            processados = sum(pool.map(fila_shards.trabalhar, [args.raiz] * args.processos))
+    print(json.dumps({"shards_processados": processados, "segundos": round(time.perf_counter() - inicio, 2)}))
+    return 0
+
+
+def _situacao(args: argparse.Namespace) -> int:
+    print(json.dumps(fila_shards.situacao(args.raiz), ensure_ascii=False, indent=2))
+    return 0
+
+
+def _mesclar(args: argparse.Namespace) -> int:
+    try:
+        resumo = fila_shards.mesclar(args.raiz, args.saida)
+    except ValueError as exc:
+        raise SystemExit(str(exc))
+    texto = json.dumps(resumo.para_dict(args.top_motivos), ensure_ascii=False, indent=2)
+    if args.resumo:
+        with open(args.resumo, "w", encoding="utf-8") as f:
+            f.write(texto + "\n")
+    print(texto)
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    sub = parser.add_subparsers(dest="comando", required=True)
+
+    p = sub.add_parser("dividir", help="divide os CSVs em shards (coordenador)")
+    p.add_argument("arquivos", nargs="+")
+    p.add_argument("--raiz", required=True, help="diretório compartilhado da execução")
+    p.add_argument("--linhas-por-shard", type=int, default=fila_shards.LINHAS_POR_SHARD)
+    p.add_argument("--lease-s", type=float, default=fila_shards.LEASE_S, help="tempo sem heartbeat até o shard ser recuperado")
+    p.set_defaults(executar=_dividir)
+
+    p = sub.add_parser("trabalhar", help="processa shards até a fila esvaziar")
+    p.add_argument("--raiz", required=True)
+    p.add_argument("--processos", type=int, default=1, help="workers neste nó")
+    p.add_argument("--dono", help="identificação do worker (padrão: host:pid)")
+    p.set_defaults(executar=_trabalhar)
+
+    p = sub.add_parser("situacao", help="shards concluídos, em andamento, expirados e pendentes")
+    p.add_argument("--raiz", required=True)
+    p.set_defaults(executar=_situacao)
+
+    p = sub.add_parser("mesclar", help="junta resultados e resumo dos shards")
+    p.add_argument("--raiz", required=True)
+    p.add_argument("--saida", help="resultados por linha em JSON Lines (.gz comprime)")
+    p.add_argument("--resumo", help="grava o resumo agregado em JSON")
+    p.add_argument("--top-motivos", type=int, default=10)
+    p.set_defaults(executar=_mesclar)
+
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    return args.executar(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
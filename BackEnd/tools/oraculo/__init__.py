@@ -0,0 +1,15 @@
+# BackEnd/tools/oraculo/__init__.py
+"""
+Oráculo de equivalência: cópia congelada do detector de referência
+(src/core/detector.py, validators.py e config.py no commit ec80a0e, antes das
+otimizações do motor). Só os imports relativos foram ajustados.
+
+`tools.equivalencia` compara todos os caminhos do motor atual — inclusive
+`analisar_texto` — com este `analisar_texto`; `tools/referencia_detector.json`
+guarda o hash do resultado dele para cada texto do corpus fixo, então qualquer
+edição nesta cópia também é detectada. Mudança intencional de detecção no motor
+exige atualizar o oráculo junto (nova cópia + `--congelar`), no mesmo commit.
+"""
+from .detector import analisar_texto
+
+__all__ = ["analisar_texto"]
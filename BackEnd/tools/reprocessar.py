@@ -0,0 +1,63 @@
+# BackEnd/tools/reprocessar.py
+"""
+Reprocessamento incremental de acervos CSV com o armazém de análises.
+
+Só textos novos/alterados e regras cuja impressão digital mudou são varridos
+de novo (ver src/core/armazem.py); o restante vem do SQLite.
+
+Uso (a partir de BackEnd/):
+    python -m tools.reprocessar data/input/*.csv --armazem analises.sqlite --saida resultados.jsonl
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+
+import pandas as pd
+
+from src.core.armazem import ArmazemAnalises
+from src.core.config import TEXT_COLUMN_CANDIDATES
+from src.core.detector import analisar_dataframe
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("arquivos", nargs="+", help="CSVs de entrada")
+    parser.add_argument("--armazem", required=True, help="arquivo SQLite (criado se não existir)")
+    parser.add_argument("--saida", help="resultados em JSON Lines (um por linha do CSV)")
+    args = parser.parse_args()
+
+    saida = open(args.saida, "w", encoding="utf-8") if args.saida else None
+    inicio = time.perf_counter()
+    linhas = 0
+
+    with ArmazemAnalises(args.armazem) as armazem:
+        for caminho in args.arquivos:
+            df = pd.read_csv(caminho)
+            coluna = next((c for c in df.columns if c.lower() in TEXT_COLUMN_CANDIDATES), None)
+            if not coluna:
+                print(f"{caminho}: nenhuma coluna de texto encontrada", file=sys.stderr)
+                continue
+
+            for resultado in analisar_dataframe(df, coluna, armazem=armazem):
+                linhas += 1
+                if saida:
+                    saida.write(json.dumps({"arquivo": caminho, **resultado}, ensure_ascii=False, default=str) + "\n")
+
+        estatisticas = dict(armazem.estatisticas)
+
+    if saida:
+        saida.close()
+
+    print(json.dumps({
+        "linhas": linhas,
+        "segundos": round(time.perf_counter() - inicio, 3),
+        **estatisticas,
+    }, ensure_ascii=False, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
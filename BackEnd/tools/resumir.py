@@ -0,0 +1,81 @@
+# BackEnd/tools/resumir.py
+"""
+Resumo agregado de acervos CSV (mesmo conteúdo de /validate/csv/resumo).
+
+Os arquivos são lidos em blocos; cada bloco vira um `ResumoLote` parcial num
+processo do pool e os parciais são mesclados no final. A memória fica limitada
+a `--workers` blocos em andamento, qualquer que seja o tamanho do acervo.
+
+Uso (a partir de BackEnd/):
+    python -m tools.resumir data/input/*.csv
+    python -m tools.resumir corpus.csv.gz --workers 8 --bloco 20000 --saida resumo.json
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from typing import Iterator, List, Set
+
+import pandas as pd
+
+from src.core.config import LINHAS_POR_BLOCO_RESUMO, TEXT_COLUMN_CANDIDATES
+from src.core.detector import resumir_lote
+from src.core.resumo import ResumoLote
+
+
+def blocos_de_texto(arquivos: List[str], tamanho_bloco: int) -> Iterator[List[str]]:
+    for caminho in arquivos:
+        coluna = None
+        for bloco in pd.read_csv(caminho, chunksize=tamanho_bloco):
+            if coluna is None:
+                coluna = next((c for c in bloco.columns if c.lower() in TEXT_COLUMN_CANDIDATES), None)
+                if not coluna:
+                    print(f"{caminho}: nenhuma coluna de texto encontrada", file=sys.stderr)
+                    break
+            yield [str(x) for x in bloco[coluna]]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("arquivos", nargs="+", help="CSVs de entrada (.csv ou .csv.gz)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--bloco", type=int, default=LINHAS_POR_BLOCO_RESUMO, help="linhas por bloco")
+    parser.add_argument("--top-motivos", type=int, default=10)
+    parser.add_argument("--saida", help="grava o resumo em JSON (além de imprimir)")
+    args = parser.parse_args()
+
+    inicio = time.perf_counter()
+    resumo = ResumoLote()
+    pendentes: Set[Future] = set()
+
+    with ProcessPoolExecutor(max_workers=args.workers) as pool:
+        for textos in blocos_de_texto(args.arquivos, args.bloco):
+            if len(pendentes) >= args.workers:
+                prontos, pendentes = wait(pendentes, return_when=FIRST_COMPLETED)
+                for futuro in prontos:
+                    resumo.mesclar(futuro.result())
+            pendentes.add(pool.submit(resumir_lote, textos))
+
+        for futuro in pendentes:
+            resumo.mesclar(futuro.result())
+
+    duracao = time.perf_counter() - inicio
+    saida = {
+        **resumo.para_dict(args.top_motivos),
+        "segundos": round(duracao, 2),
+        "linhas_por_s": round(resumo.total / duracao, 1) if duracao else 0.0,
+    }
+    texto = json.dumps(saida, ensure_ascii=False, indent=2)
+    if args.saida:
+        with open(args.saida, "w", encoding="utf-8") as f:
+            f.write(texto + "\n")
+    print(texto)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())